@@ -9,12 +9,20 @@ Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linu
 Created: Tuesday, December 10th, 2024
 """
 from apps.sparql_app import get_answer
+from apps.solver_dispatcher import SolverDispatcher, RunningSolves
+from apps.solver_budget import load_budgets, run_with_budget
+from apps.solver_stats import labelled
+from apps.stats_overlay import StatsOverlay
+from apps.minesweeper_inference import infer
+from apps.minesweeper_probability import mine_probabilities
+from apps.minesweeper_grid import MinesweeperGrid, FLAG, HIDDEN, HINT, MINE
+from apps.minesweeper_board import MinesweeperBoard, DIFFICULTIES
+from apps.minesweeper_generator import generate_board, shared_pool
 import tkinter as tk
 from tkinter import messagebox, OptionMenu, StringVar, simpledialog
-from random import randint
 import platform
+from functools import partial
 from PIL import Image, ImageTk
-import clingo
 
 if platform.system() == "Darwin":
     from tkmacosx import Button
@@ -47,25 +55,31 @@ class MinesweeperApp:
         self.canvas.pack(fill="both", expand=True)
         self.canvas.create_image(0, 0, image=self.bg_photo, anchor="nw")
 
-        self.difficulties = {
-            "Easy": (8, 10),
-            "Medium": (10, 30),
-            "Hard": (12, 50)
-        }
+        self.difficulties = dict(DIFFICULTIES)
+        self.custom_difficulty = "Custom..."
+        self.max_size = 150
+        self.min_cell_size = 16
         self.difficulty_var = StringVar(self.root)
         self.difficulty_var.set("Easy")
-        self.grid_size, self.num_mines = self.difficulties[self.difficulty_var.get()]
+        self.rows, self.cols, self.num_mines = self.difficulties[self.difficulty_var.get()]
 
         self.game_over = False
-        self.solution = None
-        self.solution_numbers = {}
-        self.solution_mines = set()
-        self.cell_size = 40
-        self.cells = []
+        self.heatmap = False
+        self.start = None
+        self.no_guess = True
+        flag_button = "<Button-2>" if platform.system() == "Darwin" else "<Button-3>"
+        self.grid = MinesweeperGrid(self.canvas, on_click=self.cell_clicked, on_flag=self.toggle_flag, flag_button=flag_button)
         self.mines = set()
+        self.board = MinesweeperBoard(self.rows, self.cols, self.mines)
         self.revealed = set()
         self.flags = set()
-        self.asp_rules = "ASPSolvers/minesweeperSolver.lp"
+        self.running = RunningSolves()
+        self.budgets = load_budgets()
+        self.pool = shared_pool(self.budgets["generation"])
+        self.dispatcher = SolverDispatcher(self.root, on_busy=self.set_busy)
+        self.busy_label = tk.Label(self.root, text="Solving...", bg="white", fg="black")
+        self.stats_overlay = StatsOverlay(self.root)
+        self.root.bind("<F12>", lambda event: self.stats_overlay.toggle())
 
         self.create_grid()
         self.create_buttons()
@@ -75,44 +89,23 @@ class MinesweeperApp:
 
     def create_grid(self):
         """
-        Creates the game grid with buttons representing cells.
+        Creates the game grid on the canvas.
 
-        This function clears any existing grid and recreates it based on the current grid size.
+        This function redraws the grid for the current number of rows and columns. Boards whose cells are at
+        least min_cell_size pixels wide fill the usual 400 pixel square. Larger boards get smaller cells and
+        grow upwards from the bottom of that square, so that boards of 100x100 cells and more still fit
+        above the control buttons.
         """
-        for row_cells in self.cells:
-            for button in row_cells:
-                button.destroy()
-        self.cells = []
-
         grid_size = 400
-        cell_size = grid_size // self.grid_size
-        start_x = (self.width - grid_size) // 2
         start_y = (self.height - grid_size) // 2
-
-        for row in range(self.grid_size):
-            row_cells = []
-            for col in range(self.grid_size):
-                button = Button(
-                    self.root,
-                    text="",
-                    bg="lightgray",
-                    fg="black",
-                    width=40,
-                    height=40,
-                    command=lambda r=row, c=col: self.cell_clicked(r, c),
-                )
-                if platform.system() == "Darwin":
-                    button.bind("<Button-2>", lambda event, r=row, c=col: self.toggle_flag(r, c))
-                else:
-                    button.bind("<Button-3>", lambda event, r=row, c=col: self.toggle_flag(r, c))
-                button.place(
-                    x=start_x + col * cell_size,
-                    y=start_y + row * cell_size,
-                    width=cell_size,
-                    height=cell_size,
-                )
-                row_cells.append(button)
-            self.cells.append(row_cells)
+        cell_size = grid_size // max(self.rows, self.cols)
+        if cell_size >= self.min_cell_size:
+            y = start_y
+        else:
+            cell_size = max(4, min((start_y + grid_size - 20) // self.rows, (self.width - 40) // self.cols))
+            y = start_y + grid_size - cell_size * self.rows
+        x = (self.width - cell_size * self.cols) // 2
+        self.grid.resize(self.rows, self.cols, cell_size, x, y)
 
     def create_buttons(self, button_width=80, spacing=10):
         """
@@ -122,8 +115,9 @@ class MinesweeperApp:
             button_width (int): The width of each control button.
             spacing (int): The spacing between the control buttons.
         """
-        button_texts = ["Solve", "Hint", "New Game", "SPARQL?", "Back"]
-        button_commands = [self.solve, self.generate_hint_question, self.new_game, self.toggle_sparql, self.back_to_menu]
+        button_texts = ["Solve", "Hint", "Heatmap", "New Game", "SPARQL?", "Back"]
+        button_commands = [self.solve, self.generate_hint_question, self.toggle_heatmap, self.new_game, self.toggle_sparql,
+                           self.back_to_menu]
 
         button_height = 30
         grid_size = 400
@@ -144,12 +138,22 @@ class MinesweeperApp:
             Args:
                 selected (str): The selected difficulty level.
             """
+            if selected == self.custom_difficulty:
+                size = self.ask_custom_size()
+                if size is None:
+                    self.difficulty_var.set(self.current_difficulty)
+                    return
+                self.rows, self.cols, self.num_mines = size
+            else:
+                self.rows, self.cols, self.num_mines = self.difficulties[selected]
             self.difficulty_var.set(selected)
-            self.grid_size, self.num_mines = self.difficulties[self.difficulty_var.get()]
+            self.current_difficulty = selected
             self.create_grid()
             self.new_game()
 
-        difficulty_menu = OptionMenu(self.root, self.difficulty_var, *self.difficulties.keys(), command=update_difficulty)
+        self.current_difficulty = self.difficulty_var.get()
+        difficulty_menu = OptionMenu(self.root, self.difficulty_var, *self.difficulties.keys(), self.custom_difficulty,
+                                     command=update_difficulty)
         difficulty_menu.config(bg="white", fg="black")
         difficulty_menu.place(x=start_x, y=y_position + 40)
 
@@ -158,6 +162,24 @@ class MinesweeperApp:
             button = Button(self.root, text=text, command=command, bg="white", fg="black")
             button.place(x=x_position, y=y_position, width=button_width, height=button_height)
 
+    def ask_custom_size(self):
+        """
+        Ask the user for the size and the number of mines of a custom board.
+
+        Returns:
+            tuple: The number of rows, columns and mines, or None if the user cancelled.
+        """
+        rows = simpledialog.askinteger("Custom Board", f"Rows (5-{self.max_size}):", minvalue=5, maxvalue=self.max_size)
+        if rows is None:
+            return None
+        cols = simpledialog.askinteger("Custom Board", f"Columns (5-{self.max_size}):", minvalue=5, maxvalue=self.max_size)
+        if cols is None:
+            return None
+        mines = simpledialog.askinteger("Custom Board", f"Mines (1-{rows * cols - 9}):", minvalue=1, maxvalue=rows * cols - 9)
+        if mines is None:
+            return None
+        return rows, cols, mines
+
     def toggle_sparql(self):
             """
             Toggle the use of SPARQL queries.
@@ -169,37 +191,71 @@ class MinesweeperApp:
             status = "ON" if self.use_sparql_queries else "OFF"
             messagebox.showinfo("SPARQL Toggle", f"SPARQL queries are now {status}.")
 
-    def solve_board(self):
+    def revealed_numbers(self):
         """
-        Solves the entire board using Answer Set Programming (ASP) when starting a new game.
+        Get what the player can see of the board.
+
+        Returns:
+            dict: The number of adjacent mines of every revealed cell, by (row, col).
         """
-        facts = []
-        facts.append(f"#const r={self.grid_size}.")
-        facts.append(f"#const c={self.grid_size}.")
+        return {(row, col): self.board.count(row, col) for row, col in self.revealed}
 
-        for row, col in self.mines:
-            facts.append(f"mine({col},{row}).")
+    def run_inference(self, operation, on_done):
+        """
+        Deduce the provably safe cells and mines from the revealed numbers on the solver dispatcher.
 
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                if (row, col) not in self.mines:
-                    count = self.count_adjacent_mines(row, col)
-                    facts.append(f"number({col},{row},{count}).")
+        Only the revealed numbers and the number of mines are passed to the solver, never the
+        positions of the mines.
 
-        solutions = self.asp_solver("\n".join(facts))
+        Args:
+            operation (str): The budget of the solve, "hint" or "solve".
+            on_done (callable): Called on the main thread with the SolveOutcome of the inference.
+        """
+        self.dispatcher.submit(run_with_budget, self.budgets[operation], partial(labelled, operation, partial(infer, running=self.running)),
+                               self.rows, self.cols, self.revealed_numbers(), self.num_mines,
+                               on_done=on_done,
+                               on_error=lambda err: messagebox.showerror("Error", f"ASP Solver error: {str(err)}"),
+                               interrupt=self.running.cancel)
 
-        if solutions and solutions[0]:
-            self.solution = solutions[0]
-            self.solution_mines = set()
-            self.solution_numbers = {}
+    def run_probabilities(self, on_done):
+        """
+        Compute the mine probability of every hidden cell on the solver dispatcher.
+
+        Args:
+            on_done (callable): Called on the main thread with the SolveOutcome of the computation.
+        """
+        self.dispatcher.submit(run_with_budget, self.budgets["hint"], partial(labelled, "probabilities", mine_probabilities),
+                               self.rows, self.cols, self.revealed_numbers(), self.num_mines,
+                               on_done=on_done,
+                               on_error=lambda err: messagebox.showerror("Error", f"Probability error: {str(err)}"))
+
+    def toggle_heatmap(self):
+        """
+        Toggle the heatmap of mine probabilities over the hidden cells.
+        """
+        self.heatmap = not self.heatmap
+        self.update_heatmap()
+
+    def update_heatmap(self):
+        """
+        Recompute the heatmap for the current board, or remove it if it is turned off or the game is over.
+        """
+        self.grid.clear_heatmap()
+        if self.heatmap and not self.game_over:
+            self.run_probabilities(self.show_heatmap)
+
+    def show_heatmap(self, outcome):
+        """
+        Draw the heatmap of a probability computation.
 
-            for symbol in self.solution:
-                if str(symbol.name) == "mine":
-                    col, row = symbol.arguments
-                    self.solution_mines.add((row.number, col.number))
-                elif str(symbol.name) == "number":
-                    col, row, num = symbol.arguments
-                    self.solution_numbers[(row.number, col.number)] = num.number
+        Args:
+            outcome (SolveOutcome): The outcome of the computation.
+        """
+        if outcome.unknown:
+            messagebox.showwarning("Heatmap", f"{outcome.describe()} No heatmap is available.")
+            return
+        if outcome.value is not None and self.heatmap and not self.game_over:
+            self.grid.show_heatmap({cell: p for cell, p in outcome.value.cells().items() if cell not in self.flags})
 
     def cell_clicked(self, row, col):
         """
@@ -211,60 +267,87 @@ class MinesweeperApp:
         """
         if self.game_over or (row, col) in self.flags:
             return
+        if not self.revealed and (row, col) != self.start:
+            self.dispatcher.submit(labelled, "generation", generate_board, self.rows, self.cols, self.num_mines, (row, col), None, 200,
+                                   self.budgets["generation"], on_done=self.start_game, heavy=True)
+            return
         if (row, col) in self.mines:
             self.reveal_mines()
             messagebox.showerror("Game Over", "You clicked on a mine!")
             self.game_over = True
         else:
             self.reveal_cell(row, col)
-            if len(self.revealed) == self.grid_size * self.grid_size - self.num_mines:
-                messagebox.showinfo("Congratulations", "You won!")
-                self.game_over = True
+            self.check_win()
         if self.game_over:
-            self.reveal_mines()
-            for pos, num in self.solution_numbers.items():
-                row, col = pos
-                self.reveal_cell(row, col)
+            self.reveal_board()
+        self.update_heatmap()
 
-    def reveal_cell(self, row, col):
+    def set_board(self, board):
         """
-        Reveals a cell by updating its state and displaying the adjacent mine count.
+        Place the mines of a generated board and highlight its start cell. If the generator could
+        not find a board that can be solved without guessing, the window title tells the player.
 
         Args:
-            row (int): The row index of the cell.
-            col (int): The column index of the cell.
+            board (tuple): The set of mines, the start cell and whether the board can be solved
+                without guessing, as returned by generate_board.
         """
-        if (row, col) in self.revealed:
-            return
-        self.revealed.add((row, col))
-        self.cells[row][col].config(state="disabled", bg="lightgray")
-        mine_count = self.count_adjacent_mines(row, col)
-        if mine_count > 0:
-            self.cells[row][col].config(text=str(mine_count), bg="lightgray")
-        else:
-            for r in range(max(0, row - 1), min(self.grid_size, row + 2)):
-                for c in range(max(0, col - 1), min(self.grid_size, col + 2)):
-                    if (r, c) != (row, col):
-                        self.reveal_cell(r, c)
-                        self.cells[row][col].config(bg="lightgray")
+        mines, start, self.no_guess = board
+        self.root.title("Minesweeper Game" if self.no_guess else "Minesweeper Game (this board may need a guess)")
+        if self.start is not None:
+            self.grid.set_tile(*self.start, HIDDEN)
+        self.mines = set(mines)
+        self.board = MinesweeperBoard(self.rows, self.cols, self.mines)
+        self.start = start
+        self.grid.set_tile(*start, HINT)
+        self.update_heatmap()
 
-    def count_adjacent_mines(self, row, col):
+    def start_game(self, board):
+        """
+        Start the game on a board generated around the first click, and reveal that cell.
+
+        Args:
+            board (tuple): The board generated by generate_board.
+        """
+        self.set_board(board)
+        self.cell_clicked(*self.start)
+
+    def check_win(self):
+        """
+        End the game with a congratulatory message once every safe cell is revealed.
+        """
+        if not self.game_over and len(self.revealed) == self.rows * self.cols - self.num_mines:
+            messagebox.showinfo("Congratulations", "You won!")
+            self.game_over = True
+
+    def reveal_board(self):
+        """
+        Show the whole board at the end of a game: every mine and the number of every safe cell.
+        """
+        self.reveal_mines()
+        for row in range(self.rows):
+            for col in range(self.cols):
+                if (row, col) not in self.mines and (row, col) not in self.revealed:
+                    self.revealed.add((row, col))
+                    self.grid.set_tile(row, col, str(self.board.count(row, col)))
+
+    def reveal_cell(self, row, col):
         """
-        Counts the number of adjacent mines for a given cell.
+        Reveals a cell by updating its state and displaying the adjacent mine count.
+
+        If the cell has no adjacent mines, its neighbours are revealed as well. The flood fill is
+        done by the board, and all newly revealed cells are drawn in one batch.
 
         Args:
             row (int): The row index of the cell.
             col (int): The column index of the cell.
 
         Returns:
-            int: The number of adjacent mines.
+            set: The cells that were newly revealed.
         """
-        count = 0
-        for r in range(max(0, row - 1), min(self.grid_size, row + 2)):
-            for c in range(max(0, col - 1), min(self.grid_size, col + 2)):
-                if (r, c) in self.mines:
-                    count += 1
-        return count
+        new = self.board.reveal(row, col, self.revealed)
+        for r, c in new:
+            self.grid.set_tile(r, c, str(self.board.count(r, c)))
+        return new
 
     def toggle_flag(self, row, col):
         """
@@ -278,77 +361,36 @@ class MinesweeperApp:
             return
         if (row, col) in self.flags:
             self.flags.remove((row, col))
-            self.cells[row][col].config(text="", bg="gray")
+            self.grid.set_tile(row, col, HIDDEN)
         else:
             self.flags.add((row, col))
-            self.cells[row][col].config(text="F", bg="red")
+            self.grid.set_tile(row, col, FLAG)
 
     def reveal_mines(self):
         """
         Reveal all mines on the grid.
 
         This method iterates through all the mine locations and updates the 
-        corresponding grid cells to display a mine symbol ('M') with a red background.
+        corresponding grid cells to display the mine tile.
         """
         for mine in self.mines:
-            self.cells[mine[0]][mine[1]].config(text="M", bg="red")
+            self.grid.set_tile(mine[0], mine[1], MINE)
 
-    def asp_solver(self, facts):
+    def set_busy(self, busy):
         """
-        Solve the Minesweeper puzzle using the Clingo ASP solver.
-
-        This method creates a Clingo control object, loads the ASP program and facts,
-        grounds the program, and solves it. The solutions are then returned ad a list of symbols.
+        Show or hide the busy indicator while the solver dispatcher is running a job.
 
         Args:
-            facts (str): The facts representing the current game state.
-
-        Returns:
-            list: A list of solutions provided by the ASP solver.
-        """
-        try:
-            ctl = clingo.Control()
-
-            with open(self.asp_rules, 'r', encoding='utf-8') as f:
-                program = f.read()
-
-            ctl.add("base", [], program)
-            ctl.add("base", [], facts)
-
-            ctl.ground([("base", [])])
-            solutions = []
-
-            def on_model(model):
-                solutions.append(model.symbols(shown=True))
-
-            ctl.solve(on_model=on_model)
-            return solutions
-
-        except Exception as e:
-            messagebox.showerror("Error", f"ASP Solver error: {str(e)}")
-            return []
-
-    def get_current_facts(self):
+            busy (bool): True while a job is running.
         """
-        Generate facts representing the current game state.
-
-        This method creates a list of facts based on the current state of the game,
-        including the grid size and the numbers revealed on the grid.
-
-        Returns:
-            str: A string containing the facts for the current game state.
-        """
-        facts = []
-        facts.append(f"#const r={self.grid_size}.")
-        facts.append(f"#const c={self.grid_size}.")
-
-        for cell in self.revealed:
-            row, col = cell
-            count = self.count_adjacent_mines(row, col)
-            facts.append(f"number({col},{row},{count}).")
+        if busy:
+            grid_size = 400
+            self.busy_label.place(x=(self.width - grid_size) // 2, y=(self.height - grid_size) // 2 - 30)
+            self.root.config(cursor="watch")
+        else:
+            self.busy_label.place_forget()
+            self.root.config(cursor="")
 
-        return "\n".join(facts)
-    
     def generate_hint_question(self):
             """
             Provides a hint to the user by asking a question from the YAGO knowledge base.
@@ -390,63 +432,130 @@ class MinesweeperApp:
         """
         Provide a hint for the next safe move.
 
-        This method highlights the next safe cell to reveal based on the stored solution.
-        If no solution is available or no safe moves are left, it shows a message indicating that no more moves are available.
+        The ASP inference engine deduces the cells that are provably safe from the revealed numbers,
+        and one of them is highlighted by show_hint.
         """
-        if not self.solution:
-            messagebox.showinfo("Hint", "No solution available!")
+        if self.game_over:
+            return
+        if not self.revealed and self.start is not None:
+            self.grid.set_tile(*self.start, HINT)
             return
+        self.run_inference("hint", self.show_hint)
 
-        for pos, num in self.solution_numbers.items():
-            if pos not in self.revealed and pos not in self.mines:
-                row, col = pos
-                self.cells[row][col].config(bg="lightgreen")
-                return
+    def show_hint(self, outcome):
+        """
+        Highlight a provably safe cell, or tell the user that none can be deduced.
+
+        Args:
+            outcome (SolveOutcome): The outcome of the inference.
+        """
+        if outcome.unknown:
+            messagebox.showwarning("Hint", f"{outcome.describe()} No hint is available.")
+            return
+        if outcome.value is None:
+            messagebox.showinfo("Hint", "The revealed numbers contradict each other!")
+            return
+        safe = sorted(outcome.value.safe - self.revealed - self.flags)
+        if not safe:
+            self.run_probabilities(self.show_guess)
+            return
+        row, col = safe[0]
+        self.grid.set_tile(row, col, HINT)
 
-        messagebox.showinfo("Hint", "No more safe moves available!")
+    def show_guess(self, outcome):
+        """
+        Highlight the hidden cell that is least likely to be a mine, when no cell is provably safe.
+
+        Args:
+            outcome (SolveOutcome): The outcome of the probability computation.
+        """
+        if outcome.unknown:
+            messagebox.showwarning("Hint", f"{outcome.describe()} No hint is available.")
+            return
+        guess = outcome.value.safest(exclude=self.flags) if outcome.value is not None else None
+        if guess is None:
+            messagebox.showinfo("Hint", "No more safe moves available!")
+            return
+        (row, col), probability = guess
+        self.grid.set_tile(row, col, HINT)
+        messagebox.showinfo("Hint", f"No cell is provably safe. The highlighted cell is the safest guess, "
+                                    f"with a {probability:.0%} chance of being a mine.")
 
     def solve(self):
         """
-        Reveal all safe cells and flag all mines using the stored solution.
+        Solve as much of the board as can be deduced from the revealed numbers.
 
-        This method uses the stored solution to place flags on all mines and reveal all safe cells.
-        If no solution is available, it shows a message saying that. If the game is solved, it shows a congratulatory message.
+        This method flags every provably mined cell and reveals every provably safe cell, then runs
+        the inference again on the new numbers until nothing more can be deduced. Cells that are
+        still hidden after that can only be opened by guessing.
         """
-        if not self.solution:
-            messagebox.showinfo("Solver", "No solution available!")
+        if self.game_over:
             return
+        self.run_inference("solve", self.apply_inference)
 
-        for row, col in self.solution_mines:
-            if (row, col) not in self.flags:
-                self.flags.add((row, col))
-                self.cells[row][col].config(text="F", bg="red")
+    def apply_inference(self, outcome):
+        """
+        Flag the provably mined cells and reveal the provably safe cells of an inference, and
+        continue solving while that makes progress.
 
-        for pos, num in self.solution_numbers.items():
-            row, col = pos
+        Args:
+            outcome (SolveOutcome): The outcome of the inference.
+        """
+        if outcome.unknown:
+            messagebox.showwarning("Solver", f"{outcome.describe()} The board is only partly solved.")
+            return
+        if outcome.value is None:
+            messagebox.showinfo("Solver", "The revealed numbers contradict each other!")
+            return
+
+        for row, col in outcome.value.mines - self.flags:
+            self.flags.add((row, col))
+            self.grid.set_tile(row, col, FLAG)
+
+        safe = outcome.value.safe - self.revealed
+        for row, col in safe:
+            self.flags.discard((row, col))
             self.reveal_cell(row, col)
+        self.check_win()
+
+        if self.game_over:
+            self.update_heatmap()
+            return
+        if safe:
+            self.solve()
+        else:
+            self.update_heatmap()
+            messagebox.showinfo("Solver", "No cell is provably safe, the rest of the board needs a guess!")
 
     def new_game(self):
         """
         Start a new game.
 
-        This method resets the game state, clears the grid, places new mines, and solves the board.
+        This method resets the game state and clears the grid. The mines come from a board that the
+        background pool has already generated for this board size. If none is ready, a board is
+        generated on the solver dispatcher. Either way the start cell is highlighted, and a first click
+        there opens an empty region. The board can usually be solved from there without guessing. If
+        the generator ran out of attempts before it found such a board, which happens mostly on dense
+        boards, the window title says that the board may need a guess.
+        A first click anywhere else generates a new board around that cell.
         """
         self.mines = set()
         self.revealed = set()
         self.flags = set()
-        self.solution = None
-        self.solution_numbers = {}
-        self.solution_mines = set()
         self.game_over = False
+        self.start = None
+        self.board = MinesweeperBoard(self.rows, self.cols, self.mines)
 
-        for row in range(self.grid_size):
-            for col in range(self.grid_size):
-                self.cells[row][col].config(text="", state="normal", bg="gray")
-
-        while len(self.mines) < self.num_mines:
-            self.mines.add((randint(0, self.grid_size - 1), randint(0, self.grid_size - 1)))
+        self.dispatcher.cancel()
+        self.grid.reset()
+        self.grid.clear_heatmap()
 
-        self.solve_board()
+        board = self.pool.take(self.rows, self.cols, self.num_mines)
+        if board is None:
+            self.dispatcher.submit(labelled, "generation", generate_board, self.rows, self.cols, self.num_mines, None, None, 200,
+                                   self.budgets["generation"], on_done=self.set_board, heavy=True)
+        else:
+            self.set_board(board)
 
     def reset(self):
         """
@@ -463,6 +572,10 @@ class MinesweeperApp:
         This method destroys the current game widgets and initializes the main menu.
         """
         from main import MainMenu
+        self.dispatcher.shutdown()
+        self.stats_overlay.hide()
+        self.root.unbind("<F12>")
+        self.root.config(cursor="")
         for widget in self.root.winfo_children():
             widget.destroy()
         MainMenu(self.root)
@@ -0,0 +1,155 @@
+"""
+Minesweeper Board
+=================
+
+This module holds the game logic of a Minesweeper board without any tkinter code, so that it can
+be used by the app, the solvers and the tests alike.
+
+The number of adjacent mines of every cell is computed once per game as a NumPy array: the mine
+mask is padded with a border of zeros and its nine shifted copies are summed, which is a 3x3
+convolution with a kernel of ones. Revealing a cell is an iterative breadth-first flood fill that
+returns the newly revealed cells, so the UI can draw them in one batch.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+from collections import deque
+import random
+import numpy as np
+
+OFFSETS = [(d_row, d_col) for d_row in (-1, 0, 1) for d_col in (-1, 0, 1)]
+
+DIFFICULTIES = {
+    "Easy": (8, 8, 10),
+    "Medium": (10, 10, 30),
+    "Hard": (12, 12, 50),
+}
+
+
+def neighbor_counts(mask):
+    """
+    Count the mines in the 3x3 neighbourhood of every cell.
+
+    Args:
+        mask (numpy.ndarray): A rows x cols array that is 1 (or True) for every mine.
+
+    Returns:
+        numpy.ndarray: A rows x cols integer array with the number of mines around every cell. A
+        mine counts itself, which does not matter since the number of a mine is never shown.
+    """
+    rows, cols = mask.shape
+    padded = np.pad(mask.astype(np.int8), 1)
+    counts = np.zeros((rows, cols), dtype=np.int8)
+    for d_row, d_col in OFFSETS:
+        counts += padded[1 + d_row:1 + d_row + rows, 1 + d_col:1 + d_col + cols]
+    return counts
+
+
+def random_mines(rows, cols, num_mines, rng=random):
+    """
+    Pick random mine positions.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        num_mines (int): The number of mines.
+        rng (random.Random): The random generator.
+
+    Returns:
+        set: The (row, col) of every mine.
+    """
+    return {divmod(index, cols) for index in rng.sample(range(rows * cols), num_mines)}
+
+
+class MinesweeperBoard:
+    """
+    MinesweeperBoard Class
+    ----------------------
+    The mines of a Minesweeper game together with the precomputed number of adjacent mines of
+    every cell.
+    """
+
+    def __init__(self, rows, cols, mines):
+        """
+        Initializes the board and counts the adjacent mines of every cell.
+
+        Args:
+            rows (int): The number of rows of the board.
+            cols (int): The number of columns of the board.
+            mines (iterable): The (row, col) of every mine.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.mines = set(mines)
+        self.mask = np.zeros((rows, cols), dtype=bool)
+        for row, col in self.mines:
+            self.mask[row, col] = True
+        self.counts = neighbor_counts(self.mask)
+
+    def count(self, row, col):
+        """
+        Get the number of adjacent mines of a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            int: The number of adjacent mines.
+        """
+        return int(self.counts[row, col])
+
+    def neighbors(self, row, col):
+        """
+        Get the cells around a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            list: The (row, col) of every neighbour within the board, without the cell itself.
+        """
+        return [(row + d_row, col + d_col) for d_row, d_col in OFFSETS
+                if (d_row or d_col) and 0 <= row + d_row < self.rows and 0 <= col + d_col < self.cols]
+
+    def reveal(self, row, col, revealed):
+        """
+        Reveal a cell. If it has no adjacent mines, its neighbours are revealed as well, breadth
+        first, until the whole empty region and its border are revealed.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            revealed (set): The cells that are already revealed. The newly revealed cells are added.
+
+        Returns:
+            set: The cells that were newly revealed.
+        """
+        if (row, col) in revealed:
+            return set()
+        new = {(row, col)}
+        revealed.add((row, col))
+        queue = deque([(row, col)])
+        while queue:
+            row, col = queue.popleft()
+            if self.counts[row, col]:
+                continue
+            for cell in self.neighbors(row, col):
+                if cell not in revealed:
+                    revealed.add(cell)
+                    new.add(cell)
+                    queue.append(cell)
+        return new
+
+    def number_facts(self, cells):
+        """
+        Get the ASP facts of the numbers of some cells.
+
+        Args:
+            cells (iterable): The (row, col) of the cells.
+
+        Returns:
+            list: A number(col,row,count) fact for every cell.
+        """
+        return [f"number({col},{row},{self.counts[row, col]})." for row, col in cells]
@@ -0,0 +1,313 @@
+"""
+Minesweeper Generator
+=====================
+
+This module generates Minesweeper boards that can be solved without guessing. Every board has a
+start cell, and no mine is placed in the 3x3 safe zone around it, so the first click always opens
+an empty region. A candidate board is only kept if it can be played from the start cell to the
+end by logical inference alone: simple single-number deductions first, and the frontier ASP
+inference of apps/minesweeper_inference.py whenever those get stuck.
+
+Checking a candidate plays a whole game, so boards are generated in a background process pool.
+The BoardPool keeps a ready queue of boards per board size and number of mines and refills it
+whenever a board is taken.
+
+The check is random, so it can fail: on dense boards few candidates pass within the attempts. Then
+the last candidate is used, flagged as a board that may need a guess. The pool hands out the
+boards that passed first, and the game tells the player when a board may need a guess.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import multiprocessing
+import os
+import random
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from apps.minesweeper_board import MinesweeperBoard
+from apps.minesweeper_inference import infer
+from apps.solver_budget import BudgetExceeded
+from apps.solver_stats import labelled
+
+_SHARED = None
+_SHARED_LOCK = threading.Lock()
+
+
+def safe_zone(rows, cols, row, col):
+    """
+    Get the cells that must not hold a mine when the game starts at a cell.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        row (int): The row index of the start cell.
+        col (int): The column index of the start cell.
+
+    Returns:
+        set: The start cell and its neighbours.
+    """
+    return {(r, c) for r in range(max(0, row - 1), min(rows, row + 2)) for c in range(max(0, col - 1), min(cols, col + 2))}
+
+
+def simple_deductions(board, revealed, known_mines):
+    """
+    Apply the single-number rules until they find nothing new: a number whose mines are all known
+    makes its other hidden neighbours safe, and a number with as many hidden neighbours as missing
+    mines makes them all mines.
+
+    Args:
+        board (MinesweeperBoard): The board. Only the numbers of revealed cells are read.
+        revealed (set): The revealed cells.
+        known_mines (set): The cells known to be mines. The newly deduced mines are added.
+
+    Returns:
+        set: The hidden cells deduced to be safe.
+    """
+    safe = set()
+    changed = True
+    while changed:
+        changed = False
+        for row, col in revealed:
+            count = board.count(row, col)
+            hidden = [cell for cell in board.neighbors(row, col) if cell not in revealed and cell not in safe]
+            unknown = [cell for cell in hidden if cell not in known_mines]
+            if not unknown:
+                continue
+            missing = count - (len(hidden) - len(unknown))
+            if missing == 0:
+                safe.update(unknown)
+                changed = True
+            elif missing == len(unknown):
+                known_mines.update(unknown)
+                changed = True
+    return safe
+
+
+def solve_logically(board, start, budget=None):
+    """
+    Play a board from its start cell, revealing only cells that are provably safe.
+
+    Args:
+        board (MinesweeperBoard): The board.
+        start (tuple): The (row, col) of the first click.
+        budget (SolveBudget): The time and conflict limits of every ASP inference, None for no limit.
+
+    Returns:
+        set: The cells revealed once nothing more can be deduced.
+
+    Raises:
+        BudgetExceeded: If an ASP inference ran out of budget.
+    """
+    revealed = set()
+    known_mines = set()
+    board.reveal(*start, revealed)
+    while len(revealed) < board.rows * board.cols - len(board.mines):
+        safe = simple_deductions(board, revealed, known_mines)
+        if not safe:
+            numbers = {cell: board.count(*cell) for cell in revealed}
+            inference = infer(board.rows, board.cols, numbers, len(board.mines), budget=budget)
+            if inference is None:
+                break
+            known_mines.update(inference.mines)
+            safe = inference.safe - revealed
+        if not safe:
+            break
+        for cell in safe:
+            board.reveal(*cell, revealed)
+    return revealed
+
+
+def is_no_guess(rows, cols, mines, start, budget=None):
+    """
+    Check whether a board can be solved from its start cell without guessing.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        mines (set): The (row, col) of every mine.
+        start (tuple): The (row, col) of the first click.
+        budget (SolveBudget): The time and conflict limits of every ASP inference, None for no limit.
+
+    Returns:
+        bool: True if every safe cell can be revealed by inference alone.
+
+    Raises:
+        BudgetExceeded: If an ASP inference ran out of budget.
+    """
+    board = MinesweeperBoard(rows, cols, mines)
+    return len(solve_logically(board, start, budget)) == rows * cols - len(mines)
+
+
+def random_board(rows, cols, num_mines, start, rng=random):
+    """
+    Place mines at random outside the safe zone of a start cell.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        num_mines (int): The number of mines.
+        start (tuple): The (row, col) of the first click.
+        rng (random.Random): The random generator.
+
+    Returns:
+        set: The (row, col) of every mine.
+
+    Raises:
+        ValueError: If the mines do not fit outside the safe zone.
+    """
+    zone = safe_zone(rows, cols, *start)
+    allowed = [(row, col) for row in range(rows) for col in range(cols) if (row, col) not in zone]
+    if num_mines > len(allowed):
+        raise ValueError(f"{num_mines} mines do not fit outside the safe zone of a {rows}x{cols} board")
+    return set(rng.sample(allowed, num_mines))
+
+
+def generate_board(rows, cols, num_mines, start=None, seed=None, attempts=200, budget=None):
+    """
+    Generate a board with a safe zone around the start cell that can be solved without guessing.
+
+    This is a module-level function so that it can be run in a worker process.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        num_mines (int): The number of mines.
+        start (tuple): The (row, col) of the first click, None to pick a random start cell.
+        seed (int): The seed of the random number generator, for reproducible boards.
+        attempts (int): The number of candidate boards to check before giving up.
+        budget (SolveBudget): The time and conflict limits of every ASP inference, None for no limit.
+            A candidate whose check runs out of budget is rejected.
+
+    Returns:
+        tuple: The set of mines, the start cell and whether the board can be solved without
+        guessing. If no candidate passed the check, the last candidate is returned, which still
+        has the safe zone.
+
+    Raises:
+        ValueError: If the mines do not fit outside the safe zone.
+    """
+    rng = random.Random(seed)
+    if start is None:
+        start = (rng.randrange(rows), rng.randrange(cols))
+    mines = set()
+    for _ in range(max(1, attempts)):
+        mines = random_board(rows, cols, num_mines, start, rng)
+        try:
+            if is_no_guess(rows, cols, mines, start, budget):
+                return mines, start, True
+        except BudgetExceeded:
+            continue
+    return mines, start, False
+
+
+class BoardPool:
+    """
+    BoardPool Class
+    ---------------
+    Generates boards in background worker processes and keeps a ready queue of them per board
+    size and number of mines. All methods are thread-safe.
+    """
+
+    def __init__(self, size=2, workers=None, attempts=200, budget=None):
+        """
+        Initializes the pool. The worker processes are only started for the first board.
+
+        Args:
+            size (int): The number of boards kept ready for every board size and number of mines.
+            workers (int): The number of worker processes, None for half of the CPUs.
+            attempts (int): The number of candidates every worker checks per board.
+            budget (SolveBudget): The time and conflict limits of every ASP inference of a check.
+        """
+        self.size = size
+        self.workers = workers or max(1, (os.cpu_count() or 2) // 2)
+        self.attempts = attempts
+        self.budget = budget
+        self.executor = None
+        self.ready = {}
+        self.pending = {}
+        self.lock = threading.Lock()
+
+    def take(self, rows, cols, num_mines):
+        """
+        Take a ready board and start generating its replacement. Boards that can be solved without
+        guessing are handed out before the ones that may need a guess.
+
+        Args:
+            rows (int): The number of rows of the board.
+            cols (int): The number of columns of the board.
+            num_mines (int): The number of mines.
+
+        Returns:
+            tuple: The set of mines, the start cell and whether the board can be solved without
+            guessing, or None if no board of this kind is ready yet.
+        """
+        key = (rows, cols, num_mines)
+        with self.lock:
+            ready = self.ready.get(key)
+            board = ready.popleft() if ready else None
+        self.fill(rows, cols, num_mines)
+        return board
+
+    def fill(self, rows, cols, num_mines):
+        """
+        Start generating boards of a kind until its ready queue is full.
+
+        Args:
+            rows (int): The number of rows of the board.
+            cols (int): The number of columns of the board.
+            num_mines (int): The number of mines.
+        """
+        key = (rows, cols, num_mines)
+        with self.lock:
+            if self.executor is None:
+                self.executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+            ready = self.ready.setdefault(key, deque())
+            while len(ready) + self.pending.get(key, 0) < self.size:
+                self.pending[key] = self.pending.get(key, 0) + 1
+                future = self.executor.submit(labelled, "generation", generate_board, rows, cols, num_mines, None, None, self.attempts, self.budget)
+                future.add_done_callback(lambda future, key=key: self._done(key, future))
+
+    def _done(self, key, future):
+        """
+        Put a generated board into its ready queue, in front of the boards that may need a guess if
+        it can be solved without guessing.
+        """
+        with self.lock:
+            self.pending[key] -= 1
+            if not future.cancelled() and future.exception() is None:
+                board = future.result()
+                if board[2]:
+                    self.ready[key].appendleft(board)
+                else:
+                    self.ready[key].append(board)
+
+    def shutdown(self):
+        """
+        Stop the worker processes and drop the boards that are still being generated.
+        """
+        with self.lock:
+            if self.executor is not None:
+                self.executor.shutdown(wait=False, cancel_futures=True)
+                self.executor = None
+
+
+def shared_pool(budget=None):
+    """
+    Get the board pool of this process, creating it on first use.
+
+    The pool outlives the game window, so that boards generated while one game is open are still
+    ready when the next one starts.
+
+    Args:
+        budget (SolveBudget): The time and conflict limits of every ASP inference of a check, used
+            when the pool is created.
+
+    Returns:
+        BoardPool: The shared pool.
+    """
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = BoardPool(budget=budget)
+        return _SHARED
@@ -0,0 +1,166 @@
+"""
+Minesweeper Inference
+=====================
+
+This module deduces which hidden cells of a Minesweeper game are provably safe and which are
+provably mines, using only the numbers the player has revealed. The true mine positions are never
+passed to the solver, so a hint is exactly what a perfect player could work out on their own.
+
+Only the frontier is encoded: the hidden cells next to a revealed number, together with the
+numbers next to them. Cells deep inside the revealed area or the hidden area do not appear in the
+program, which keeps grounding small even late in a game on a large board. The encoding in
+ASPSolvers/minesweeperFrontier.lp is solved with Clingo's cautious enumeration mode, so the last
+model holds the consequences shared by every answer set.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import clingo
+from apps.solver_budget import configure, wait
+from apps.solver_dispatcher import RunningSolves
+from apps.solver_service import program_text
+from apps.solver_stats import SolverCall
+
+FRONTIER_PROGRAM = "ASPSolvers/minesweeperFrontier.lp"
+
+
+def neighbors(rows, cols, row, col):
+    """
+    Get the cells around a cell.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        row (int): The row index of the cell.
+        col (int): The column index of the cell.
+
+    Returns:
+        list: The (row, col) of every neighbour within the board, without the cell itself.
+    """
+    return [(r, c) for r in range(max(0, row - 1), min(rows, row + 2))
+            for c in range(max(0, col - 1), min(cols, col + 2)) if (r, c) != (row, col)]
+
+
+def frontier(rows, cols, numbers):
+    """
+    Find the frontier of a game.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        numbers (dict): The number of adjacent mines of every revealed cell, by (row, col).
+
+    Returns:
+        tuple: The clues, a dict of the revealed numbers next to at least one hidden cell, and
+        the set of hidden cells next to at least one revealed number.
+    """
+    clues = {}
+    cells = set()
+    for (row, col), count in numbers.items():
+        hidden = [cell for cell in neighbors(rows, cols, row, col) if cell not in numbers]
+        if hidden:
+            clues[(row, col)] = count
+            cells.update(hidden)
+    return clues, cells
+
+
+def frontier_facts(clues, cells, num_mines=None, interior=0):
+    """
+    Get the ASP facts of the frontier of a game.
+
+    Args:
+        clues (dict): The revealed numbers next to the frontier, by (row, col).
+        cells (set): The hidden cells on the frontier.
+        num_mines (int): The number of hidden mines, None to ignore the mine count.
+        interior (int): The number of hidden cells that are not on the frontier.
+
+    Returns:
+        str: The facts for ASPSolvers/minesweeperFrontier.lp.
+    """
+    facts = [f"frontier({col},{row})." for row, col in cells]
+    facts.extend(f"clue({col},{row},{count})." for (row, col), count in clues.items())
+    if num_mines is not None:
+        facts.append(f"mines_left({num_mines}).")
+        facts.append(f"interior({interior}).")
+    return "\n".join(facts)
+
+
+class Inference:
+    """
+    Inference Class
+    ---------------
+    The cells of the frontier that are provably safe and provably mines.
+    """
+
+    def __init__(self, safe=(), mines=(), frontier_size=0):
+        """
+        Initializes the inference.
+
+        Args:
+            safe (iterable): The (row, col) of the provably safe cells.
+            mines (iterable): The (row, col) of the provably mined cells.
+            frontier_size (int): The number of hidden cells on the frontier.
+        """
+        self.safe = set(safe)
+        self.mines = set(mines)
+        self.frontier_size = frontier_size
+
+    def __repr__(self):
+        return f"Inference(safe={len(self.safe)}, mines={len(self.mines)}, frontier_size={self.frontier_size})"
+
+
+def infer(rows, cols, numbers, num_mines=None, budget=None, running=None, stats=None):
+    """
+    Deduce the provably safe cells and the provably mined cells of the frontier.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        numbers (dict): The number of adjacent mines of every revealed cell, by (row, col).
+        num_mines (int): The number of mines on the board, None to ignore the mine count.
+        budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+        running (RunningSolves): Tracks the solve so that it can be cancelled from another thread.
+        stats (dict): If given, the seconds spent grounding and solving are added to its "ground"
+            and "solve" entries.
+
+    Returns:
+        Inference: The deduced cells, or None if the revealed numbers contradict each other or the
+        solve was cancelled.
+
+    Raises:
+        BudgetExceeded: If the solve ran out of budget or was interrupted.
+    """
+    clues, cells = frontier(rows, cols, numbers)
+    if not cells:
+        return Inference()
+
+    consequences = []
+
+    def on_model(model):
+        consequences[:] = model.symbols(shown=True)
+
+    with SolverCall("frontier", f"{rows}x{cols}") as call:
+        try:
+            with call.phase("load"):
+                ctl = clingo.Control(["--enum-mode=cautious", "0"])
+                ctl.add("base", [], program_text(FRONTIER_PROGRAM))
+                ctl.add("base", [], frontier_facts(clues, cells, num_mines, rows * cols - len(numbers) - len(cells)))
+            with call.phase("ground"):
+                ctl.ground([("base", [])])
+                configure(ctl, budget)
+            call.ctl = ctl
+            with call.phase("solve"):
+                with (running or RunningSolves()).solve(ctl, on_model=on_model, async_=True) as handle:
+                    result = call.result = wait(handle, budget)
+        finally:
+            if stats is not None:
+                stats["ground"] = stats.get("ground", 0.0) + call.record["load"] + call.record["ground"]
+                stats["solve"] = stats.get("solve", 0.0) + call.record["solve"]
+    if not result.satisfiable:
+        return None
+
+    safe, mines = set(), set()
+    for symbol in consequences:
+        col, row = (argument.number for argument in symbol.arguments)
+        (mines if symbol.name == "mine" else safe).add((row, col))
+    return Inference(safe, mines, len(cells))
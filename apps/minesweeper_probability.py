@@ -0,0 +1,295 @@
+"""
+Minesweeper Probability
+=======================
+
+This module computes the exact probability that each hidden cell of a Minesweeper game is a mine,
+given only the revealed numbers and the total number of mines. It is used for the heatmap overlay
+and for the safest guess when no cell is provably safe.
+
+The frontier (the hidden cells next to a revealed number) is split into independent components:
+two frontier cells belong to the same component if they are next to a common number. The mine
+configurations of every component are counted separately by backtracking, grouped by the number
+of mines they use. The components are then combined under the global mine count: a choice of k
+mines on the frontier leaves the other mines to the interior cells, which can hold them in
+comb(interior, num_mines - k) ways. Counting components separately replaces the product of their
+configuration counts by a sum, which keeps the enumeration tractable on dense boards.
+
+All counts are exact integers, so the probabilities are exact up to the final division.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import math
+import time
+from apps.minesweeper_inference import frontier, neighbors
+from apps.solver_budget import BudgetExceeded
+from apps.solver_stats import SolverCall
+
+
+def components(rows, cols, clues, cells):
+    """
+    Split the frontier into independent components.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        clues (dict): The revealed numbers next to the frontier, by (row, col).
+        cells (set): The hidden cells on the frontier.
+
+    Returns:
+        list: The components as lists of frontier cells. Every cell is listed after a neighbour
+        of a common clue, so that the clues of a component are completed early during counting.
+    """
+    clues_of = {cell: [] for cell in cells}
+    cells_of = {}
+    for clue in clues:
+        cells_of[clue] = [cell for cell in neighbors(rows, cols, *clue) if cell in clues_of]
+        for cell in cells_of[clue]:
+            clues_of[cell].append(clue)
+
+    result = []
+    seen = set()
+    for start in sorted(cells):
+        if start in seen:
+            continue
+        seen.add(start)
+        component = [start]
+        for cell in component:
+            for clue in clues_of[cell]:
+                for other in cells_of[clue]:
+                    if other not in seen:
+                        seen.add(other)
+                        component.append(other)
+        result.append(component)
+    return result
+
+
+def count_configurations(rows, cols, component, clues, budget=None):
+    """
+    Count the mine configurations of a component that satisfy all of its clues.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        component (list): The frontier cells of the component.
+        clues (dict): The revealed numbers next to the frontier, by (row, col).
+        budget (list): The deadline and the number of conflicts left, None for no limit.
+
+    Returns:
+        dict: For every number of mines k, a tuple of the number of configurations with k mines
+        and a list with the number of those configurations in which each cell is a mine.
+
+    Raises:
+        BudgetExceeded: If the enumeration ran out of budget.
+    """
+    index = {cell: i for i, cell in enumerate(component)}
+    component_clues = [clue for clue in clues if any(cell in index for cell in neighbors(rows, cols, *clue))]
+    needed = [clues[clue] for clue in component_clues]
+    unassigned = [0] * len(component_clues)
+    clues_of = [[] for _ in component]
+    for j, clue in enumerate(component_clues):
+        for cell in neighbors(rows, cols, *clue):
+            if cell in index:
+                clues_of[index[cell]].append(j)
+                unassigned[j] += 1
+
+    def assign(i, mine):
+        consistent = True
+        for j in clues_of[i]:
+            unassigned[j] -= 1
+            needed[j] -= mine
+            if needed[j] < 0 or needed[j] > unassigned[j]:
+                consistent = False
+        if not consistent:
+            unassign(i, mine)
+        return consistent
+
+    def unassign(i, mine):
+        for j in clues_of[i]:
+            unassigned[j] += 1
+            needed[j] += mine
+
+    # Depth-first search with an explicit stack, since components can be longer than the recursion limit
+    result = {}
+    mined = []
+    values = [-1] * len(component)
+    assigned = [False] * len(component)
+    i = 0
+    while i >= 0:
+        if i == len(component):
+            entry = result.setdefault(len(mined), [0, [0] * len(component)])
+            entry[0] += 1
+            for cell in mined:
+                entry[1][cell] += 1
+            i -= 1
+            continue
+        if assigned[i]:
+            unassign(i, values[i])
+            assigned[i] = False
+            if values[i]:
+                mined.pop()
+        values[i] += 1
+        if values[i] > 1:
+            values[i] = -1
+            i -= 1
+        elif assign(i, values[i]):
+            assigned[i] = True
+            if values[i]:
+                mined.append(i)
+            i += 1
+        elif budget is not None:
+            budget[1] -= 1
+            if budget[1] < 0:
+                raise BudgetExceeded("conflicts")
+            if budget[0] is not None and time.perf_counter() > budget[0]:
+                raise BudgetExceeded("timeout")
+
+    return {k: tuple(value) for k, value in result.items()}
+
+
+def convolve(a, b):
+    """
+    Combine the configuration counts of two independent parts of the frontier.
+
+    Args:
+        a (dict): The number of configurations of the first part by number of mines.
+        b (dict): The number of configurations of the second part by number of mines.
+
+    Returns:
+        dict: The number of configurations of both parts together by number of mines.
+    """
+    result = {}
+    for k_a, count_a in a.items():
+        for k_b, count_b in b.items():
+            result[k_a + k_b] = result.get(k_a + k_b, 0) + count_a * count_b
+    return result
+
+
+class MineProbabilities:
+    """
+    MineProbabilities Class
+    -----------------------
+    The mine probability of every hidden cell of a game. Frontier cells have their own
+    probability, all interior cells share the same one.
+    """
+
+    def __init__(self, frontier_probabilities, interior_cells, interior_probability, num_components=0):
+        """
+        Initializes the probabilities.
+
+        Args:
+            frontier_probabilities (dict): The mine probability of every frontier cell, by (row, col).
+            interior_cells (list): The hidden cells that are not on the frontier.
+            interior_probability (float): The mine probability of every interior cell.
+            num_components (int): The number of independent components of the frontier.
+        """
+        self.frontier = frontier_probabilities
+        self.interior_cells = interior_cells
+        self.interior = interior_probability
+        self.num_components = num_components
+
+    def __repr__(self):
+        return (f"MineProbabilities(frontier={len(self.frontier)}, interior={len(self.interior_cells)}, "
+                f"components={self.num_components})")
+
+    def cells(self):
+        """
+        Returns:
+            dict: The mine probability of every hidden cell, by (row, col).
+        """
+        probabilities = dict.fromkeys(self.interior_cells, self.interior)
+        probabilities.update(self.frontier)
+        return probabilities
+
+    def safest(self, exclude=()):
+        """
+        Get the hidden cell that is least likely to be a mine.
+
+        Args:
+            exclude (iterable): Cells that should not be picked, e.g. flagged cells.
+
+        Returns:
+            tuple: The (row, col) of the cell and its mine probability, or None if there is no
+            hidden cell left.
+        """
+        exclude = set(exclude)
+        candidates = [(p, cell) for cell, p in self.frontier.items() if cell not in exclude]
+        interior = next((cell for cell in self.interior_cells if cell not in exclude), None)
+        if interior is not None:
+            candidates.append((self.interior, interior))
+        if not candidates:
+            return None
+        p, cell = min(candidates)
+        return cell, p
+
+
+def mine_probabilities(rows, cols, numbers, num_mines, decompose=True, budget=None):
+    """
+    Compute the exact mine probability of every hidden cell.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        numbers (dict): The number of adjacent mines of every revealed cell, by (row, col).
+        num_mines (int): The number of mines on the board.
+        decompose (bool): Count the components of the frontier separately. False counts the whole
+            frontier at once, which is only useful to measure what the decomposition saves.
+        budget (SolveBudget): The time and conflict limits of the enumeration, None for no limit.
+
+    Returns:
+        MineProbabilities: The probabilities, or None if the revealed numbers contradict each other.
+
+    Raises:
+        BudgetExceeded: If the enumeration ran out of budget.
+    """
+    clues, cells = frontier(rows, cols, numbers)
+    interior_cells = [(row, col) for row in range(rows) for col in range(cols)
+                      if (row, col) not in numbers and (row, col) not in cells]
+    parts = components(rows, cols, clues, cells)
+    if not decompose and parts:
+        parts = [[cell for part in parts for cell in part]]
+
+    remaining = None
+    if budget is not None:
+        remaining = [budget.deadline(), math.inf if budget.conflicts is None else budget.conflicts]
+    with SolverCall("probability", f"{rows}x{cols}") as call:
+        with call.phase("solve"):
+            counts = [count_configurations(rows, cols, part, clues, remaining) for part in parts]
+        call.result = all(counts)
+    if not call.result:
+        return None
+
+    totals = [{k: value[0] for k, value in count.items()} for count in counts]
+    prefix = [{0: 1}]
+    for total in totals:
+        prefix.append(convolve(prefix[-1], total))
+    suffix = [{0: 1}]
+    for total in reversed(totals):
+        suffix.append(convolve(suffix[-1], total))
+    suffix.reverse()
+
+    interior = len(interior_cells)
+
+    def weight(k):
+        return math.comb(interior, num_mines - k) if 0 <= num_mines - k <= interior else 0
+
+    weight_sum = sum(count * weight(k) for k, count in prefix[-1].items())
+    if not weight_sum:
+        return None
+
+    frontier_probabilities = {}
+    for i, (part, count) in enumerate(zip(parts, counts)):
+        others = convolve(prefix[i], suffix[i + 1])
+        mine_weights = [0] * len(part)
+        for k, (_, cell_counts) in count.items():
+            rest = sum(other * weight(k + k_other) for k_other, other in others.items())
+            for j, cell_count in enumerate(cell_counts):
+                mine_weights[j] += cell_count * rest
+        for cell, mine_weight in zip(part, mine_weights):
+            frontier_probabilities[cell] = mine_weight / weight_sum
+
+    interior_probability = 0.0
+    if interior:
+        interior_mines = sum(count * weight(k) * (num_mines - k) for k, count in prefix[-1].items())
+        interior_probability = interior_mines / (weight_sum * interior)
+    return MineProbabilities(frontier_probabilities, interior_cells, interior_probability, len(parts))
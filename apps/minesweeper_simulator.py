@@ -0,0 +1,233 @@
+"""
+Minesweeper Simulator
+=====================
+
+This module plays Minesweeper games without tkinter, so that the solvers can be measured without
+clicking through the UI. A game starts with a click on the middle cell, with no mine in the safe
+zone around it, and is then played by a move policy until it is won or lost.
+
+A policy is an object with a choose(game) method that returns the next cell to reveal. The
+policies in POLICIES are:
+    random       Reveal a random hidden cell.
+    inference    Reveal the cells the frontier ASP inference proves safe, and a random cell when
+                 there is none.
+    probability  Like inference, but guess the cell with the lowest exact mine probability.
+
+Policies add the seconds they spend grounding and solving to their stats dict.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import random
+import time
+from apps.minesweeper_board import MinesweeperBoard
+from apps.minesweeper_generator import random_board
+from apps.minesweeper_inference import infer
+from apps.minesweeper_probability import mine_probabilities
+from apps.solver_budget import BudgetExceeded
+
+
+class SimulatedGame:
+    """
+    SimulatedGame Class
+    -------------------
+    A Minesweeper game without a UI. A policy only sees the numbers of the revealed cells.
+    """
+
+    def __init__(self, rows, cols, num_mines, seed=None):
+        """
+        Initializes the game. The mines are placed outside the safe zone of the middle cell.
+
+        Args:
+            rows (int): The number of rows of the board.
+            cols (int): The number of columns of the board.
+            num_mines (int): The number of mines.
+            seed (int): The seed of the random number generator, for reproducible games.
+        """
+        self.rows = rows
+        self.cols = cols
+        self.num_mines = num_mines
+        self.start = (rows // 2, cols // 2)
+        self.board = MinesweeperBoard(rows, cols, random_board(rows, cols, num_mines, self.start, random.Random(seed)))
+        self.revealed = set()
+        self.lost = False
+
+    @property
+    def won(self):
+        """
+        Returns:
+            bool: True once every safe cell is revealed.
+        """
+        return not self.lost and len(self.revealed) == self.rows * self.cols - self.num_mines
+
+    @property
+    def over(self):
+        """
+        Returns:
+            bool: True once the game is won or lost.
+        """
+        return self.lost or self.won
+
+    def numbers(self):
+        """
+        Returns:
+            dict: The number of adjacent mines of every revealed cell, by (row, col).
+        """
+        return {cell: self.board.count(*cell) for cell in self.revealed}
+
+    def hidden(self):
+        """
+        Returns:
+            list: The cells that are not revealed yet.
+        """
+        return [(row, col) for row in range(self.rows) for col in range(self.cols) if (row, col) not in self.revealed]
+
+    def click(self, row, col):
+        """
+        Reveal a cell. Revealing a mine loses the game.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        if (row, col) in self.board.mines:
+            self.lost = True
+        else:
+            self.board.reveal(row, col, self.revealed)
+
+
+class RandomPolicy:
+    """
+    RandomPolicy Class
+    ------------------
+    Reveals a random hidden cell after the first click.
+    """
+
+    def __init__(self, seed=None, budget=None):
+        """
+        Initializes the policy.
+
+        Args:
+            seed (int): The seed of the random number generator.
+            budget (SolveBudget): The time and conflict limits of every solver call, None for no limit.
+        """
+        self.rng = random.Random(seed)
+        self.budget = budget
+        self.stats = {"ground": 0.0, "solve": 0.0}
+
+    def choose(self, game):
+        """
+        Choose the next cell to reveal.
+
+        Args:
+            game (SimulatedGame): The game.
+
+        Returns:
+            tuple: The (row, col) of the cell.
+        """
+        if not game.revealed:
+            return game.start
+        return self.guess(game)
+
+    def guess(self, game):
+        """
+        Choose a cell when no cell is known to be safe.
+
+        Args:
+            game (SimulatedGame): The game.
+
+        Returns:
+            tuple: The (row, col) of the cell.
+        """
+        return self.rng.choice(game.hidden())
+
+
+class InferencePolicy(RandomPolicy):
+    """
+    InferencePolicy Class
+    ---------------------
+    Reveals the cells the frontier ASP inference proves safe. The inference is only run again
+    once all cells of the previous one are revealed.
+    """
+
+    def __init__(self, seed=None, budget=None):
+        super().__init__(seed, budget)
+        self.safe = []
+
+    def choose(self, game):
+        if not game.revealed:
+            return game.start
+        self.safe = [cell for cell in self.safe if cell not in game.revealed]
+        if not self.safe:
+            try:
+                inference = infer(game.rows, game.cols, game.numbers(), game.num_mines, budget=self.budget, stats=self.stats)
+            except BudgetExceeded:
+                inference = None
+            if inference is not None:
+                self.safe = sorted(inference.safe - game.revealed)
+        if self.safe:
+            return self.safe.pop()
+        return self.guess(game)
+
+
+class ProbabilityPolicy(InferencePolicy):
+    """
+    ProbabilityPolicy Class
+    -----------------------
+    Reveals the cells the frontier ASP inference proves safe, and otherwise the cell with the
+    lowest exact mine probability.
+    """
+
+    def guess(self, game):
+        start = time.perf_counter()
+        try:
+            probabilities = mine_probabilities(game.rows, game.cols, game.numbers(), game.num_mines, budget=self.budget)
+        except BudgetExceeded:
+            probabilities = None
+        finally:
+            self.stats["solve"] += time.perf_counter() - start
+        if probabilities is None:
+            return super().guess(game)
+        cell, _ = probabilities.safest()
+        return cell
+
+
+POLICIES = {
+    "random": RandomPolicy,
+    "inference": InferencePolicy,
+    "probability": ProbabilityPolicy,
+}
+
+
+def play_game(rows, cols, num_mines, policy="inference", seed=None, budget=None):
+    """
+    Play one game with a policy.
+
+    This is a module-level function so that games can be played in worker processes.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        num_mines (int): The number of mines.
+        policy (str): The name of the policy in POLICIES.
+        seed (int): The seed of the board and of the policy.
+        budget (SolveBudget): The time and conflict limits of every solver call, None for no limit.
+
+    Returns:
+        dict: Whether the game was won, the number of moves, the seconds spent choosing moves and
+        the seconds spent grounding and solving.
+    """
+    game = SimulatedGame(rows, cols, num_mines, seed)
+    player = POLICIES[policy](seed, budget)
+    moves = 0
+    start = time.perf_counter()
+    while not game.over:
+        game.click(*player.choose(game))
+        moves += 1
+    return {
+        "won": game.won,
+        "moves": moves,
+        "time": time.perf_counter() - start,
+        "ground": player.stats["ground"],
+        "solve": player.stats["solve"],
+    }
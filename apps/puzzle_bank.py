@@ -0,0 +1,331 @@
+"""
+Puzzle Bank
+===========
+
+This module implements a bank of pre-generated Sudoku puzzles stored in a compact binary file.
+The file is memory-mapped, so any puzzle can be read by index without loading the whole bank,
+and a background producer thread refills the bank when it runs low.
+
+File layout:
+    header:  magic b"SDKB", version, box size, reserved, record count, read cursor  (16 bytes)
+    record:  puzzle (41 bytes), solution (41 bytes), difficulty (1 byte)             (83 bytes)
+
+Cells are packed as 4-bit values, two per byte with the first cell in the high nibble. The read
+cursor is the index of the next puzzle handed out by take(). Every refill moves the records that
+have not been taken yet to the front of the file and resets the cursor, so the file never holds
+more than the unread puzzles plus one batch.
+
+The bank files of the games live in the directory of the puzzle_bank section of conf.yaml. A
+relative directory is resolved against the repository, not the working directory:
+
+    puzzle_bank:
+      directory: banks
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import mmap
+import os
+import struct
+import threading
+import yaml
+from apps.solver_stats import operation
+from apps.sudoku_engine import session_pool
+from apps.sudoku_generator import SudokuGenerator
+
+HEADER = struct.Struct("<4sBBHII")
+MAGIC = b"SDKB"
+VERSION = 1
+CELLS = 81
+PACKED_SIZE = (CELLS + 1) // 2
+RECORD_SIZE = 2 * PACKED_SIZE + 1
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_SHARED = {}
+_SHARED_LOCK = threading.Lock()
+
+
+def pack_board(board):
+    """
+    Pack a 9x9 board into 4-bit cells.
+
+    Args:
+        board (list): The board as a list of rows, with 0 for empty cells.
+
+    Returns:
+        bytes: The packed board, two cells per byte.
+    """
+    cells = [value for row in board for value in row] + [0]
+    return bytes((cells[i] << 4) | cells[i + 1] for i in range(0, CELLS, 2))
+
+
+def unpack_board(data):
+    """
+    Unpack a 9x9 board from 4-bit cells.
+
+    Args:
+        data (bytes): The packed board, two cells per byte.
+
+    Returns:
+        list: The board as a list of rows, with 0 for empty cells.
+    """
+    cells = []
+    for byte in data:
+        cells.append(byte >> 4)
+        cells.append(byte & 0x0F)
+    return [cells[row * 9:(row + 1) * 9] for row in range(9)]
+
+
+class PuzzleBank:
+    """
+    PuzzleBank Class
+    ----------------
+    A memory-mapped file of packed Sudoku puzzles. Reading a puzzle by index and taking the next
+    puzzle are O(1) and only touch the bytes of one record.
+    """
+
+    def __init__(self, path):
+        """
+        Opens the bank file, creating an empty bank if it does not exist.
+
+        Args:
+            path (str): The path to the bank file.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        if not os.path.exists(path):
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(HEADER.pack(MAGIC, VERSION, 3, 0, 0, 0))
+
+        self.file = open(path, "r+b")  # pylint: disable=consider-using-with
+        self.map = mmap.mmap(self.file.fileno(), 0)
+        magic, version, _, _, _, _ = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a puzzle bank")
+
+    def _header(self):
+        """
+        Read the record count and the read cursor from the header.
+
+        Returns:
+            tuple: The record count and the read cursor.
+        """
+        _, _, _, _, count, cursor = HEADER.unpack_from(self.map, 0)
+        return count, cursor
+
+    def _write_header(self, count, cursor):
+        """
+        Write the record count and the read cursor to the header.
+
+        Args:
+            count (int): The number of records in the file.
+            cursor (int): The index of the next record handed out by take().
+        """
+        HEADER.pack_into(self.map, 0, MAGIC, VERSION, 3, 0, count, cursor)
+
+    def __len__(self):
+        """
+        Returns:
+            int: The number of records in the bank, including the ones taken since the last refill.
+        """
+        with self.lock:
+            return self._header()[0]
+
+    def remaining(self):
+        """
+        Returns:
+            int: The number of records that have not been taken yet.
+        """
+        with self.lock:
+            count, cursor = self._header()
+            return count - cursor
+
+    def read(self, index):
+        """
+        Read a record by index.
+
+        Args:
+            index (int): The index of the record.
+
+        Returns:
+            tuple: The puzzle, the solution and the difficulty of the record.
+        """
+        with self.lock:
+            return self._read(index)
+
+    def _read(self, index):
+        """
+        Read a record by index, without taking the lock.
+        """
+        count, _ = self._header()
+        if not 0 <= index < count:
+            raise IndexError(f"Puzzle {index} is not in the bank")
+        offset = HEADER.size + index * RECORD_SIZE
+        puzzle = unpack_board(self.map[offset:offset + PACKED_SIZE])
+        solution = unpack_board(self.map[offset + PACKED_SIZE:offset + 2 * PACKED_SIZE])
+        return puzzle, solution, self.map[offset + 2 * PACKED_SIZE]
+
+    def take(self):
+        """
+        Hand out the next puzzle and advance the read cursor.
+
+        Returns:
+            tuple: The puzzle, the solution and the difficulty, or None if the bank is empty.
+        """
+        with self.lock:
+            count, cursor = self._header()
+            if cursor >= count:
+                return None
+            record = self._read(cursor)
+            self._write_header(count, cursor + 1)
+            return record
+
+    def append(self, records):
+        """
+        Append records to the end of the bank.
+
+        The records that have already been taken are dropped first, by moving the unread ones to
+        the front of the file, so the file does not keep growing with puzzles that will never be
+        read again. The indices of the unread records change accordingly.
+
+        Args:
+            records (iterable): (puzzle, solution, difficulty) tuples.
+        """
+        data = b"".join(pack_board(puzzle) + pack_board(solution) + bytes([difficulty])
+                        for puzzle, solution, difficulty in records)
+        with self.lock:
+            count, cursor = self._header()
+            if cursor:
+                unread = count - cursor
+                if unread:
+                    self.map.move(HEADER.size, HEADER.size + cursor * RECORD_SIZE, unread * RECORD_SIZE)
+                count, cursor = unread, 0
+                self._write_header(count, cursor)
+            self.map.close()
+            self.file.truncate(HEADER.size + count * RECORD_SIZE)
+            self.file.seek(0, os.SEEK_END)
+            self.file.write(data)
+            self.file.flush()
+            self.map = mmap.mmap(self.file.fileno(), 0)
+            self._write_header(count + len(data) // RECORD_SIZE, cursor)
+
+    def close(self):
+        """
+        Flush and close the bank file.
+        """
+        with self.lock:
+            if not self.map.closed:
+                self.map.flush()
+                self.map.close()
+            self.file.close()
+
+
+class PuzzleBankProducer(threading.Thread):
+    """
+    PuzzleBankProducer Class
+    ------------------------
+    A background thread that refills a puzzle bank with generated puzzles of one difficulty
+    whenever the number of remaining puzzles drops below the low watermark. Every batch is
+    generated on a session borrowed from the shared session pool.
+    """
+
+    def __init__(self, bank, clues, low=10, high=50, batch=5, budget=None):
+        """
+        Initializes the producer thread.
+
+        Args:
+            bank (PuzzleBank): The bank to refill.
+            clues (int): The number of clues of the generated puzzles, 0 for minimal puzzles.
+            low (int): Refill when fewer puzzles than this remain.
+            high (int): Stop refilling once this many puzzles remain.
+            batch (int): The number of puzzles appended to the bank at a time.
+            budget (SolveBudget): The time and conflict limits of every uniqueness check, None for no limit.
+        """
+        super().__init__(daemon=True)
+        self.bank = bank
+        self.clues = clues
+        self.low = low
+        self.high = high
+        self.batch = batch
+        self.budget = budget
+        self.wakeup = threading.Event()
+        self.stopped = threading.Event()
+
+    def notify(self):
+        """
+        Wake the producer up, e.g. after a puzzle has been taken from the bank.
+        """
+        self.wakeup.set()
+
+    def stop(self):
+        """
+        Stop the producer after the batch it is currently generating.
+        """
+        self.stopped.set()
+        self.wakeup.set()
+
+    def run(self):
+        """
+        Refill the bank whenever it runs low until the producer is stopped.
+        """
+        while not self.stopped.is_set():
+            if self.bank.remaining() < self.low:
+                while self.bank.remaining() < self.high:
+                    with operation("generation"), session_pool(3).borrow() as session:
+                        puzzles = SudokuGenerator(session, budget=self.budget).generate_batch(self.batch, self.clues)
+                    if self.stopped.is_set():
+                        return
+                    self.bank.append((puzzle, solution, self.clues) for puzzle, solution in puzzles)
+            self.wakeup.wait()
+            self.wakeup.clear()
+
+
+def bank_directory(path="conf.yaml"):
+    """
+    Get the directory of the bank files from the puzzle_bank section of a YAML configuration file.
+
+    A missing section or file gives the banks directory of the repository.
+
+    Args:
+        path (str): The path to the configuration file.
+
+    Returns:
+        str: The absolute path to the directory.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file) or {}
+    except FileNotFoundError:
+        config = {}
+    directory = (config.get("puzzle_bank") or {}).get("directory", "banks")
+    return os.path.join(REPO_ROOT, directory)
+
+
+def shared_bank(path, clues, low=10, high=50, budget=None):
+    """
+    Open a bank together with its producer, once per path and process.
+
+    A bank file must only be opened once per process, because every PuzzleBank keeps its own
+    memory map and lock. Every caller asking for the same path shares the same bank and producer.
+
+    Args:
+        path (str): The path to the bank file.
+        clues (int): The number of clues of the generated puzzles, 0 for minimal puzzles.
+        low (int): Refill when fewer puzzles than this remain.
+        high (int): Stop refilling once this many puzzles remain.
+        budget (SolveBudget): The time and conflict limits of every uniqueness check, None for no limit.
+
+    Returns:
+        tuple: The PuzzleBank and its running PuzzleBankProducer.
+    """
+    with _SHARED_LOCK:
+        if path not in _SHARED:
+            bank = PuzzleBank(path)
+            producer = PuzzleBankProducer(bank, clues, low, high, budget=budget)
+            producer.start()
+            _SHARED[path] = (bank, producer)
+        return _SHARED[path]
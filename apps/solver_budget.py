@@ -0,0 +1,213 @@
+"""
+Solver Budgets
+==============
+
+This module limits how long a single solver call may run. A SolveBudget holds a time limit in
+seconds and a conflict limit, either of which can be None for no limit. Clingo solves run
+asynchronously: the time limit is enforced by waiting on the solve handle and cancelling it, the
+conflict limit through the solve_limit option of the control.
+
+A call that runs out of budget raises BudgetExceeded. run_with_budget turns this into a
+SolveOutcome, which the UI can show as "unknown" instead of freezing on a pathological board.
+
+The budgets of the operations of the games (hint, validate, solve and generation) are read from
+the budgets section of conf.yaml:
+
+    budgets:
+      hint:
+        time: 2.0
+        conflicts: 200000
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import time
+import yaml
+
+OPERATIONS = ("hint", "validate", "solve", "generation")
+
+
+class BudgetExceeded(Exception):
+    """
+    BudgetExceeded Class
+    --------------------
+    Raised when a solver call runs out of its time or conflict budget before reaching an answer.
+    """
+
+    def __init__(self, reason):
+        """
+        Initializes the exception.
+
+        Args:
+            reason (str): "timeout" if the time limit was reached, "conflicts" if the conflict
+                limit was reached, "interrupted" if the call was cancelled before it had an answer.
+        """
+        super().__init__(f"Solver budget exceeded ({reason})")
+        self.reason = reason
+
+
+class SolveBudget:
+    """
+    SolveBudget Class
+    -----------------
+    The time and conflict limits of a single solver call.
+    """
+
+    def __init__(self, time_limit=None, conflicts=None):
+        """
+        Initializes the budget.
+
+        Args:
+            time_limit (float): The maximum number of seconds a call may run, None for no limit.
+            conflicts (int): The maximum number of conflicts a call may run into, None for no limit.
+        """
+        self.time_limit = time_limit
+        self.conflicts = conflicts
+
+    def __repr__(self):
+        return f"SolveBudget(time_limit={self.time_limit}, conflicts={self.conflicts})"
+
+    def deadline(self):
+        """
+        Returns:
+            float: The time.perf_counter() value at which a call started now runs out of time, or
+            None if there is no time limit.
+        """
+        return None if self.time_limit is None else time.perf_counter() + self.time_limit
+
+    def solve_limit(self):
+        """
+        Returns:
+            str: The value of Clingo's solve_limit option that enforces the conflict limit.
+        """
+        return "umax,umax" if self.conflicts is None else f"{self.conflicts},umax"
+
+
+class SolveOutcome:
+    """
+    SolveOutcome Class
+    ------------------
+    The result of a solver call that ran under a budget. If the call ran out of budget, the value
+    is None and the reason says which limit was reached.
+    """
+
+    def __init__(self, value=None, reason=None, elapsed=0.0):
+        """
+        Initializes the outcome.
+
+        Args:
+            value: The return value of the call, None if the call ran out of budget.
+            reason (str): None if the call finished, "timeout", "conflicts" or "interrupted" otherwise.
+            elapsed (float): The number of seconds the call ran.
+        """
+        self.value = value
+        self.reason = reason
+        self.elapsed = elapsed
+
+    def __repr__(self):
+        return f"SolveOutcome(value={self.value!r}, reason={self.reason!r}, elapsed={self.elapsed:.3f})"
+
+    @property
+    def unknown(self):
+        """
+        Returns:
+            bool: True if the call ran out of budget, so nothing is known about the answer.
+        """
+        return self.reason is not None
+
+    def describe(self):
+        """
+        Returns:
+            str: A message for the user explaining why the solver gave up.
+        """
+        if self.reason == "timeout":
+            return f"The solver gave up after {self.elapsed:.1f} seconds."
+        if self.reason == "conflicts":
+            return f"The solver gave up after running into too many conflicts ({self.elapsed:.1f} seconds)."
+        if self.reason == "interrupted":
+            return f"The solver was cancelled after {self.elapsed:.1f} seconds."
+        return "The solver finished."
+
+
+def configure(ctl, budget):
+    """
+    Set the conflict limit of a budget on a Clingo control.
+
+    Args:
+        ctl (clingo.Control): The control.
+        budget (SolveBudget): The budget, or None for no limit.
+    """
+    ctl.configuration.solve.solve_limit = "umax,umax" if budget is None else budget.solve_limit()
+
+
+def wait(handle, budget):
+    """
+    Wait for an asynchronous Clingo solve to finish within a budget.
+
+    The conflict limit has to be set on the control with configure() before the solve is started.
+
+    Args:
+        handle (clingo.SolveHandle): The handle of a solve started with async_=True.
+        budget (SolveBudget): The budget, or None for no limit.
+
+    Returns:
+        clingo.SolveResult: The result of the solve.
+
+    Raises:
+        BudgetExceeded: If the solve ran out of time or conflicts, or was interrupted, e.g. by a
+            cancelled job. An interrupted solve has no answer, so it must not be taken for one.
+    """
+    if budget is not None and budget.time_limit is not None and not handle.wait(budget.time_limit):
+        handle.cancel()
+        handle.get()
+        raise BudgetExceeded("timeout")
+    result = handle.get()
+    if result.interrupted:
+        raise BudgetExceeded("interrupted")
+    if result.unknown:
+        raise BudgetExceeded("conflicts")
+    return result
+
+
+def run_with_budget(budget, func, *args):
+    """
+    Call a solver function under a budget and wrap its result in a SolveOutcome.
+
+    Args:
+        budget (SolveBudget): The budget, or None for no limit.
+        func (callable): The solver function, which must accept a budget keyword argument.
+        *args: The arguments of the function.
+
+    Returns:
+        SolveOutcome: The return value of the function, or the reason it ran out of budget.
+    """
+    start = time.perf_counter()
+    try:
+        value = func(*args, budget=budget)
+    except BudgetExceeded as err:
+        return SolveOutcome(reason=err.reason, elapsed=time.perf_counter() - start)
+    return SolveOutcome(value, elapsed=time.perf_counter() - start)
+
+
+def load_budgets(path="conf.yaml"):
+    """
+    Load the budget of every operation from the budgets section of a YAML configuration file.
+
+    Operations that are missing from the file, or a missing file, get no limits.
+
+    Args:
+        path (str): The path to the configuration file.
+
+    Returns:
+        dict: The SolveBudget of every operation in OPERATIONS.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file) or {}
+    except FileNotFoundError:
+        config = {}
+    budgets = config.get("budgets") or {}
+    return {
+        operation: SolveBudget((budgets.get(operation) or {}).get("time"), (budgets.get(operation) or {}).get("conflicts"))
+        for operation in OPERATIONS
+    }
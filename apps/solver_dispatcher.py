@@ -0,0 +1,248 @@
+"""
+Solver Dispatcher
+=================
+
+This module runs solver work off the tkinter main thread. Jobs are submitted to an executor (a
+worker thread, or a worker process for heavy jobs), and their results are handed back to the
+main thread by polling a queue with root.after, so the window keeps processing events while the
+solver runs. Every dispatcher runs one job at a time: submitting a new job cancels the one in
+flight, and the result of a cancelled job is dropped.
+
+Clingo solves are cancelled through their solve handles. Calling ctl.interrupt() on a control
+that is not solving makes its next solve fail, and cancelling a handle that has been closed
+crashes, so the open handles are tracked by RunningSolves and only those are cancelled. A job
+that is cancelled before its solve has started is interrupted again until it returns when the
+dispatcher shuts down, so its solver objects can be handed on afterwards.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+from contextlib import contextmanager
+
+
+class RunningSolves:
+    """
+    RunningSolves Class
+    -------------------
+    Keeps track of the open Clingo solve handles of one or more controls, so that they can be
+    cancelled from another thread.
+    """
+
+    def __init__(self):
+        """
+        Initializes an empty set of running solves.
+        """
+        self.lock = threading.Lock()
+        self.handles = set()
+
+    @contextmanager
+    def solve(self, ctl, **kwargs):
+        """
+        Start a solve that can be cancelled with cancel().
+
+        Args:
+            ctl (clingo.Control): The control to solve with.
+            **kwargs: The arguments passed on to ctl.solve, which must ask for a handle with
+                yield_=True or async_=True.
+
+        Yields:
+            clingo.SolveHandle: The handle of the running solve.
+        """
+        with ctl.solve(**kwargs) as handle:
+            with self.lock:
+                self.handles.add(handle)
+            try:
+                yield handle
+            finally:
+                with self.lock:
+                    self.handles.discard(handle)
+
+    def cancel(self):
+        """
+        Cancel every running solve. Solves that have not started yet are not affected.
+        """
+        with self.lock:
+            for handle in self.handles:
+                handle.cancel()
+
+
+class SolverJob:
+    """
+    SolverJob Class
+    ---------------
+    A job submitted to a SolverDispatcher, together with the callbacks that receive its result.
+    """
+
+    def __init__(self, on_done, on_error=None, interrupt=None):
+        """
+        Initializes the job.
+
+        Args:
+            on_done (callable): Called on the main thread with the result of the job.
+            on_error (callable): Called on the main thread with the exception if the job failed.
+            interrupt (callable): Called when the job is cancelled while it is running, e.g. to
+                cancel its Clingo solve.
+        """
+        self.on_done = on_done
+        self.on_error = on_error
+        self.interrupt = interrupt
+        self.future = None
+        self.cancelled = False
+
+    def cancel(self):
+        """
+        Cancel the job. A job that has not started is never run, a running job is interrupted,
+        and the result of a cancelled job is never delivered.
+        """
+        self.cancelled = True
+        if self.future is not None and not self.future.cancel() and self.interrupt is not None:
+            self.interrupt()
+
+
+class SolverDispatcher:
+    """
+    SolverDispatcher Class
+    ----------------------
+    Runs solver jobs on a worker thread, or on a worker process for heavy jobs, and delivers their
+    results on the tkinter main thread. All methods must be called from the main thread.
+    """
+
+    def __init__(self, root, on_busy=None, poll_interval=30):
+        """
+        Initializes the dispatcher. The worker process is only started for the first heavy job.
+
+        Args:
+            root (tk.Tk): The tkinter window object, used to poll for results.
+            on_busy (callable): Called with True when a job starts and with False when the
+                dispatcher becomes idle again, e.g. to show a busy indicator.
+            poll_interval (int): The number of milliseconds between two polls for results.
+        """
+        self.root = root
+        self.on_busy = on_busy
+        self.poll_interval = poll_interval
+        self.threads = ThreadPoolExecutor(max_workers=1)
+        self.processes = None
+        self.results = queue.Queue()
+        self.current = None
+        self.running = set()
+        self.running_lock = threading.Lock()
+        self.pending = 0
+        self.poll_job = None
+
+    def submit(self, func, *args, on_done, on_error=None, interrupt=None, heavy=False):
+        """
+        Run a function in the background, cancelling the job in flight.
+
+        Args:
+            func (callable): The function to run. For heavy jobs it has to be picklable, i.e. a
+                module-level function.
+            *args: The arguments of the function.
+            on_done (callable): Called on the main thread with the return value of the function.
+            on_error (callable): Called on the main thread with the exception raised by the function.
+            interrupt (callable): Called to interrupt the function if the job is cancelled while it runs.
+            heavy (bool): Run the function in a worker process instead of a worker thread.
+
+        Returns:
+            SolverJob: The submitted job.
+        """
+        self.cancel()
+        job = SolverJob(on_done, on_error, interrupt)
+        if heavy:
+            if self.processes is None:
+                self.processes = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+            job.future = self.processes.submit(func, *args)
+        else:
+            job.future = self.threads.submit(self._run, job, func, args)
+            with self.running_lock:
+                self.running.add(job)
+            job.future.add_done_callback(lambda future: self._finished(job))
+        job.future.add_done_callback(lambda future: self.results.put(job))
+        self.current = job
+        self.pending += 1
+        if self.pending == 1:
+            if self.on_busy is not None:
+                self.on_busy(True)
+            self.poll_job = self.root.after(self.poll_interval, self._poll)
+        return job
+
+    def _finished(self, job):
+        """
+        Forget a job of the worker thread once it has returned. Called from the worker thread.
+        """
+        with self.running_lock:
+            self.running.discard(job)
+
+    @staticmethod
+    def _run(job, func, args):
+        """
+        Run a function on the worker thread, unless its job was cancelled while it was queued.
+        """
+        if job.cancelled:
+            return None
+        return func(*args)
+
+    def cancel(self):
+        """
+        Cancel the job in flight, if there is one.
+        """
+        if self.current is not None:
+            self.current.cancel()
+            self.current = None
+
+    def _poll(self):
+        """
+        Deliver the results of finished jobs and keep polling while jobs are pending.
+        """
+        self.poll_job = None
+        while True:
+            try:
+                job = self.results.get_nowait()
+            except queue.Empty:
+                break
+            self.pending -= 1
+            if job is self.current:
+                self.current = None
+            if job.cancelled or job.future.cancelled():
+                continue
+            error = job.future.exception()
+            if error is None:
+                job.on_done(job.future.result())
+            elif job.on_error is not None:
+                job.on_error(error)
+            else:
+                raise error
+
+        if self.pending:
+            self.poll_job = self.root.after(self.poll_interval, self._poll)
+        elif self.on_busy is not None:
+            self.on_busy(False)
+
+    def shutdown(self, wait_interval=0.05):
+        """
+        Cancel the job in flight, stop polling and release the workers.
+
+        Jobs of the worker thread are waited for: a job that is still running is interrupted every
+        wait_interval seconds until it returns, which also catches a solve that had not started
+        yet when the job was first cancelled. Afterwards no job uses the solver objects of the
+        caller any more. Jobs of the worker process are not waited for.
+
+        Args:
+            wait_interval (float): The number of seconds between two interrupts of a running job.
+        """
+        self.cancel()
+        with self.running_lock:
+            jobs = list(self.running)
+        for job in jobs:
+            while not wait([job.future], timeout=wait_interval).done:
+                job.cancel()
+        if self.poll_job is not None:
+            self.root.after_cancel(self.poll_job)
+            self.poll_job = None
+        self.pending = 0
+        self.threads.shutdown(wait=False, cancel_futures=True)
+        if self.processes is not None:
+            self.processes.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,142 @@
+"""
+Solver Jobs
+===========
+
+This module answers the requests of the solver server (server.py) without any tkinter code. Every
+job takes the JSON payload of a request and a SolveBudget and returns a JSON-serializable dict.
+They are module-level functions so that they can be run in the worker processes of the server,
+where every process keeps its own engine with warm sessions.
+
+Boards are given as in the games:
+    Sudoku        "board" is the one-line string form of the puzzle, or a list of rows with 0 for
+                  empty cells, and "n" is the box size (3 by default).
+    Minesweeper   "rows" and "cols" are the size of the board, "numbers" is a list of
+                  [row, col, count] of every revealed cell and "mines" the number of mines, which
+                  may be left out.
+
+A job that runs out of budget, or whose solve is interrupted, answers
+{"unknown": true, "reason": ...}. Invalid payloads raise
+ValueError, KeyError or TypeError.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+from apps.minesweeper_inference import infer
+from apps.solver_budget import run_with_budget
+from apps.solver_stats import operation
+from apps.sudoku_engine import SudokuEngine, box_size, format_board, parse_board
+
+_ENGINE = None
+
+
+def engine():
+    """
+    Get the Sudoku engine of this process, creating it on first use.
+
+    Returns:
+        SudokuEngine: The engine.
+    """
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = SudokuEngine()
+    return _ENGINE
+
+
+def read_board(payload):
+    """
+    Read the Sudoku board of a request.
+
+    Args:
+        payload (dict): The request.
+
+    Returns:
+        list: The board as a list of rows, with 0 for empty cells.
+
+    Raises:
+        ValueError: If the board is malformed.
+    """
+    board = payload["board"]
+    if isinstance(board, str):
+        return parse_board(board, int(payload.get("n", 3)))
+    board = [[int(value) for value in row] for row in board]
+    box_size(board)
+    return board
+
+
+def answer(outcome, convert):
+    """
+    Turn the outcome of a budgeted call into the answer of a request.
+
+    Args:
+        outcome (SolveOutcome): The outcome.
+        convert (callable): Turns the value of a finished call into the answer dict.
+
+    Returns:
+        dict: The answer, or {"unknown": true, "reason": ...} if the call ran out of budget.
+    """
+    if outcome.unknown:
+        return {"unknown": True, "reason": outcome.reason}
+    return convert(outcome.value)
+
+
+def sudoku_solve(payload, budget=None):
+    """
+    Solve a Sudoku board.
+
+    Args:
+        payload (dict): The request with the board.
+        budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+    Returns:
+        dict: {"solution": board string}, with a null solution if the board has none.
+    """
+    board = read_board(payload)
+    with operation("solve"):
+        outcome = run_with_budget(budget, engine().solve, board)
+    return answer(outcome, lambda solution: {"solution": None if solution is None else format_board(solution)})
+
+
+def sudoku_hint(payload, budget=None):
+    """
+    Find every empty cell of a Sudoku board whose value is forced by its clues.
+
+    Args:
+        payload (dict): The request with the board.
+        budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+    Returns:
+        dict: {"forced": [[row, col, value], ...]}, with null if the board has no solution.
+    """
+    board = read_board(payload)
+    with operation("hint"):
+        outcome = run_with_budget(budget, engine().session(box_size(board)).forced_cells, board)
+    return answer(outcome, lambda forced: {
+        "forced": None if forced is None else [[row, col, value] for (row, col), value in sorted(forced.items())]
+    })
+
+
+def minesweeper_safe(payload, budget=None):
+    """
+    Deduce the provably safe cells and mines of a Minesweeper board from its revealed numbers.
+
+    Args:
+        payload (dict): The request with the board size, the revealed numbers and the mine count.
+        budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+    Returns:
+        dict: {"safe": [[row, col], ...], "mines": [[row, col], ...]}, with nulls if the numbers
+        contradict each other.
+    """
+    rows, cols = int(payload["rows"]), int(payload["cols"])
+    numbers = {}
+    for row, col, count in payload["numbers"]:
+        if not (0 <= row < rows and 0 <= col < cols):
+            raise ValueError(f"Cell ({row}, {col}) is outside of a {rows}x{cols} board")
+        numbers[(int(row), int(col))] = int(count)
+    mines = payload.get("mines")
+    with operation("hint"):
+        outcome = run_with_budget(budget, infer, rows, cols, numbers, None if mines is None else int(mines))
+    return answer(outcome, lambda inference: {
+        "safe": None if inference is None else [list(cell) for cell in sorted(inference.safe)],
+        "mines": None if inference is None else [list(cell) for cell in sorted(inference.mines)],
+    })
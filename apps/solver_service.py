@@ -0,0 +1,180 @@
+"""
+Solver Service
+==============
+
+This module keeps the solver state that is worth sharing between the games and between calls,
+once per process:
+
+    Programs   The text of every ASPSolvers/*.lp program is read from disk once and handed out
+               from memory afterwards.
+    Pools      Pre-initialized solver objects, e.g. a ground SudokuSession, are kept per program
+               and board size. A caller takes one from its pool for a call or for the lifetime of
+               a game and gives it back afterwards, so the next game or call that needs the same
+               program and size finds it ready instead of loading and grounding again.
+
+The service does not know how to build the pooled objects. The modules that own them pass a
+factory when they ask for a pool, e.g. apps/sudoku_engine.py creates its sessions.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import threading
+from contextlib import contextmanager
+
+_SHARED = None
+_SHARED_LOCK = threading.Lock()
+
+
+class ControlPool:
+    """
+    ControlPool Class
+    -----------------
+    Idle solver objects of one program and board size. Taking an object never blocks: if none is
+    idle, a new one is created. At most size objects are kept when they are given back, the rest
+    are dropped. All methods are thread-safe.
+    """
+
+    def __init__(self, factory, size=2):
+        """
+        Initializes an empty pool.
+
+        Args:
+            factory (callable): Creates a new object, called without arguments.
+            size (int): The maximum number of idle objects kept.
+        """
+        self.factory = factory
+        self.size = size
+        self.idle = []
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """
+        Take an idle object, or create one if none is idle.
+
+        Returns:
+            The object. It belongs to the caller until it is given back with release().
+        """
+        with self.lock:
+            if self.idle:
+                return self.idle.pop()
+        return self.factory()
+
+    def release(self, item):
+        """
+        Give an object back to the pool.
+
+        Args:
+            item: An object taken with acquire(), which must not be in use any more.
+        """
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append(item)
+
+    @contextmanager
+    def borrow(self):
+        """
+        Take an object for the duration of a block.
+
+        Yields:
+            The object.
+        """
+        item = self.acquire()
+        try:
+            yield item
+        finally:
+            self.release(item)
+
+    def prewarm(self, count=None):
+        """
+        Create objects until the pool holds count idle objects, e.g. from a background thread
+        before the first game needs them.
+
+        Args:
+            count (int): The number of idle objects wanted, None for the size of the pool.
+        """
+        count = self.size if count is None else min(count, self.size)
+        while True:
+            with self.lock:
+                if len(self.idle) >= count:
+                    return
+            self.release(self.factory())
+
+
+class SolverService:
+    """
+    SolverService Class
+    -------------------
+    The program texts and the pools of one process. All methods are thread-safe.
+    """
+
+    def __init__(self, pool_size=2):
+        """
+        Initializes the service with no programs and no pools.
+
+        Args:
+            pool_size (int): The maximum number of idle objects kept per program and board size.
+        """
+        self.pool_size = pool_size
+        self.programs = {}
+        self.pools = {}
+        self.lock = threading.Lock()
+
+    def program(self, path):
+        """
+        Get the text of a program, reading it from disk on first use.
+
+        Args:
+            path (str): The path to the program.
+
+        Returns:
+            str: The program text.
+        """
+        with self.lock:
+            if path not in self.programs:
+                with open(path, encoding="UTF-8") as f:
+                    self.programs[path] = f.read()
+            return self.programs[path]
+
+    def pool(self, program, key, factory):
+        """
+        Get the pool of a program and board size, creating it on first use.
+
+        Args:
+            program (str): The path to the program.
+            key: The board size, or anything else that tells apart the objects of the program.
+            factory (callable): Creates a new object of the pool, only used if the pool is new.
+
+        Returns:
+            ControlPool: The pool.
+        """
+        with self.lock:
+            if (program, key) not in self.pools:
+                self.pools[(program, key)] = ControlPool(factory, self.pool_size)
+            return self.pools[(program, key)]
+
+
+def shared_service():
+    """
+    Get the solver service of this process, creating it on first use.
+
+    Returns:
+        SolverService: The shared service.
+    """
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = SolverService()
+        return _SHARED
+
+
+def program_text(path):
+    """
+    Get the text of a program from the shared service.
+
+    Args:
+        path (str): The path to the program.
+
+    Returns:
+        str: The program text.
+    """
+    return shared_service().program(path)
@@ -0,0 +1,290 @@
+"""
+Solver Statistics
+=================
+
+This module records one entry per solver call, so that it can be seen where the solver time goes.
+A record holds the operation the call belongs to (hint, solve, validate, generation, ...), the
+solver, the board size, the seconds spent loading, grounding and solving, and, for Clingo calls,
+the choices, conflicts and ground atoms and rules from ctl.statistics.
+
+Records are handed to sinks, callables that receive the record dict. Setting the environment
+variable SOLVER_STATS to a file path adds a JsonLinesSink that appends every record to that file
+as one JSON object per line. Worker processes inherit the variable and append to the same file.
+Nothing is read from ctl.statistics while there are no sinks.
+
+The operation is not known where the solver runs, e.g. a hint may be answered by the solution
+cache, the engine or a session. The caller names it instead, by running the call inside
+operation() or through labelled(), and every solver call on that thread is recorded under it.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from apps.solver_budget import BudgetExceeded
+
+_SINKS = []
+_SINKS_LOCK = threading.Lock()
+_LOCAL = threading.local()
+
+
+def add_sink(sink):
+    """
+    Start sending every record to a sink.
+
+    Args:
+        sink (callable): Called with the record dict of every solver call, from the thread that
+            made the call.
+    """
+    with _SINKS_LOCK:
+        _SINKS.append(sink)
+
+
+def remove_sink(sink):
+    """
+    Stop sending records to a sink. Removing a sink that was not added does nothing.
+
+    Args:
+        sink (callable): The sink.
+    """
+    with _SINKS_LOCK:
+        if sink in _SINKS:
+            _SINKS.remove(sink)
+
+
+def enabled():
+    """
+    Returns:
+        bool: True if there is at least one sink.
+    """
+    return bool(_SINKS)
+
+
+def emit(record):
+    """
+    Send a record to every sink.
+
+    Args:
+        record (dict): The record.
+    """
+    with _SINKS_LOCK:
+        sinks = list(_SINKS)
+    for sink in sinks:
+        sink(record)
+
+
+@contextmanager
+def operation(name):
+    """
+    Record every solver call made on this thread inside the block under an operation.
+
+    Args:
+        name (str): The operation, e.g. "hint".
+    """
+    previous = getattr(_LOCAL, "operation", None)
+    _LOCAL.operation = name
+    try:
+        yield
+    finally:
+        _LOCAL.operation = previous
+
+
+def current_operation():
+    """
+    Returns:
+        str: The operation of the innermost operation() block of this thread, None outside of one.
+    """
+    return getattr(_LOCAL, "operation", None)
+
+
+def labelled(name, func, *args, **kwargs):
+    """
+    Call a function inside operation(name).
+
+    This is a module-level function so that labelled jobs can be run in worker processes, e.g.
+    partial(labelled, "generation", generate_board).
+
+    Args:
+        name (str): The operation.
+        func (callable): The function.
+        *args: The arguments of the function.
+        **kwargs: The keyword arguments of the function.
+
+    Returns:
+        The return value of the function.
+    """
+    with operation(name):
+        return func(*args, **kwargs)
+
+
+class SolverCall:
+    """
+    SolverCall Class
+    ----------------
+    Collects the record of one solver call. Used as a context manager around the call, it emits
+    the record when the block is left, also when the call ran out of budget or failed:
+
+        with SolverCall("clingo", "9x9") as call:
+            with call.phase("ground"):
+                ctl.ground([("base", [])])
+            call.ctl = ctl
+            with call.phase("solve"):
+                call.result = ctl.solve()
+    """
+
+    def __init__(self, solver, size):
+        """
+        Initializes the record.
+
+        Args:
+            solver (str): The solver, e.g. "clingo", "session" or "propagation".
+            size (str): The board size, e.g. "9x9".
+        """
+        self.ctl = None
+        self.result = None
+        self.record = {
+            "at": time.time(),
+            "pid": os.getpid(),
+            "operation": current_operation(),
+            "solver": solver,
+            "size": size,
+            "load": 0.0,
+            "ground": 0.0,
+            "solve": 0.0,
+            "choices": None,
+            "conflicts": None,
+            "atoms": None,
+            "rules": None,
+            "result": None,
+        }
+
+    @contextmanager
+    def phase(self, name):
+        """
+        Add the seconds spent in the block to a phase of the call.
+
+        Args:
+            name (str): "load", "ground" or "solve".
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record[name] += time.perf_counter() - start
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        if not enabled():
+            return False
+        if isinstance(exc, BudgetExceeded):
+            self.record["result"] = exc.reason
+        elif exc is not None:
+            self.record["result"] = "error"
+        else:
+            self.record["result"] = describe_result(self.result)
+        if self.ctl is not None:
+            self.record.update(clingo_stats(self.ctl))
+        emit(self.record)
+        return False
+
+
+def describe_result(result):
+    """
+    Describe the result of a solver call in one word.
+
+    Args:
+        result: A clingo.SolveResult, a bool, or None if the call made no decision.
+
+    Returns:
+        str: "sat", "unsat", "interrupted" or None.
+    """
+    if result is None:
+        return None
+    if isinstance(result, bool):
+        return "sat" if result else "unsat"
+    if result.interrupted:
+        return "interrupted"
+    return "sat" if result.satisfiable else "unsat"
+
+
+def clingo_stats(ctl):
+    """
+    Read the statistics of the last solve call of a control.
+
+    Args:
+        ctl (clingo.Control): The control.
+
+    Returns:
+        dict: The choices, conflicts, ground atoms and ground rules.
+    """
+    statistics = ctl.statistics
+    solvers = statistics["solving"]["solvers"]
+    lp = statistics["problem"]["lp"]
+    return {
+        "choices": int(solvers["choices"]),
+        "conflicts": int(solvers["conflicts"]),
+        "atoms": int(lp["atoms"]),
+        "rules": int(lp["rules"]),
+    }
+
+
+class JsonLinesSink:
+    """
+    JsonLinesSink Class
+    -------------------
+    Appends every record to a file as one JSON object per line. The file is opened per record, so
+    several threads and processes can share it.
+    """
+
+    def __init__(self, path):
+        """
+        Initializes the sink.
+
+        Args:
+            path (str): The path to the file.
+        """
+        self.path = path
+        self.lock = threading.Lock()
+
+    def __call__(self, record):
+        line = json.dumps(record) + "\n"
+        with self.lock:
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+class RecentCalls:
+    """
+    RecentCalls Class
+    -----------------
+    Keeps the most recent records in memory, e.g. for a debug overlay.
+    """
+
+    def __init__(self, size=10):
+        """
+        Initializes the sink.
+
+        Args:
+            size (int): The number of records kept.
+        """
+        self.calls = deque(maxlen=size)
+
+    def __call__(self, record):
+        self.calls.append(record)
+
+    def records(self):
+        """
+        Returns:
+            list: The kept records, oldest first.
+        """
+        return list(self.calls)
+
+
+if os.environ.get("SOLVER_STATS"):
+    add_sink(JsonLinesSink(os.environ["SOLVER_STATS"]))
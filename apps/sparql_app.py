@@ -5,12 +5,21 @@ This module provides functions to interact with the YAGO knowledge base using SP
 It includes functionality to load questions from a YAML configuration file, retrieve all entities
 of a specific type, and generate SPARQL queries based on predefined questions.
 
+Entity lists and answers are kept in the YAGO cache (apps/yago_cache.py), so repeated hints do not
+query YAGO again. The cache can be filled ahead of time from the questions in conf.yaml:
+
+    python -m apps.sparql_app --answers 20
+
 Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
 Created: Monday January 8, 2025
 """
+import argparse
 import random
 from SPARQLWrapper import SPARQLWrapper, JSON
 import yaml
+from apps.yago_cache import shared_cache
+
+YAGO_ENDPOINT = "https://yago-knowledge.org/sparql/query"
 
 def load_questions():
     """
@@ -20,13 +29,28 @@ def load_questions():
         config = yaml.safe_load(file)
     return config["questions"]
 
-def get_all(tpe, prop):
+def run_query(query):
     """
-    Retrieves all entities of a specified type from the YAGO knowledge base.
+    Runs a SPARQL query against the YAGO endpoint and returns the converted JSON response.
     """
-    sparql = SPARQLWrapper("https://yago-knowledge.org/sparql/query")
+    sparql = SPARQLWrapper(YAGO_ENDPOINT)
     sparql.setReturnFormat(JSON)
-    sparql.setQuery(f"""
+    sparql.setQuery(query)
+    return sparql.queryAndConvert()
+
+def get_all(tpe, prop, cache=None):
+    """
+    Retrieves all entities of a specified type from the YAGO knowledge base, or from the cache if
+    they were retrieved before.
+    """
+    cache = cache or shared_cache()
+    return cache.fetch(f"entities {tpe}", lambda: download_all(tpe, prop))
+
+def download_all(tpe, prop):
+    """
+    Downloads all entities of a specified type from the YAGO knowledge base.
+    """
+    query = f"""
         PREFIX schema: <http://schema.org/>
         PREFIX yago: <http://yago-knowledge.org/resource/>
         PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
@@ -36,9 +60,8 @@ def get_all(tpe, prop):
             ?thing a {tpe} .
         }}
     """
-    )
     print(prop)
-    response = sparql.queryAndConvert()
+    response = run_query(query)
     things = [result["thing"]["value"] for result in response["results"]["bindings"]]
     filtered = [s for s in things if ("u0028" or "u0029") not in s]
     return filtered
@@ -106,10 +129,24 @@ def get_query(question, entity):
         LIMIT 1
         """
 
-def get_answer():
+def get_results(question, entity, cache=None):
+    """
+    Retrieves the answer bindings of a question about an entity, from the cache if they were
+    retrieved before. Empty answers are cached as well, so an entity without an answer is not
+    asked again.
+    """
+    cache = cache or shared_cache()
+    return cache.fetch(f"answer {question} {entity}",
+                       lambda: run_query(get_query(question, entity))["results"]["bindings"])
+
+def get_answer(cache=None):
     """
     Retrieves a random question and its corresponding answer from the YAGO knowledge base.
+
+    If the cache has been warmed up for the question, the entity is picked from the warmed-up
+    entities, whose answers are all cached, so the hint needs no network round trip.
     """
+    cache = cache or shared_cache()
     questions = load_questions()
     question = random.choice(questions)
 
@@ -117,25 +154,57 @@ def get_answer():
     q_type = question["type"]
     q_property = question["property"]
 
-    entities = get_all(q_type, q_property)
+    entities = cache.get(f"pool {q_text}") or get_all(q_type, q_property, cache)
 
     results = []
     while not results:
         entity = random.choice(entities)
         entity = entity.split('/')[-1]
 
-        sparql = SPARQLWrapper("https://yago-knowledge.org/sparql/query")
-        sparql.setReturnFormat(JSON)
-
         formulated_question = q_text.replace("?", entity.replace("_", " ")) + "?"
 
-        q = get_query(q_text, entity)
-        sparql.setQuery(q)
-        response = sparql.queryAndConvert()
-        results = response["results"]["bindings"]
+        results = get_results(q_text, entity, cache)
 
     if "count" in results[0]:
         return f"{results[0]['count']['value']} members", formulated_question
 
     things = [result["thing"]["value"].split('/')[-1].replace("_", " ") for result in results]
     return things, formulated_question
+
+def warm_up(cache=None, answers=20, seed=None):
+    """
+    Fills the cache for every question in conf.yaml: the entity list of its type and the answers
+    for up to answers random entities. The entities with an answer are kept as the pool that
+    get_answer picks from, and are returned by question text.
+    """
+    cache = cache or shared_cache()
+    rng = random.Random(seed)
+    pools = {}
+    for question in load_questions():
+        entities = get_all(question["type"], question["property"], cache)
+        pool = []
+        for entity in rng.sample(entities, min(answers, len(entities))):
+            if get_results(question["text"], entity.split('/')[-1], cache):
+                pool.append(entity)
+        if pool:
+            cache.put(f"pool {question['text']}", pool)
+        pools[question["text"]] = pool
+    return pools
+
+def main():
+    """
+    Warms up the YAGO cache from the command line.
+    """
+    parser = argparse.ArgumentParser(description="Fill the YAGO cache with the entities and answers of the questions in conf.yaml.")
+    parser.add_argument("--answers", type=int, default=20, help="Entities per question whose answers are cached.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for picking the entities.")
+    args = parser.parse_args()
+
+    cache = shared_cache()
+    for question, pool in warm_up(cache, args.answers, args.seed).items():
+        print(f"{len(pool):>4} answers  {question}")
+    count, size = cache.size()
+    print(f"{count} entries, {size / 1024:.1f} KiB in {cache.path}")
+
+if __name__ == "__main__":
+    main()
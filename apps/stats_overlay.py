@@ -0,0 +1,104 @@
+"""
+Solver Statistics Overlay
+=========================
+
+This module shows the most recent solver calls of the running game in a small panel in the
+corner of the window, e.g. to see what a hint costs while playing. The overlay is toggled with
+F12. It only collects records while it is shown, and it redraws itself from the tkinter main
+thread, since solver calls are recorded from the worker threads of the solver dispatcher.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import tkinter as tk
+from apps.solver_stats import RecentCalls, add_sink, remove_sink
+
+
+def format_record(record):
+    """
+    Format a solver call as one line of the overlay.
+
+    Args:
+        record (dict): The record of the call.
+
+    Returns:
+        str: The operation, solver, board size, times in milliseconds, choices, conflicts and result.
+    """
+    def count(value):
+        return "-" if value is None else str(value)
+
+    return (f"{record['operation'] or '-':<11} {record['solver']:<11} {record['size']:>7} "
+            f"{record['load'] * 1000:>7.1f} {record['ground'] * 1000:>8.1f} {record['solve'] * 1000:>8.1f} "
+            f"{count(record['choices']):>8} {count(record['conflicts']):>9}  {record['result'] or '-'}")
+
+
+class StatsOverlay:
+    """
+    StatsOverlay Class
+    ------------------
+    A panel over a window that lists the most recent solver calls.
+    """
+
+    HEADER = (f"{'operation':<11} {'solver':<11} {'size':>7} {'load ms':>7} {'ground ms':>8} {'solve ms':>8} "
+              f"{'choices':>8} {'conflicts':>9}  result")
+
+    def __init__(self, root, size=8, refresh_interval=500):
+        """
+        Initializes the overlay, hidden.
+
+        Args:
+            root (tk.Tk): The window.
+            size (int): The number of solver calls shown.
+            refresh_interval (int): The time between redraws in milliseconds.
+        """
+        self.root = root
+        self.recent = RecentCalls(size)
+        self.refresh_interval = refresh_interval
+        self.refresh_job = None
+        self.label = tk.Label(self.root, font=("Courier", 9), justify="left", anchor="w", bg="black", fg="#7CFC00")
+
+    @property
+    def shown(self):
+        """
+        Returns:
+            bool: True while the overlay is shown.
+        """
+        return self.refresh_job is not None
+
+    def toggle(self):
+        """
+        Show the overlay if it is hidden, and hide it otherwise.
+        """
+        if self.shown:
+            self.hide()
+        else:
+            self.show()
+
+    def show(self):
+        """
+        Start collecting solver calls and show the overlay in the bottom left corner.
+        """
+        if self.shown:
+            return
+        add_sink(self.recent)
+        self.label.place(relx=0, rely=1, anchor="sw")
+        self.refresh()
+
+    def hide(self):
+        """
+        Hide the overlay and stop collecting solver calls.
+        """
+        if not self.shown:
+            return
+        remove_sink(self.recent)
+        self.root.after_cancel(self.refresh_job)
+        self.refresh_job = None
+        self.label.place_forget()
+
+    def refresh(self):
+        """
+        Redraw the overlay and schedule the next redraw.
+        """
+        lines = [self.HEADER] + [format_record(record) for record in reversed(self.recent.records())]
+        self.label.config(text="\n".join(lines))
+        self.refresh_job = self.root.after(self.refresh_interval, self.refresh)
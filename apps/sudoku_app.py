@@ -9,11 +9,21 @@ Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linu
 Created: Tuesday, December 10th, 2024
 """
 from apps.sparql_app import get_answer
+from apps.sudoku_engine import SudokuEngine
+from apps.sudoku_cache import SolutionCache
+from apps.sudoku_conflicts import ConflictIndex
+from apps.sudoku_grid import SudokuGrid, LOCKED
+from apps.sudoku_generator import generate_puzzle
+from apps.puzzle_bank import bank_directory, shared_bank
+from apps.solver_dispatcher import SolverDispatcher
+from apps.solver_budget import load_budgets, run_with_budget
+from apps.solver_stats import labelled
+from apps.stats_overlay import StatsOverlay
 import tkinter as tk
 from tkinter import messagebox, OptionMenu, StringVar, simpledialog
-from random import sample
+from functools import partial
+import os
 from PIL import Image, ImageTk
-import clingo
 
 class SudokuApp:
     """
@@ -21,12 +31,15 @@ class SudokuApp:
     ---------------
     This class represents the Sudoku game using tkinter for GUI and Clingo for solving the grid.
     """
-    def __init__(self, root):
+    def __init__(self, root, banks=None):
         """
         Initializes the Sudoku game application.
 
         Args:
             The __init__ function takes the root (tk.Tk) which is the tkinter window object as an arg.
+            banks (dict): The (PuzzleBank, PuzzleBankProducer) of every difficulty level that is
+                served from a bank, with None for a bank without producer. None opens the shared
+                banks of the bank directory from conf.yaml, {} generates every puzzle on demand.
         """
         self.root = root
         self.root.title("Sudoku Game")
@@ -41,16 +54,44 @@ class SudokuApp:
         self.canvas.create_image(0, 0, image=self.bg_photo, anchor="nw")
 
         self.difficulties = {
-            "Easy": 3,
-            "Medium": 5,
-            "Hard": 6
+            "Easy": 0.45,
+            "Medium": 0.37,
+            "Hard": 0
         }
         self.difficulty_var = StringVar(self.root)
         self.difficulty_var.set("Easy")
 
-        self.entries = [[None for _ in range(9)] for _ in range(9)]
-        self.user_inputs = []
+        self.box_sizes = {
+            "9x9": 3,
+            "16x16": 4,
+            "25x25": 5
+        }
+        self.box_size_var = StringVar(self.root)
+        self.box_size_var.set("9x9")
+        # Proving uniqueness on 25x25 grids gets very slow once about half of the cells are empty
+        self.min_clue_share = {5: 0.5}
+        self.n = self.box_sizes[self.box_size_var.get()]
+        self.size = self.n * self.n
+
+        self.engine = SudokuEngine()
+        self.backend = "auto"
+        self.budgets = load_budgets()
+        self.solution_cache = SolutionCache(lambda board, budget=None: self.engine.solve(board, self.backend, budget))
+        self.hint_mode = "cautious"
+        self.hint_cache = None
+        self.session = self.engine.session(self.n)
+        self.banks = self.open_banks() if banks is None else banks
+        self.grid = None
+        self.user_inputs = set()
+        self.conflicts = ConflictIndex(self.n)
+        self.conflict_color = "#f4a6a6"
+        self.validate_delay = 500
+        self.validate_job = None
         self.score = 0
+        self.dispatcher = SolverDispatcher(self.root, on_busy=self.set_busy)
+        self.busy_label = tk.Label(self.root, text="Solving...", bg="white", fg="black")
+        self.stats_overlay = StatsOverlay(self.root)
+        self.root.bind("<F12>", lambda event: self.stats_overlay.toggle())
         self.create_grid()
         self.create_buttons()
         self.generate_sudoku()
@@ -61,136 +102,198 @@ class SudokuApp:
         """
         Create the Sudoku grid.
 
-        This method initializes a 9x9 grid of entry widgets for the Sudoku game.
-        Each cell is represented by a tkinter "Entry widget", which is placed on the grid.
-        Validation bindings are added to each entry to ensure valid input (validated by the validate_input function).
+        This method draws an empty size x size grid on the canvas of the game. The first call creates the
+        SudokuGrid, which keeps the cell model and handles keyboard and mouse input on the canvas (see
+        SudokuGrid.key_pressed for the accepted input). Later calls redraw it for the current size, so no
+        widgets are created or leaked when the difficulty or the size of the grid changes.
+        """
+        self.user_inputs = set()
+        self.conflicts = ConflictIndex(self.n)
+        if self.grid is None:
+            grid_size = 400
+            start_x = (self.width - grid_size) // 2
+            start_y = (self.height - grid_size) // 2
+            self.grid = SudokuGrid(self.canvas, start_x, start_y, grid_size, self.n, on_change=self.track_user_input)
+        else:
+            self.grid.resize(self.n)
+
+    def track_user_input(self, row, col):
         """
-        grid_size = 400
-        cell_size = grid_size // 9
-        start_x = (self.width - grid_size) // 2
-        start_y = (self.height - grid_size) // 2
+        Track user input in the Sudoku grid.
 
-        for row in range(9):
-            for col in range(9):
-                entry = tk.Entry(self.root, width=2, font=('Arial', 18), justify='center')
-                entry.place(x=start_x + col * cell_size, y=start_y + row * cell_size, width=cell_size, height=cell_size)
-                self.entries[row][col] = entry
-                entry.bind("<KeyPress>", lambda e, r=row, c=col: self.validate_input(e, r, c))
+        This method keeps track of the cells where the user has entered values.
+        If a value is entered in a cell, the cell's coordinates are added to the user_inputs set.
+        If a value is removed from a cell, the cell's coordinates are removed from the user_inputs set.
+        The conflict index is updated with the new value, so cells that clash with another cell in
+        their row, column or box are highlighted right away, and the ASP check for deeper
+        unsolvability is scheduled to run once the user has stopped typing.
 
-    def validate_input(self, event, row, col):
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
         """
-        Validate input for Sudoku grid cells.
+        value = self.grid.get(row, col)
+        if value:
+            self.user_inputs.add((row, col))
+        else:
+            self.user_inputs.discard((row, col))
+        self.update_conflicts(row, col, value)
+        self.schedule_validation()
 
-        This method guarantees that only valid input is allowed in the Sudoku grid cells.
-        It blocks non-numeric input, prevents the entry of '0', and allows only single digits.
-        It also allows backspace and delete keys for editing.
+    def update_conflicts(self, row, col, value):
+        """
+        Update the conflict index with the value of a cell and highlight the cells whose conflict status changed.
 
         Args:
-            event (tkinter.Event): The event object containing information about the key press.
-            row (int): The row index of the cell being validated.
-            col (int): The column index of the cell being validated.
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): The new value of the cell, 0 if the cell was cleared.
+        """
+        for cell in self.conflicts.set(row, col, value):
+            self.highlight_cell(*cell)
 
-        Returns:
-            The string 'break' to block the input. Or "None" of type None to allow the input.
-        """
-        if event.char.isdigit():
-            if event.char == '0':
-                return 'break'
-            if self.entries[row][col].get():
-                return 'break'
-            self.root.after(0, self.track_user_input, row, col)
-            return None
-        if event.keysym in ('BackSpace', 'Delete'):
-            self.root.after(0, self.track_user_input, row, col)
-            return None
-        return 'break'
+    def reset_conflicts(self, board):
+        """
+        Rebuild the conflict index from a board and reset the highlighting of every cell.
 
-    def track_user_input(self, row, col):
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
         """
-        Track user input in the Sudoku grid.
+        self.conflicts.load(board)
+        for row in range(self.size):
+            for col in range(self.size):
+                self.highlight_cell(row, col)
 
-        This method keeps track of the cells where the user has entered values.
-        If a value is entered in a cell, the cell's coordinates are added to the user_inputs list.
-        If a value is removed from a cell, the cell's coordinates are removed from the user_inputs list.
+    def highlight_cell(self, row, col):
+        """
+        Color a cell according to whether its value clashes with another cell in its row, column or box.
 
         Args:
             row (int): The row index of the cell.
             col (int): The column index of the cell.
         """
-        value = self.entries[row][col].get()
-        if value:
-            self.user_inputs.append((row, col))
-        else:
-            self.user_inputs = [(r, c) for r, c in self.user_inputs if not (r == row and c == col)]
+        color = self.conflict_color if (row, col) in self.conflicts.conflicting else None
+        self.grid.set_background(row, col, color)
+
+    def schedule_validation(self):
+        """
+        Schedule the ASP validation of the board after a short pause in the user input.
+
+        Every call cancels the validation scheduled before it, so the solver only runs once the user
+        has stopped typing for validate_delay milliseconds. If the board already has a direct conflict
+        the validation is skipped, since the conflicting cells are highlighted anyway.
+        """
+        self.cancel_validation()
+        if self.conflicts.is_consistent():
+            self.validate_job = self.root.after(self.validate_delay, self.validate_puzzle)
+
+    def cancel_validation(self):
+        """
+        Cancel the scheduled ASP validation, if there is one.
+        """
+        if self.validate_job is not None:
+            self.root.after_cancel(self.validate_job)
+            self.validate_job = None
+
+    def open_banks(self):
+        """
+        Open the shared puzzle bank of every difficulty level, together with its producer.
+
+        Returns:
+            dict: The (PuzzleBank, PuzzleBankProducer) of every difficulty level.
+        """
+        directory = bank_directory()
+        return {
+            name: shared_bank(os.path.join(directory, f"sudoku_{name.lower()}.bin"), self.clue_count(name, 81),
+                              budget=self.budgets["generation"])
+            for name in self.difficulties
+        }
 
     def generate_sudoku(self):
         """
         Generate a new Sudoku puzzle.
 
-        This method generates a new Sudoku puzzle based on the selected difficulty level.
-        It creates a fully solved Sudoku board and then removes a certain number of cells
-        to create the puzzle. The number of cells removed is based on the difficulty level.
+        This method takes the next puzzle of the selected difficulty level from the puzzle bank,
+        which is refilled in the background. Only if the bank is empty, or for grids larger than
+        9x9 which the bank does not store, is a puzzle generated, in a worker process so that the
+        window stays responsive.
         The generated puzzle is displayed in the grid, with the initial numbers set to read-only.
         """
-        base = 3
-        side = base * base
+        difficulty = self.difficulty_var.get()
+        record = None
+        if self.n == 3 and difficulty in self.banks:
+            bank, producer = self.banks[difficulty]
+            record = bank.take()
+            if producer is not None:
+                producer.notify()
+        if record is not None:
+            self.show_puzzle(record[0])
+        else:
+            clues = self.clue_count(difficulty, self.size * self.size)
+            self.dispatcher.submit(labelled, "generation", generate_puzzle, self.n, clues, None, self.budgets["generation"],
+                                   on_done=lambda puzzle: self.show_puzzle(puzzle[0]), heavy=True)
 
-        def pattern(r, c):
-            return (base * (r % base) + r // base + c) % side
+    def show_puzzle(self, board):
+        """
+        Display a new puzzle in the grid, with the initial numbers set to read-only.
 
-        def shuffle(s):
-            return sample(s, len(s))
+        Args:
+            board (list): The puzzle as a list of rows, with 0 for empty cells.
+        """
+        self.grid.load(board)
+        self.reset_conflicts(board)
 
-        r_base = range(base)
-        rows = [g * base + r for g in shuffle(r_base) for r in shuffle(r_base)]
-        cols = [g * base + c for g in shuffle(r_base) for c in shuffle(r_base)]
-        nums = shuffle(range(1, base * base + 1))
+    def clue_count(self, difficulty, cells):
+        """
+        Get the number of clues a puzzle of the given difficulty keeps.
 
-        board = [[nums[pattern(r, c)] for c in cols] for r in rows]
+        The difficulty level is the share of cells that keep their clue, where 0 means that clues
+        are removed until none can be removed without losing the unique solution. Large grids
+        keep at least the share of clues given in min_clue_share.
 
-        empty_count_per_row = self.difficulties[self.difficulty_var.get()]
-        for row in range(9):
-            empty_positions = sample(range(9), empty_count_per_row)
-            for col in empty_positions:
-                board[row][col] = 0
+        Args:
+            difficulty (str): The name of the difficulty level.
+            cells (int): The number of cells of the grid.
 
-        for row in range(9):
-            for col in range(9):
-                if board[row][col] != 0:
-                    self.entries[row][col].insert(0, board[row][col])
-                    self.entries[row][col].config(state='readonly')
+        Returns:
+            int: The number of clues, 0 for a minimal puzzle.
+        """
+        share = max(self.difficulties[difficulty], self.min_clue_share.get(self.n, 0))
+        return round(share * cells)
 
     def solve(self):
         """
         Solve the Sudoku puzzle.
 
-        This method uses the ASP solver to find a solution for the current Sudoku puzzle.
-        It retrieves the current game state as facts, solves the puzzle, and fills in the solution
-        in the grid. If no solution exists, it shows an error message.
+        This method uses the Sudoku engine to find a solution for the current Sudoku puzzle.
+        It reads the current board from the grid and solves it with the engine (or takes the solution of
+        an equivalent board from the solution cache) on the solver dispatcher, so the window stays
+        responsive while the solver runs. The solution is filled in by show_solution.
         """
         messagebox.showinfo("Solve", "Solve button clicked")
-        for row, col in self.user_inputs:
-            self.entries[row][col].config(state='normal')
-            self.entries[row][col].delete(0, tk.END)
-        self.user_inputs.clear()
-        self.user_inputs = []
-        facts = self.get_current_facts()
-        solutions = self.asp_solver(facts)
+        self.clear()
+        self.dispatcher.submit(run_with_budget, self.budgets["solve"],
+                               partial(labelled, "solve", self.solution_cache.solve), self.get_current_board(),
+                               on_done=lambda outcome: self.with_outcome(outcome, "Solve", self.show_solution),
+                               interrupt=self.engine.interrupt)
 
-        if not solutions:
+    def show_solution(self, solution):
+        """
+        Fill the solution of the puzzle into the grid. If no solution exists, it shows an error message.
+
+        Args:
+            solution (list): The solved board, or None if the puzzle has no solution.
+        """
+        if not solution:
             messagebox.showerror("No solution exists!")
             return
 
-        solution = solutions[0]
-        for symbol in solution:
-            if symbol.name == "sudoku" and len(symbol.arguments) == 3:
-                x, y, v = symbol.arguments
-                row, col, value = int(x.number), int(y.number), int(v.number)
-
-                if not self.entries[row - 1][col - 1].get():
-                    self.entries[row - 1][col - 1].insert(0, value)
-                    self.entries[row - 1][col - 1].config(state='readonly')
-                    self.user_inputs.append((row - 1, col - 1))
+        for row, values in enumerate(solution):
+            for col, value in enumerate(values):
+                if not self.grid.get(row, col):
+                    self.grid.set(row, col, value, LOCKED)
+                    self.user_inputs.add((row, col))
+                    self.update_conflicts(row, col, value)
 
     def clear(self):
         """
@@ -199,11 +302,11 @@ class SudokuApp:
         This method clears all user-entered values from the Sudoku grid,
         resetting the cells to their initial state.
         """
+        self.cancel_validation()
         for row, col in self.user_inputs:
-            self.entries[row][col].config(state='normal')
-            self.entries[row][col].delete(0, tk.END)
+            self.grid.set(row, col, 0)
+            self.update_conflicts(row, col, 0)
         self.user_inputs.clear()
-        self.user_inputs = []
 
     def new_game(self):
         """
@@ -212,36 +315,11 @@ class SudokuApp:
         This method clears the current grid, resets the game state by calling the "reset" function, 
         and generates a new Sudoku puzzle by calling the "generate_sudoku" function.        
         """
-        for row in range(9):
-            for col in range(9):
-                self.entries[row][col].config(state='normal')
-                self.entries[row][col].delete(0, tk.END)
+        self.grid.load([[0] * self.size for _ in range(self.size)])
+        self.dispatcher.cancel()
         self.clear()
         self.generate_sudoku()
 
-    def asp_solver(self, facts):
-        """
-        Solve the Sudoku puzzle using the Clingo ASP solver.
-
-        This method creates a Clingo control object, loads the ASP program and facts,
-        grounds the program, and solves it. The solutions are returned as a list of symbols.
-
-        Args:
-            facts (str): The facts representing the current game state.
-
-        Returns:
-            list: A list of solutions provided by the ASP solver.
-        """
-        ctl = clingo.Control()
-        ctl.add("base", [], facts)
-        with open("ASPSolvers/sudokuSolver.lp", encoding="UTF-8") as f:
-            ctl.add("base", [], f.read())
-        ctl.ground([("base", [])])
-
-        models = []
-        ctl.solve(on_model=lambda model: models.append(model.symbols(atoms=True)))
-        return models
-
     def generate_hint_question(self):
         """
         Provides a hint to the user by asking a question from the YAGO knowledge base.
@@ -283,65 +361,171 @@ class SudokuApp:
         """
         Generate a hint for the next move in the Sudoku puzzle.
 
-        This method uses the ASP solver to find a solution for the current Sudoku puzzle.
-        It retrieves the current game state as facts, solves the puzzle, and provides a hint
-        for the next move. If no solution exists, it shows an error message.
+        In the "cautious" hint mode this method asks the solver session for every cell that is forced
+        by the current clues, i.e. has the same value in all solutions, and suggests the forced cell
+        with the fewest candidates left. The forced cells are cached against the board state, so
+        repeated hints are served from the cache until the user changes a cell.
+        In the "solution" hint mode it solves the puzzle and suggests the first empty cell instead.
+        The solver runs on the solver dispatcher and the hint is shown by show_hint.
+        """
+        board = self.get_current_board()
+        if self.hint_mode == "cautious":
+            key = self.board_key(board)
+            if self.hint_cache is not None and self.hint_cache[0] == key:
+                self.show_hint(board, self.hint_cache[1])
+                return
+            self.dispatcher.submit(run_with_budget, self.budgets["hint"], partial(labelled, "hint", self.session.forced_cells), board,
+                                   on_done=lambda outcome: self.with_outcome(outcome, "Hint", lambda forced: self.show_hint(board, forced)),
+                                   interrupt=self.session.interrupt)
+            return
+
+        def show_solution_hint(solution):
+            forced = None if solution is None else {
+                (row, col): solution[row][col]
+                for row in range(self.size) for col in range(self.size) if not board[row][col]
+            }
+            self.show_hint(board, forced)
+
+        self.dispatcher.submit(run_with_budget, self.budgets["hint"], partial(labelled, "hint", self.solution_cache.solve), board,
+                               on_done=lambda outcome: self.with_outcome(outcome, "Hint", show_solution_hint),
+                               interrupt=self.engine.interrupt)
+
+    def show_hint(self, board, forced):
         """
-        facts = self.get_current_facts()
-        solutions = self.asp_solver(facts)
+        Suggest and fill in one of the forced cells of a board.
+
+        A forced value holds in every solution, so filling it in does not change the set of
+        solutions, and the remaining forced cells stay valid after a hint has been applied.
+        If the user has changed the grid since the hint was requested, the hint is dropped.
+
+        Args:
+            board (list): The board the hint was computed for.
+            forced (dict): The forced value of every forced empty cell by (row, col), or None if
+                the board has no solution.
+        """
+        if self.board_key(self.get_current_board()) != self.board_key(board):
+            return
+        if self.hint_mode == "cautious":
+            self.hint_cache = (self.board_key(board), forced)
 
-        if not solutions:
+        if forced is None:
             messagebox.showerror("Hint Error", "No solution exists!")
             return
+        if not forced:
+            messagebox.showinfo("Hint", "No hints available!")
+            return
+
+        if self.hint_mode == "cautious":
+            row, col = min(forced, key=lambda cell: (self.count_candidates(board, *cell), cell))
+        else:
+            row, col = min(forced)
+        value = forced.pop((row, col))
+        hint_message = f"Suggested number: {value} at row {row + 1}, column {col + 1}"
+        messagebox.showinfo("Hint", hint_message)
+        self.grid.set(row, col, value, LOCKED)
+        self.user_inputs.add((row, col))
+        self.update_conflicts(row, col, value)
+
+        if self.hint_mode == "cautious":
+            board[row][col] = value
+            self.hint_cache = (self.board_key(board), forced)
+
+    def board_key(self, board):
+        """
+        Get a hashable key for a board state.
 
-        solution = solutions[0]
-        for symbol in solution:
-            if symbol.name == "sudoku" and len(symbol.arguments) == 3:
-                x, y, v = symbol.arguments
-                row, col, value = int(x.number), int(y.number), int(v.number)
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
 
-                if not self.entries[row - 1][col - 1].get():
-                    hint_message = f"Suggested number: {value} at row {row}, column {col}"
-                    messagebox.showinfo("Hint", hint_message)
-                    self.entries[row - 1][col - 1].insert(0, value)
-                    self.entries[row - 1][col - 1].config(state='readonly')
-                    self.user_inputs.append((row - 1, col - 1))
-                    return
+        Returns:
+            tuple: The board as a tuple of rows.
+        """
+        return tuple(tuple(row) for row in board)
 
-        messagebox.showinfo("Hint", "No hints available!")
+    def count_candidates(self, board, row, col):
+        """
+        Count the values that do not yet appear in the row, column or box of a cell.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            int: The number of candidate values of the cell.
+        """
+        box_row, box_col = row - row % self.n, col - col % self.n
+        used = set(board[row])
+        used.update(board[r][col] for r in range(self.size))
+        used.update(board[r][c] for r in range(box_row, box_row + self.n) for c in range(box_col, box_col + self.n))
+        used.discard(0)
+        return self.size - len(used)
 
     def validate_puzzle(self):
         """
         Validate the current Sudoku puzzle with ASP.
 
-        This method uses the ASP solver to check if the current Sudoku puzzle is solvable.
+        This method uses the Sudoku engine, behind the solution cache, to check if the current Sudoku puzzle is solvable.
+        It runs after a pause in the user input (see schedule_validation) and only looks for deeper
+        unsolvability, direct conflicts are already caught by the conflict index.
         If the puzzle is unsolvable, it shows an error message.
         """
-        facts = self.get_current_facts()
-        solutions = self.asp_solver(facts)
-        if not solutions:
-            messagebox.showerror("Invalid Move", "Puzzle is unsolvable!")
+        self.validate_job = None
+        if not self.conflicts.is_consistent():
+            return
+
+        def show_validation(solvable):
+            if not solvable:
+                messagebox.showerror("Invalid Move", "Puzzle is unsolvable!")
 
-    def get_current_facts(self):
+        self.dispatcher.submit(run_with_budget, self.budgets["validate"],
+                               partial(labelled, "validate", self.solution_cache.is_solvable), self.get_current_board(),
+                               on_done=lambda outcome: self.with_outcome(outcome, None, show_validation),
+                               interrupt=self.engine.interrupt)
+
+    def with_outcome(self, outcome, title, callback):
         """
-        Generate facts representing the current game state.
+        Pass the value of a solver outcome on to a callback, or tell the user that the solver ran
+        out of its budget.
 
-        This method creates a list of facts based on the current state of the Sudoku grid,
-        including the initial numbers entered by the user.
+        Args:
+            outcome (SolveOutcome): The outcome of a solver call run with run_with_budget.
+            title (str): The title of the message shown if the answer is unknown, None to drop
+                unknown outcomes silently, e.g. for the validation that runs while the user types.
+            callback (callable): Called with the value of the outcome if the solver finished.
+        """
+        if outcome.unknown:
+            if title is not None:
+                messagebox.showwarning(title, f"{outcome.describe()} The answer is unknown.")
+            return
+        callback(outcome.value)
+
+    def set_busy(self, busy):
+        """
+        Show or hide the busy indicator while the solver dispatcher is running a job.
 
         Args:
-            None
+            busy (bool): True while a job is running.
+        """
+        if busy:
+            grid_size = 400
+            self.busy_label.place(x=(self.width - grid_size) // 2, y=(self.height - grid_size) // 2 - 30)
+            self.root.config(cursor="watch")
+        else:
+            self.busy_label.place_forget()
+            self.root.config(cursor="")
+
+    def get_current_board(self):
+        """
+        Read the current game state from the grid.
+
+        This method reads every cell of the Sudoku grid, including the initial numbers and
+        the numbers entered by the user, into a board that can be passed to the engine.
 
         Returns:
-            str: A string containing the facts for the current game state.
+            list: The board as a list of rows, with 0 for empty cells.
         """
-        facts = []
-        for row in range(9):
-            for col in range(9):
-                value = self.entries[row][col].get()
-                if value:
-                    facts.append(f"initial({row + 1},{col + 1},{((row // 3) * 3 + col // 3)},{value}).")
-        return "\n".join(facts)
+        return self.grid.board()
 
     def create_buttons(self, button_width=80, spacing=10):
         """
@@ -372,6 +556,13 @@ class SudokuApp:
 
         def update_difficulty(selected):
             self.difficulty_var.set(selected)
+            self.new_game()
+
+        def update_box_size(selected):
+            self.box_size_var.set(selected)
+            self.n = self.box_sizes[selected]
+            self.size = self.n * self.n
+            self.session = self.engine.session(self.n)
             self.create_grid()
             self.new_game()
 
@@ -379,6 +570,10 @@ class SudokuApp:
         difficulty_menu.config(fg="black")
         difficulty_menu.place(x=start_x, y=y_position + 40)
 
+        box_size_menu = OptionMenu(self.root, self.box_size_var, *self.box_sizes.keys(), command=update_box_size)
+        box_size_menu.config(fg="black")
+        box_size_menu.place(x=start_x + button_width + spacing, y=y_position + 40)
+
     def toggle_sparql(self):
         """
         Toggle the use of SPARQL queries.
@@ -397,6 +592,12 @@ class SudokuApp:
         This method destroys the current game widgets and initializes the main menu.
         """
         from main import MainMenu
+        self.cancel_validation()
+        self.dispatcher.shutdown()
+        self.engine.close()
+        self.stats_overlay.hide()
+        self.root.unbind("<F12>")
+        self.root.config(cursor="")
         for widget in self.root.winfo_children():
             widget.destroy()
         self.root.update_idletasks()
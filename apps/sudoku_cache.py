@@ -0,0 +1,356 @@
+"""
+Sudoku Solution Cache
+=====================
+
+This module implements an LRU cache of Sudoku solutions keyed by a canonical form of the board.
+Two boards share a cache entry if one can be turned into the other by Sudoku symmetries:
+transposition, permuting bands and stacks, permuting rows within a band and columns within a
+stack, and relabeling digits.
+
+The canonical form is the lexicographically smallest image of the board under these symmetries,
+reading the board row by row with empty cells as 0 and digits relabeled in order of first
+appearance. It is built one row at a time, keeping only the partial transforms that produce the
+smallest rows so far. If ties keep too many partial transforms alive (very sparse boards, large
+boxes), the board is only canonicalized under digit relabeling. Every key is still an image of
+its board, so a cached solution is always mapped back correctly.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+from collections import OrderedDict
+from itertools import permutations, product
+from math import factorial
+from apps.sudoku_engine import box_size
+
+
+def _relabel_row(values, cols, labels, next_label):
+    """
+    Read a row in column order and relabel its digits in order of first appearance.
+
+    Args:
+        values (tuple): The values of the source row.
+        cols (tuple): The source column of every target column.
+        labels (list): The label of every digit so far, 0 if the digit has no label yet.
+        next_label (int): The label given to the next new digit.
+
+    Returns:
+        tuple: The relabeled row, the extended labels and the next free label.
+    """
+    labels = labels.copy()
+    row = []
+    for col in cols:
+        value = values[col]
+        if value:
+            if not labels[value]:
+                labels[value] = next_label
+                next_label += 1
+            row.append(labels[value])
+        else:
+            row.append(0)
+    return tuple(row), labels, next_label
+
+
+def _first_row_columns(values, n):
+    """
+    Get every column order that makes a row lexicographically smallest.
+
+    Within one row all digits are different, so after relabeling only the positions of the empty
+    cells matter: the row is smallest with the stacks ordered by their number of empty cells,
+    most first, and the empty cells first within every stack.
+
+    Args:
+        values (tuple): The values of the row.
+        n (int): The box size of the board.
+
+    Returns:
+        list: The stacks as (number of empty cells, empty columns, filled columns), ordered by
+        their number of empty cells, most first.
+    """
+    stacks = []
+    for stack in range(n):
+        cols = range(stack * n, (stack + 1) * n)
+        empty = tuple(col for col in cols if not values[col])
+        filled = tuple(col for col in cols if values[col])
+        stacks.append((len(empty), empty, filled))
+    stacks.sort(key=lambda stack: -stack[0])
+    return stacks
+
+
+def _count_first_row_columns(stacks):
+    """
+    Count the column orders that tie for the smallest first row.
+
+    Args:
+        stacks (list): The stacks as returned by _first_row_columns.
+
+    Returns:
+        int: The number of tied column orders.
+    """
+    count = 1
+    sizes = {}
+    for empties, empty, filled in stacks:
+        sizes[empties] = sizes.get(empties, 0) + 1
+        count *= factorial(len(empty)) * factorial(len(filled))
+    for group in sizes.values():
+        count *= factorial(group)
+    return count
+
+
+def _expand_first_row_columns(stacks):
+    """
+    Generate every column order that ties for the smallest first row.
+
+    Args:
+        stacks (list): The stacks as returned by _first_row_columns.
+
+    Yields:
+        tuple: The source column of every target column.
+    """
+    groups = []
+    for empties, empty, filled in stacks:
+        if groups and groups[-1][0] == empties:
+            groups[-1][1].append((empty, filled))
+        else:
+            groups.append((empties, [(empty, filled)]))
+
+    group_orders = [list(permutations(members)) for _, members in groups]
+    for order in product(*group_orders):
+        ordered = [stack for group in order for stack in group]
+        parts = [list(product(permutations(empty), permutations(filled))) for empty, filled in ordered]
+        for choice in product(*parts):
+            yield tuple(col for empty, filled in choice for col in empty + filled)
+
+
+def _relabel_only(board):
+    """
+    Canonicalize a board under digit relabeling only.
+
+    Args:
+        board (list): The board as a list of rows, with 0 for empty cells.
+
+    Returns:
+        tuple: The canonical key and the transform that maps the board onto it.
+    """
+    size = len(board)
+    labels, next_label = [0] * (size + 1), 1
+    key = []
+    cols = tuple(range(size))
+    for values in board:
+        row, labels, next_label = _relabel_row(tuple(values), cols, labels, next_label)
+        key.append(row)
+    return tuple(key), (False, tuple(range(size)), cols, _complete_labels(labels, next_label))
+
+
+def _complete_labels(labels, next_label):
+    """
+    Give the digits that do not appear on the board the remaining labels in increasing order.
+
+    Args:
+        labels (list): The label of every digit, 0 if the digit has no label yet.
+        next_label (int): The next free label.
+
+    Returns:
+        tuple: The label of every digit, index 0 unused.
+    """
+    labels = list(labels)
+    for digit in range(1, len(labels)):
+        if not labels[digit]:
+            labels[digit] = next_label
+            next_label += 1
+    return tuple(labels)
+
+
+def canonical_form(board, limit=20000):
+    """
+    Compute the canonical form of a board under Sudoku symmetries.
+
+    Args:
+        board (list): The board as a list of rows, with 0 for empty cells.
+        limit (int): The maximum number of tied partial transforms kept alive before falling
+            back to canonicalizing under digit relabeling only.
+
+    Returns:
+        tuple: The canonical key (a tuple of rows) and the transform that maps the board onto it,
+        as (transpose, source rows, source columns, digit labels).
+    """
+    n = box_size(board)
+    size = n * n
+    grids = {
+        False: tuple(tuple(row) for row in board),
+        True: tuple(tuple(board[row][col] for row in range(size)) for col in range(size)),
+    }
+
+    best, tied = None, []
+    for transpose, grid in grids.items():
+        for source in range(size):
+            stacks = _first_row_columns(grid[source], n)
+            row, _, _ = _relabel_row(grid[source], next(_expand_first_row_columns(stacks)), [0] * (size + 1), 1)
+            if best is None or row < best:
+                best, tied = row, []
+            if row == best:
+                tied.append((transpose, source, stacks))
+    if sum(_count_first_row_columns(stacks) for _, _, stacks in tied) > limit:
+        return _relabel_only(board)
+
+    candidates = []
+    for transpose, source, stacks in tied:
+        for cols in _expand_first_row_columns(stacks):
+            _, labels, next_label = _relabel_row(grids[transpose][source], cols, [0] * (size + 1), 1)
+            candidates.append((transpose, (source,), cols, labels, next_label))
+    key = [best]
+
+    for position in range(1, size):
+        best, extended = None, []
+        for transpose, rows, cols, labels, next_label in candidates:
+            if position % n:
+                band = rows[position - position % n] // n
+                options = [row for row in range(band * n, (band + 1) * n) if row not in rows]
+            else:
+                used = {row // n for row in rows}
+                options = [row for row in range(size) if row // n not in used]
+            for source in options:
+                row, new_labels, new_next = _relabel_row(grids[transpose][source], cols, labels, next_label)
+                if best is not None and row > best:
+                    continue
+                if best is None or row < best:
+                    best, extended = row, []
+                extended.append((transpose, rows + (source,), cols, new_labels, new_next))
+                if len(extended) > limit:
+                    return _relabel_only(board)
+        candidates = extended
+        key.append(best)
+
+    transpose, rows, cols, labels, next_label = candidates[0]
+    return tuple(key), (transpose, rows, cols, _complete_labels(labels, next_label))
+
+
+def apply_transform(board, transform):
+    """
+    Map a board with a transform returned by canonical_form.
+
+    Args:
+        board (list): The board as a list of rows, with 0 for empty cells.
+        transform (tuple): The transform as (transpose, source rows, source columns, digit labels).
+
+    Returns:
+        list: The transformed board.
+    """
+    transpose, rows, cols, labels = transform
+    grid = [list(row) for row in zip(*board)] if transpose else board
+    return [[labels[grid[row][col]] if grid[row][col] else 0 for col in cols] for row in rows]
+
+
+def restore_transform(board, transform):
+    """
+    Map a board back with the inverse of a transform returned by canonical_form.
+
+    Args:
+        board (list): The transformed board as a list of rows, with 0 for empty cells.
+        transform (tuple): The transform as (transpose, source rows, source columns, digit labels).
+
+    Returns:
+        list: The board before the transform.
+    """
+    transpose, rows, cols, labels = transform
+    size = len(board)
+    digits = [0] * (size + 1)
+    for digit in range(1, size + 1):
+        digits[labels[digit]] = digit
+    grid = [[0] * size for _ in range(size)]
+    for i, row in enumerate(rows):
+        for j, col in enumerate(cols):
+            grid[row][col] = digits[board[i][j]]
+    return [list(row) for row in zip(*grid)] if transpose else grid
+
+
+class SolutionCache:
+    """
+    SolutionCache Class
+    -------------------
+    An LRU cache of solutions in front of a Sudoku solver. Boards are looked up by their canonical
+    form, so boards that are equivalent under Sudoku symmetries share one entry, and a hit is
+    mapped back onto the board that was asked for.
+    """
+
+    def __init__(self, solver, maxsize=256):
+        """
+        Initializes an empty cache.
+
+        Args:
+            solver (callable): Solves a board, returning the solved board or None.
+            maxsize (int): The maximum number of cached solutions.
+        """
+        self.solver = solver
+        self.maxsize = maxsize
+        self.entries = OrderedDict()
+        self.aliases = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def solve(self, board, budget=None):
+        """
+        Solve a board, using the cached solution of an equivalent board if there is one.
+
+        The canonical form of the last boards asked for is remembered as well, so asking for the
+        same board again does not even canonicalize it. A solve that runs out of budget or is
+        interrupted raises BudgetExceeded and is not cached, so a cancelled solve is never taken
+        for a board without a solution.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            budget (SolveBudget): Passed on to the solver on a cache miss, None for no limit.
+
+        Returns:
+            list: The solved board, or None if the board has no solution.
+        """
+        board_key = tuple(tuple(row) for row in board)
+        if board_key in self.aliases:
+            self.aliases.move_to_end(board_key)
+            key, transform = self.aliases[board_key]
+        else:
+            key, transform = canonical_form(board)
+            self.aliases[board_key] = (key, transform)
+            if len(self.aliases) > self.maxsize:
+                self.aliases.popitem(last=False)
+
+        if key in self.entries:
+            self.hits += 1
+            self.entries.move_to_end(key)
+            solution = self.entries[key]
+        else:
+            self.misses += 1
+            key_board = [list(row) for row in key]
+            solution = self.solver(key_board) if budget is None else self.solver(key_board, budget=budget)
+            self.entries[key] = solution
+            if len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+        return None if solution is None else restore_transform(solution, transform)
+
+    def is_solvable(self, board, budget=None):
+        """
+        Check whether a board has a solution, using the cache.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            budget (SolveBudget): Passed on to the solver on a cache miss, None for no limit.
+
+        Returns:
+            bool: True if the board has at least one solution.
+        """
+        return self.solve(board, budget) is not None
+
+    def clear(self):
+        """
+        Drop every cached solution and reset the counters.
+        """
+        self.entries.clear()
+        self.aliases.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def info(self):
+        """
+        Returns:
+            dict: The hits, misses, current size and maximum size of the cache.
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self.entries), "maxsize": self.maxsize}
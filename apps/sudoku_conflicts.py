@@ -0,0 +1,160 @@
+"""
+Sudoku Conflict Index
+=====================
+
+This module keeps track of the digits in every row, column and box of a Sudoku board while the
+board is being edited. Each unit keeps a count per digit and a bitmask of the digits it contains
+(bit v-1 set if v is present), so a direct conflict, i.e. the same digit twice in a row, column
+or box, is detected in O(1) on every keystroke without asking the solver.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+from apps.sudoku_engine import box_index
+
+
+class ConflictIndex:
+    """
+    ConflictIndex Class
+    -------------------
+    Per-row, per-column and per-box digit counts and bitmasks of a Sudoku board, together with the
+    set of cells that are currently in a direct conflict.
+    """
+
+    def __init__(self, n=3):
+        """
+        Initializes an index for an empty board.
+
+        Args:
+            n (int): The box size of the board.
+        """
+        self.n = n
+        self.size = n * n
+        self._reset()
+
+    def _reset(self):
+        """
+        Clear the counts, masks and conflicts, as for an empty board.
+        """
+        self.counts = [[0] * (self.size + 1) for _ in range(3 * self.size)]
+        self.masks = [0] * (3 * self.size)
+        self.values = {}
+        self.conflicting = set()
+        self.duplicates = 0
+
+    def units(self, row, col):
+        """
+        Get the indices of the row, column and box of a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            tuple: The unit indices of the row, the column and the box.
+        """
+        return row, self.size + col, 2 * self.size + box_index(row, col, self.n)
+
+    def load(self, board):
+        """
+        Reset the index to the values of a board.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+        """
+        self._reset()
+        for row, values in enumerate(board):
+            for col, value in enumerate(values):
+                if value:
+                    self.set(row, col, value)
+
+    def conflicts_with(self, row, col, value):
+        """
+        Check whether placing a value in a cell would clash with a digit in its row, column or box.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): The value to place.
+
+        Returns:
+            bool: True if the value already appears in another cell of one of the cell's units.
+        """
+        if self.values.get((row, col)) == value:
+            return any(self.counts[unit][value] > 1 for unit in self.units(row, col))
+        bit = 1 << (value - 1)
+        return any(self.masks[unit] & bit for unit in self.units(row, col))
+
+    def is_consistent(self):
+        """
+        Returns:
+            bool: True if no digit appears twice in any row, column or box.
+        """
+        return self.duplicates == 0
+
+    def set(self, row, col, value):
+        """
+        Set or clear the value of a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): The new value of the cell, 0 to clear it.
+
+        Returns:
+            set: The cells whose conflict status changed.
+        """
+        old = self.values.get((row, col), 0)
+        if old == value:
+            return set()
+        units = self.units(row, col)
+        if old:
+            del self.values[(row, col)]
+            self._update(units, old, -1)
+        if value:
+            self.values[(row, col)] = value
+            self._update(units, value, 1)
+
+        changed = set()
+        for cell in self._cells(units, {old, value} - {0}) | {(row, col)}:
+            conflicting = self._is_conflicting(*cell)
+            if conflicting != (cell in self.conflicting):
+                changed.add(cell)
+                if conflicting:
+                    self.conflicting.add(cell)
+                else:
+                    self.conflicting.discard(cell)
+        return changed
+
+    def _update(self, units, value, delta):
+        """
+        Add delta to the count of a value in the given units and update their bitmasks.
+        """
+        bit = 1 << (value - 1)
+        for unit in units:
+            count = self.counts[unit][value]
+            self.counts[unit][value] = count + delta
+            if delta > 0 and count == 1 or delta < 0 and count == 2:
+                self.duplicates += delta
+            if count + delta:
+                self.masks[unit] |= bit
+            else:
+                self.masks[unit] &= ~bit
+
+    def _cells(self, units, digits):
+        """
+        Get the cells of the given units that hold one of the given digits.
+        """
+        row, col, box = units
+        box -= 2 * self.size
+        box_row, box_col = box // self.n * self.n, box % self.n * self.n
+        cells = [(row, c) for c in range(self.size)] + [(r, col - self.size) for r in range(self.size)]
+        cells += [(r, c) for r in range(box_row, box_row + self.n) for c in range(box_col, box_col + self.n)]
+        return {cell for cell in cells if self.values.get(cell) in digits}
+
+    def _is_conflicting(self, row, col):
+        """
+        Check whether the digit of a cell appears more than once in any of its units.
+        """
+        value = self.values.get((row, col))
+        return bool(value) and any(self.counts[unit][value] > 1 for unit in self.units(row, col))
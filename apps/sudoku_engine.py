@@ -0,0 +1,519 @@
+"""
+Sudoku Engine
+=============
+
+This module implements a headless Sudoku solving engine. It does not depend on tkinter, so it can
+be used from the GUI, from a worker process or from a script that solves puzzle packs in bulk.
+
+Boards are represented as lists of rows, where every row is a list of integers and 0 marks an
+empty cell.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import math
+import threading
+from functools import partial
+import clingo
+from apps.solver_budget import configure, wait
+from apps.solver_dispatcher import RunningSolves
+from apps.solver_service import program_text, shared_service
+from apps.solver_stats import SolverCall
+from apps.sudoku_propagation import PropagationSolver
+
+SUDOKU_PROGRAM = "ASPSolvers/sudokuSolver.lp"
+SESSION_PROGRAM = "ASPSolvers/sudokuSession.lp"
+
+
+def box_size(board):
+    """
+    Get the box size n of a board with n*n rows and columns.
+
+    Args:
+        board (list): The board as a list of rows.
+
+    Returns:
+        int: The box size of the board.
+    """
+    n = math.isqrt(len(board))
+    if n * n != len(board) or any(len(row) != len(board) for row in board):
+        raise ValueError(f"A board needs n*n rows and columns, got {len(board)} rows")
+    return n
+
+
+def box_index(row, col, n=3):
+    """
+    Get the index of the box a cell belongs to, counting row by row from the top left box.
+
+    Args:
+        row (int): The 0-based row index of the cell.
+        col (int): The 0-based column index of the cell.
+        n (int): The box size of the board.
+
+    Returns:
+        int: The 0-based index of the box.
+    """
+    return (row // n) * n + col // n
+
+
+def parse_board(text, n=3):
+    """
+    Parse a Sudoku board from its one-line string form.
+
+    For box sizes up to 3 every digit is a cell. For larger boards the cells are numbers separated
+    by whitespace or commas. In both forms '0' and '.' are read as empty cells, and for small
+    boards any other character (whitespace, separators) is ignored.
+
+    Args:
+        text (str): The puzzle as a string, e.g. "53..7....6..195..." for a 9x9 board.
+        n (int): The box size of the board.
+
+    Returns:
+        list: The board as a list of n*n rows of integers.
+    """
+    size = n * n
+    if n <= 3:
+        cells = [0 if char == "." else int(char) for char in text if char.isdigit() or char == "."]
+    else:
+        cells = [0 if token == "." else int(token) for token in text.replace(",", " ").split()]
+    if len(cells) != size * size:
+        raise ValueError(f"Expected {size * size} cells, got {len(cells)}")
+    return [cells[row * size:(row + 1) * size] for row in range(size)]
+
+
+def format_board(board):
+    """
+    Format a board in its one-line string form, using '.' for empty cells.
+
+    Args:
+        board (list): The board as a list of rows.
+
+    Returns:
+        str: The board as a string of one character per cell for boards up to 9x9, and of
+        space-separated cells for larger boards.
+    """
+    separator = "" if len(board) <= 9 else " "
+    return separator.join(str(value) if value else "." for row in board for value in row)
+
+
+def board_to_facts(board):
+    """
+    Generate the ASP facts for the clues of a board.
+
+    Args:
+        board (list): The board as a list of rows.
+
+    Returns:
+        str: A string containing one initial/3 fact per clue.
+    """
+    facts = []
+    for row, values in enumerate(board):
+        for col, value in enumerate(values):
+            if value:
+                facts.append(f"initial({row + 1},{col + 1},{value}).")
+    return "\n".join(facts)
+
+
+def symbols_to_board(symbols, size=9):
+    """
+    Convert the sudoku/3 atoms of a model into a board.
+
+    Args:
+        symbols (list): The symbols of a model.
+        size (int): The number of rows and columns of the board.
+
+    Returns:
+        list: The solved board as a list of rows.
+    """
+    board = [[0] * size for _ in range(size)]
+    for symbol in symbols:
+        if symbol.name == "sudoku" and len(symbol.arguments) == 3:
+            x, y, v = symbol.arguments
+            board[x.number - 1][y.number - 1] = v.number
+    return board
+
+
+class SudokuEngine:
+    """
+    SudokuEngine Class
+    ------------------
+    Solves Sudoku boards without any GUI involved, with one of several backends:
+
+        clingo       A new Clingo control per board for ASPSolvers/sudokuSolver.lp. The program is
+                     read from disk once per process.
+        session      A warm SudokuSession per box size, ground once and solved under assumptions.
+                     The sessions are taken from the session pools of the solver service and given
+                     back by close(), so the next engine finds them ground.
+        propagation  The pure-Python PropagationSolver, which needs no Clingo control at all.
+        auto         propagation for boards up to AUTO_PROPAGATION_BOX_SIZE, session above that.
+
+    The backend can be chosen per call.
+    """
+
+    BACKENDS = ("auto", "clingo", "session", "propagation")
+    AUTO_PROPAGATION_BOX_SIZE = 3
+
+    def __init__(self, program_path=SUDOKU_PROGRAM):
+        """
+        Initializes the engine and loads the ASP program.
+
+        Args:
+            program_path (str): The path to the Sudoku ASP program.
+        """
+        self.program = program_text(program_path)
+        self.sessions = {}
+        self.propagation = PropagationSolver()
+        self.running = RunningSolves()
+
+    def session(self, n):
+        """
+        Get the warm session for a box size, taking it from the session pool on first use.
+
+        Args:
+            n (int): The box size of the board.
+
+        Returns:
+            SudokuSession: The session for boards with box size n.
+        """
+        if n not in self.sessions:
+            self.sessions[n] = session_pool(n).acquire()
+        return self.sessions[n]
+
+    def close(self):
+        """
+        Give the sessions of the engine back to the session pools. The engine takes new ones if it
+        is used again.
+
+        A running solve of a session is interrupted, and the session is only given back once the
+        solve has returned. Solves that have yet to start must be stopped by the caller first, e.g.
+        by shutting down the SolverDispatcher that runs them.
+        """
+        sessions, self.sessions = self.sessions, {}
+        for n, session in sessions.items():
+            session.interrupt()
+            with session.lock:
+                session_pool(n).release(session)
+
+    def select_backend(self, board, backend="auto"):
+        """
+        Resolve the backend used for a board.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            backend (str): One of BACKENDS.
+
+        Returns:
+            str: The backend that will be used, never "auto".
+        """
+        if backend not in self.BACKENDS:
+            raise ValueError(f"Unknown backend {backend}, expected one of {', '.join(self.BACKENDS)}")
+        if backend == "auto":
+            return "propagation" if box_size(board) <= self.AUTO_PROPAGATION_BOX_SIZE else "session"
+        return backend
+
+    def solve(self, board, backend="auto", budget=None):
+        """
+        Solve a single board.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            backend (str): One of BACKENDS.
+            budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+        Returns:
+            list: The solved board, or None if the board has no solution.
+
+        Raises:
+            BudgetExceeded: If the solve ran out of budget or was interrupted.
+        """
+        backend = self.select_backend(board, backend)
+        if backend == "propagation":
+            return self.propagation.solve(board, budget)
+        if backend == "session":
+            return self.session(box_size(board)).solve(board, budget)
+
+        models = []
+        with SolverCall("clingo", f"{len(board)}x{len(board)}") as call:
+            with call.phase("load"):
+                ctl = clingo.Control(["--warn=none", "-c", f"n={box_size(board)}"])
+                ctl.add("base", [], self.program)
+                ctl.add("base", [], board_to_facts(board))
+            with call.phase("ground"):
+                ctl.ground([("base", [])])
+            configure(ctl, budget)
+            call.ctl = ctl
+            with call.phase("solve"):
+                with self.running.solve(ctl, on_model=lambda model: models.append(model.symbols(atoms=True)),
+                                        async_=True) as handle:
+                    result = call.result = wait(handle, budget)
+        if not result.satisfiable or not models:
+            return None
+        return symbols_to_board(models[0], len(board))
+
+    def interrupt(self):
+        """
+        Cancel every Clingo solve of the engine that is running, e.g. from another thread when the
+        result is no longer needed. The interrupted calls raise BudgetExceeded("interrupted").
+        """
+        self.running.cancel()
+        for session in list(self.sessions.values()):
+            session.interrupt()
+
+    def is_solvable(self, board, backend="auto", budget=None):
+        """
+        Check whether the clues of a board can still be completed to a solution.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            backend (str): One of BACKENDS.
+            budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+        Returns:
+            bool: True if the board has at least one solution.
+
+        Raises:
+            BudgetExceeded: If the solve ran out of budget or was interrupted.
+        """
+        backend = self.select_backend(board, backend)
+        if backend == "propagation":
+            return self.propagation.is_solvable(board, budget)
+        if backend == "session":
+            return self.session(box_size(board)).is_solvable(board, budget)
+        return self.solve(board, backend, budget) is not None
+
+    def solve_batch(self, boards, backend="auto", budget=None):
+        """
+        Solve many boards in one call.
+
+        A batch never grounds a program per board: the boards of the clingo and session backends
+        are all solved under assumptions on the warm session of their box size, which is ground
+        once for the whole batch. The propagation backend needs no grounding at all.
+
+        Args:
+            boards (iterable): The boards to solve.
+            backend (str): One of BACKENDS.
+            budget (SolveBudget): The time and conflict limits of every single solve, None for no limit.
+
+        Returns:
+            list: One solved board (or None if unsolvable) per input board, in input order.
+
+        Raises:
+            BudgetExceeded: If a solve ran out of budget or was interrupted.
+        """
+        solutions = []
+        for board in boards:
+            if self.select_backend(board, backend) == "propagation":
+                solutions.append(self.propagation.solve(board, budget))
+            else:
+                solutions.append(self.session(box_size(board)).solve(board, budget))
+        return solutions
+
+
+class SudokuSession:
+    """
+    SudokuSession Class
+    -------------------
+    Keeps one long-lived Clingo control that is ground once. The clues of a board are passed to
+    every solve call as assumptions, so hints, validation and full solves only run the solve step
+    and never reload or reground the program.
+
+    A session can be shared between threads, its solve calls run one at a time.
+    """
+
+    def __init__(self, n=3, program_path=SESSION_PROGRAM):
+        """
+        Initializes the session by loading and grounding the multi-shot Sudoku program.
+
+        Args:
+            n (int): The size of a box, the board has n*n rows and columns.
+            program_path (str): The path to the multi-shot Sudoku ASP program.
+        """
+        self.n = n
+        self.size = n * n
+        with SolverCall("session", f"{self.size}x{self.size}") as call:
+            with call.phase("load"):
+                self.ctl = clingo.Control(["--warn=none", "-c", f"n={n}"])
+                self.ctl.add("base", [], program_text(program_path))
+            with call.phase("ground"):
+                self.ctl.ground([("base", [])])
+            # Reading ctl.statistics before the first solve would freeze them at zero, so the
+            # ground record only counts the atoms and leaves the solver statistics to the solves.
+            call.record["atoms"] = len(self.ctl.symbolic_atoms)
+        self.lock = threading.RLock()
+        self.running = RunningSolves()
+
+        self.literals = {}
+        for atom in self.ctl.symbolic_atoms.by_signature("sudoku", 3):
+            x, y, v = (argument.number for argument in atom.symbol.arguments)
+            self.literals[(x - 1, y - 1, v)] = atom.literal
+
+    def assumptions(self, board):
+        """
+        Translate the clues of a board into solver assumptions.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+
+        Returns:
+            list: One solver literal per clue, each of which has to hold in a solution.
+        """
+        if box_size(board) != self.n:
+            raise ValueError(f"Expected a board with {self.size} rows, got {len(board)}")
+        assumptions = []
+        for row, values in enumerate(board):
+            for col, value in enumerate(values):
+                if value:
+                    if (row, col, value) not in self.literals:
+                        raise ValueError(f"Invalid value {value} at row {row + 1}, column {col + 1}")
+                    assumptions.append(self.literals[(row, col, value)])
+        return assumptions
+
+    def _run(self, board, budget=None, on_model=None):
+        """
+        Run one asynchronous solve under the clues of a board and wait for it within a budget.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+            on_model (callable): Called with every model found.
+
+        Returns:
+            clingo.SolveResult: The result of the solve.
+
+        Raises:
+            BudgetExceeded: If the solve ran out of budget or was interrupted.
+        """
+        with self.lock, SolverCall("session", f"{self.size}x{self.size}") as call:
+            configure(self.ctl, budget)
+            call.ctl = self.ctl
+            with call.phase("solve"):
+                with self.running.solve(self.ctl, assumptions=self.assumptions(board), on_model=on_model,
+                                        async_=True) as handle:
+                    call.result = wait(handle, budget)
+            return call.result
+
+    def solve(self, board, budget=None):
+        """
+        Solve a board with the already ground program.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+        Returns:
+            list: The solved board, or None if the board has no solution.
+
+        Raises:
+            BudgetExceeded: If the solve ran out of budget or was interrupted.
+        """
+        models = []
+        result = self._run(board, budget, lambda model: models.append(model.symbols(shown=True)))
+        if not result.satisfiable or not models:
+            return None
+        return symbols_to_board(models[0], self.size)
+
+    def is_solvable(self, board, budget=None):
+        """
+        Check whether the clues of a board can still be completed to a solution.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+        Returns:
+            bool: True if the board has at least one solution.
+
+        Raises:
+            BudgetExceeded: If the solve ran out of budget or was interrupted.
+        """
+        return self._run(board, budget).satisfiable is True
+
+    def count_solutions(self, board, limit=2, budget=None):
+        """
+        Count the solutions of a board, stopping as soon as the limit is reached.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            limit (int): The maximum number of solutions to enumerate.
+            budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+        Returns:
+            int: The number of solutions, at most limit.
+
+        Raises:
+            BudgetExceeded: If the solve ran out of budget or was interrupted.
+        """
+        count = [0]
+
+        def on_model(_):
+            count[0] += 1
+
+        with self.lock:
+            self.ctl.configuration.solve.models = limit
+            try:
+                self._run(board, budget, on_model)
+            finally:
+                self.ctl.configuration.solve.models = 1
+        return count[0]
+
+    def forced_cells(self, board, budget=None):
+        """
+        Find every empty cell whose value is forced by the current clues.
+
+        The cautious consequences of the program are the atoms that hold in every solution, so a
+        single cautious enumeration yields every cell that has the same value in all solutions.
+
+        Args:
+            board (list): The board as a list of rows, with 0 for empty cells.
+            budget (SolveBudget): The time and conflict limits of the solve, None for no limit.
+
+        Returns:
+            dict: The forced value of every forced empty cell by (row, col), or None if the board
+            has no solution.
+
+        Raises:
+            BudgetExceeded: If the enumeration ran out of budget before the consequences were final,
+                or with the reason "interrupted" if it was cancelled through interrupt().
+        """
+        consequences = []
+
+        def on_model(model):
+            consequences[:] = model.symbols(shown=True)
+
+        with self.lock:
+            configuration = self.ctl.configuration.solve
+            configuration.enum_mode = "cautious"
+            configuration.models = 0
+            try:
+                result = self._run(board, budget, on_model)
+            finally:
+                configuration.enum_mode = "auto"
+                configuration.models = 1
+        if not result.satisfiable:
+            return None
+
+        forced = {}
+        for symbol in consequences:
+            x, y, v = (argument.number for argument in symbol.arguments)
+            if not board[x - 1][y - 1]:
+                forced[(x - 1, y - 1)] = v
+        return forced
+
+    def interrupt(self):
+        """
+        Cancel the running solve of the session, if there is one. This is safe to call from any thread.
+        """
+        self.running.cancel()
+
+
+def session_pool(n):
+    """
+    Get the pool of ground SudokuSessions for a box size from the shared solver service.
+
+    Args:
+        n (int): The box size of the board.
+
+    Returns:
+        ControlPool: The pool of sessions for boards with box size n.
+    """
+    return shared_service().pool(SESSION_PROGRAM, n, partial(SudokuSession, n))
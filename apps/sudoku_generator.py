@@ -0,0 +1,139 @@
+"""
+Sudoku Generator
+================
+
+This module generates Sudoku puzzles that are guaranteed to have exactly one solution. A random
+complete grid is reduced by removing clues one at a time, and every removal is only kept if a
+bounded solve with models=2 still finds a single solution.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import random
+from apps.solver_budget import BudgetExceeded
+from apps.sudoku_engine import SudokuSession, session_pool
+
+
+class SudokuGenerator:
+    """
+    SudokuGenerator Class
+    ---------------------
+    Generates unique-solution Sudoku puzzles with a multi-shot Sudoku session.
+    """
+
+    def __init__(self, session=None, seed=None, budget=None):
+        """
+        Initializes the generator.
+
+        Args:
+            session (SudokuSession): The session used for solving, a new one is created if None.
+            seed (int): The seed of the random number generator, for reproducible puzzles.
+            budget (SolveBudget): The time and conflict limits of every uniqueness check, None for no limit.
+        """
+        self.session = session or SudokuSession()
+        self.rng = random.Random(seed)
+        self.budget = budget
+
+    def complete_grid(self):
+        """
+        Generate a random complete grid.
+
+        The boxes on the main diagonal do not share any row or column, so they are filled with
+        independent random permutations. The solver then completes the rest of the grid, which
+        gives grids from the whole solution space instead of a single shuffled pattern.
+
+        Returns:
+            list: A solved board as a list of rows.
+        """
+        n, size = self.session.n, self.session.size
+        board = [[0] * size for _ in range(size)]
+        for box in range(n):
+            values = self.rng.sample(range(1, size + 1), size)
+            for i, value in enumerate(values):
+                board[box * n + i // n][box * n + i % n] = value
+        return self.session.solve(board)
+
+    def reduce(self, solution, clues=0):
+        """
+        Remove clues from a complete grid while the puzzle keeps a unique solution.
+
+        Cells are visited in random order and each clue is removed only if the puzzle still has
+        exactly one solution afterwards. If clues is 0 every cell is visited, which makes the
+        result minimal: no remaining clue can be removed without losing uniqueness.
+        A uniqueness check that runs out of the generator's budget counts as "not unique", so the
+        clue is kept and the puzzle still has a unique solution, it just may not be minimal.
+
+        Args:
+            solution (list): A complete grid as a list of rows.
+            clues (int): Stop as soon as the puzzle has this many clues left.
+
+        Returns:
+            list: The puzzle as a list of rows, with 0 for empty cells.
+        """
+        size = self.session.size
+        puzzle = [list(row) for row in solution]
+        remaining = size * size
+        cells = [(row, col) for row in range(size) for col in range(size)]
+        self.rng.shuffle(cells)
+
+        for row, col in cells:
+            if remaining <= clues:
+                break
+            value = puzzle[row][col]
+            puzzle[row][col] = 0
+            try:
+                unique = self.session.count_solutions(puzzle, 2, self.budget) == 1
+            except BudgetExceeded:
+                unique = False
+            if unique:
+                remaining -= 1
+            else:
+                puzzle[row][col] = value
+        return puzzle
+
+    def generate(self, clues=0):
+        """
+        Generate a puzzle with a unique solution.
+
+        Args:
+            clues (int): The number of clues to keep, 0 for a minimal puzzle.
+
+        Returns:
+            tuple: The puzzle and its solution, both as lists of rows.
+        """
+        solution = self.complete_grid()
+        return self.reduce(solution, clues), solution
+
+    def generate_batch(self, count, clues=0):
+        """
+        Generate many puzzles in one call, reusing the same ground session.
+
+        Args:
+            count (int): The number of puzzles to generate.
+            clues (int): The number of clues to keep, 0 for minimal puzzles.
+
+        Returns:
+            list: A list of (puzzle, solution) tuples.
+        """
+        return [self.generate(clues) for _ in range(count)]
+
+
+def generate_puzzle(n=3, clues=0, seed=None, budget=None):
+    """
+    Generate a single puzzle with a session from the session pool of the process.
+
+    This is a module-level function so that it can be run in a worker process, which keeps the
+    slow generation of large puzzles away from the process running the GUI. The session stays
+    ground in the worker process, so later puzzles of the same size skip the grounding.
+
+    Args:
+        n (int): The box size of the puzzle.
+        clues (int): The number of clues to keep, 0 for a minimal puzzle.
+        seed (int): The seed of the random number generator, for reproducible puzzles.
+        budget (SolveBudget): The time and conflict limits of every uniqueness check, None for no limit.
+
+    Returns:
+        tuple: The puzzle and its solution, both as lists of rows.
+    """
+    with session_pool(n).borrow() as session:
+        return SudokuGenerator(session, seed, budget).generate(clues)
@@ -0,0 +1,289 @@
+"""
+Sudoku Grid
+===========
+
+This module draws a Sudoku board on a tkinter Canvas instead of one Entry widget per cell. The
+values of the cells live in a plain cell model, and every cell is drawn by one rectangle and one
+text item that are created once per board size. Changing a cell only marks it as dirty, and all
+dirty cells are redrawn together when tkinter is idle, so filling in a whole solution updates the
+screen in a single frame.
+
+Keyboard and mouse input is handled by the Canvas: a click selects a cell, digits are typed into
+the selected cell, BackSpace and Delete erase, and the arrow keys move the selection.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+
+EMPTY = 0
+GIVEN = "given"
+LOCKED = "locked"
+USER = "user"
+
+COLORS = {
+    GIVEN: ("#e8e8e8", "black"),
+    LOCKED: ("#e8e8e8", "#1f4e9c"),
+    USER: ("white", "#1f6fdc"),
+}
+SELECTED_COLOR = "#fff3b0"
+MOVES = {"Up": (-1, 0), "Down": (1, 0), "Left": (0, -1), "Right": (0, 1)}
+
+
+class SudokuGrid:
+    """
+    SudokuGrid Class
+    ----------------
+    The cell model of a Sudoku board together with its rendering on a Canvas. Every cell has a
+    value (0 if empty), a kind (GIVEN for the clues of the puzzle, LOCKED for values filled in by
+    the solver or a hint, USER for values typed by the user) and an optional background color,
+    e.g. to highlight conflicts.
+    """
+
+    def __init__(self, canvas, x, y, pixels, n=3, on_change=None):
+        """
+        Initializes the grid and draws an empty board.
+
+        Args:
+            canvas (tk.Canvas): The canvas the board is drawn on.
+            x (int): The x coordinate of the top left corner of the board.
+            y (int): The y coordinate of the top left corner of the board.
+            pixels (int): The width and height of the board.
+            n (int): The box size of the board.
+            on_change (callable): Called with (row, col) after the user changed a cell.
+        """
+        self.canvas = canvas
+        self.x = x
+        self.y = y
+        self.pixels = pixels
+        self.on_change = on_change
+        self.selected = None
+        self.dirty = set()
+        self.redraw_job = None
+        self.frames = 0
+        self.canvas.bind("<Button-1>", self.clicked)
+        self.canvas.bind("<KeyPress>", self.key_pressed)
+        self.resize(n)
+
+    def resize(self, n):
+        """
+        Empty the board and redraw it for a new box size. The canvas items of the old board are
+        deleted, so the number of items only depends on the current board size.
+
+        Args:
+            n (int): The box size of the board.
+        """
+        self.n = n
+        self.size = n * n
+        self.values = [[EMPTY] * self.size for _ in range(self.size)]
+        self.kinds = [[USER] * self.size for _ in range(self.size)]
+        self.backgrounds = {}
+        self.selected = None
+        self.dirty.clear()
+
+        self.canvas.delete("sudoku")
+        self.cell_size = self.pixels // self.size
+        self.font = ("Arial", max(7, 18 * 9 // self.size))
+        self.rects = [[None] * self.size for _ in range(self.size)]
+        self.texts = [[None] * self.size for _ in range(self.size)]
+        for row in range(self.size):
+            for col in range(self.size):
+                x0, y0 = self.x + col * self.cell_size, self.y + row * self.cell_size
+                self.rects[row][col] = self.canvas.create_rectangle(
+                    x0, y0, x0 + self.cell_size, y0 + self.cell_size, fill="white", outline="gray", tags="sudoku")
+                self.texts[row][col] = self.canvas.create_text(
+                    x0 + self.cell_size / 2, y0 + self.cell_size / 2, text="", font=self.font, tags="sudoku")
+
+        end = self.size * self.cell_size
+        for i in range(0, self.size + 1, n):
+            offset = i * self.cell_size
+            self.canvas.create_line(self.x + offset, self.y, self.x + offset, self.y + end, width=2, tags="sudoku")
+            self.canvas.create_line(self.x, self.y + offset, self.x + end, self.y + offset, width=2, tags="sudoku")
+
+    def load(self, board):
+        """
+        Show a new puzzle. The clues of the board become GIVEN cells, every other cell is emptied.
+
+        Args:
+            board (list): The puzzle as a list of rows, with 0 for empty cells.
+        """
+        self.backgrounds.clear()
+        for row in range(self.size):
+            for col in range(self.size):
+                self.set(row, col, board[row][col], GIVEN if board[row][col] else USER)
+
+    def board(self):
+        """
+        Returns:
+            list: The current board as a list of rows, with 0 for empty cells.
+        """
+        return [list(row) for row in self.values]
+
+    def get(self, row, col):
+        """
+        Get the value of a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            int: The value of the cell, 0 if it is empty.
+        """
+        return self.values[row][col]
+
+    def is_editable(self, row, col):
+        """
+        Check whether the user may change a cell.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+
+        Returns:
+            bool: True unless the cell is a clue or was filled in by the solver or a hint.
+        """
+        return self.kinds[row][col] == USER
+
+    def set(self, row, col, value, kind=USER):
+        """
+        Set the value and kind of a cell. The cell is redrawn with the next batch.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            value (int): The new value, 0 to empty the cell.
+            kind (str): GIVEN, LOCKED or USER.
+        """
+        if self.values[row][col] != value or self.kinds[row][col] != kind:
+            self.values[row][col] = value
+            self.kinds[row][col] = kind
+            self.mark_dirty(row, col)
+
+    def set_background(self, row, col, color=None):
+        """
+        Override the background color of a cell, e.g. to highlight a conflict.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+            color (str): The background color, None to go back to the default color.
+        """
+        if self.backgrounds.get((row, col)) != color:
+            if color is None:
+                del self.backgrounds[(row, col)]
+            else:
+                self.backgrounds[(row, col)] = color
+            self.mark_dirty(row, col)
+
+    def select(self, row, col):
+        """
+        Select the cell that receives keyboard input.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        if self.selected is not None:
+            self.mark_dirty(*self.selected)
+        self.selected = (row, col)
+        self.mark_dirty(row, col)
+
+    def mark_dirty(self, row, col):
+        """
+        Mark a cell for redrawing and schedule the redraw of all dirty cells for when tkinter is idle.
+
+        Args:
+            row (int): The row index of the cell.
+            col (int): The column index of the cell.
+        """
+        self.dirty.add((row, col))
+        if self.redraw_job is None:
+            self.redraw_job = self.canvas.after_idle(self.redraw)
+
+    def redraw(self):
+        """
+        Redraw every dirty cell in one batch.
+        """
+        self.redraw_job = None
+        self.frames += 1
+        for row, col in self.dirty:
+            background, foreground = COLORS[self.kinds[row][col]]
+            if (row, col) == self.selected:
+                background = SELECTED_COLOR
+            background = self.backgrounds.get((row, col), background)
+            value = self.values[row][col]
+            self.canvas.itemconfigure(self.rects[row][col], fill=background)
+            self.canvas.itemconfigure(self.texts[row][col], text=str(value) if value else "", fill=foreground)
+        self.dirty.clear()
+
+    def cell_at(self, x, y):
+        """
+        Get the cell at a point of the canvas.
+
+        Args:
+            x (int): The x coordinate of the point.
+            y (int): The y coordinate of the point.
+
+        Returns:
+            tuple: The (row, col) of the cell, or None if the point is outside the board.
+        """
+        col, row = (x - self.x) // self.cell_size, (y - self.y) // self.cell_size
+        if 0 <= row < self.size and 0 <= col < self.size:
+            return row, col
+        return None
+
+    def clicked(self, event):
+        """
+        Select the clicked cell and give the canvas the keyboard focus.
+
+        Args:
+            event (tkinter.Event): The mouse event.
+        """
+        cell = self.cell_at(event.x, event.y)
+        if cell is not None:
+            self.select(*cell)
+            self.canvas.focus_set()
+
+    def key_pressed(self, event):
+        """
+        Handle a key press on the selected cell.
+
+        Digits are appended to the value of the cell as long as the number stays within the size of
+        the grid, i.e. single digits on a 9x9 grid and up to 25 on a 25x25 grid, and otherwise
+        replace it. '0' is only accepted as the second digit of a number. BackSpace removes the
+        last digit, Delete empties the cell and the arrow keys move the selection.
+
+        Args:
+            event (tkinter.Event): The key event.
+
+        Returns:
+            str: "break" if the key was handled or rejected.
+        """
+        if self.selected is None:
+            return "break"
+        row, col = self.selected
+        if event.keysym in MOVES:
+            d_row, d_col = MOVES[event.keysym]
+            self.select((row + d_row) % self.size, (col + d_col) % self.size)
+            return "break"
+        if not self.is_editable(row, col):
+            return "break"
+
+        current = str(self.values[row][col]) if self.values[row][col] else ""
+        if event.char.isdigit():
+            value = current + event.char
+            if int(value) > self.size:
+                value = event.char
+            if value.startswith("0"):
+                return "break"
+        elif event.keysym == "BackSpace":
+            value = current[:-1]
+        elif event.keysym == "Delete":
+            value = ""
+        else:
+            return "break"
+
+        self.set(row, col, int(value or 0))
+        if self.on_change is not None:
+            self.on_change(row, col)
+        return "break"
@@ -0,0 +1,222 @@
+"""
+Tk Handler Profiler
+===================
+
+This module measures how long the Python callbacks of the tkinter main loop take, to find the
+handlers that make the window stutter. Every Python callable handed to Tk (button commands, key
+and mouse bindings, after callbacks) goes through tkinter.Misc._register, so wrapping that one
+method times every handler without touching the apps.
+
+A handler that takes longer than the frame budget is logged as a slow frame. Optionally every
+handler is run under cProfile, and the profiles of the slowest calls are kept as .prof files that
+can be read with pstats or snakeviz. When the main loop ends, a table of the handlers sorted by
+their total time is written to the log.
+
+The profiler is switched on with environment variables and is not installed at all otherwise:
+    TK_PROFILE          Set to 1 to install the profiler.
+    TK_PROFILE_BUDGET   The frame budget in milliseconds, 16 by default.
+    TK_PROFILE_LOG      The file the slow frames and the table are appended to, stderr by default.
+    TK_PROFILE_DUMPS    A directory for the cProfile dumps of the slowest calls, none by default.
+    TK_PROFILE_TOP      The number of cProfile dumps kept, 5 by default.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import atexit
+import cProfile
+import functools
+import heapq
+import os
+import sys
+import time
+import tkinter
+
+
+def handler_name(func):
+    """
+    Get a readable name of a Tk callback.
+
+    Args:
+        func (callable): The callback.
+
+    Returns:
+        str: The qualified name of the callback, e.g. "MinesweeperApp.cell_clicked". Callbacks
+        scheduled with after are named "after" followed by the name of the scheduled function.
+    """
+    if isinstance(func, functools.partial):
+        return handler_name(func.func)
+    qualname = getattr(func, "__qualname__", None)
+    if qualname is None:
+        return type(func).__qualname__
+    if qualname.endswith("after.<locals>.callit"):
+        return f"after {func.__name__}"
+    return qualname
+
+
+class HandlerStats:
+    """
+    HandlerStats Class
+    ------------------
+    The number of calls, the total time and the longest call of one handler.
+    """
+
+    def __init__(self):
+        """
+        Initializes the statistics with no calls.
+        """
+        self.calls = 0
+        self.total = 0.0
+        self.longest = 0.0
+        self.slow = 0
+
+    def add(self, elapsed, slow):
+        """
+        Add a call.
+
+        Args:
+            elapsed (float): The duration of the call in seconds.
+            slow (bool): True if the call went over the frame budget.
+        """
+        self.calls += 1
+        self.total += elapsed
+        self.longest = max(self.longest, elapsed)
+        self.slow += slow
+
+
+class TkProfiler:
+    """
+    TkProfiler Class
+    ----------------
+    Times every Tk callback once installed, logs the slow ones and keeps the cProfile dumps of the
+    slowest calls.
+    """
+
+    def __init__(self, frame_budget=0.016, log=None, dump_dir=None, top=5):
+        """
+        Initializes the profiler. Nothing is measured before install() is called.
+
+        Args:
+            frame_budget (float): Calls longer than this many seconds are logged as slow frames.
+            log (file): The file the slow frames and the report are written to, None for stderr.
+            dump_dir (str): A directory for the cProfile dumps of the slowest calls, None to not
+                profile the calls.
+            top (int): The number of cProfile dumps kept.
+        """
+        self.frame_budget = frame_budget
+        self.log = log
+        self.dump_dir = dump_dir
+        self.top = top
+        self.stats = {}
+        self.dumps = []
+        self.depth = 0
+        self.original = None
+        if dump_dir is not None:
+            os.makedirs(dump_dir, exist_ok=True)
+
+    def wrap(self, func):
+        """
+        Wrap a callback so that every call of it is measured.
+
+        Args:
+            func (callable): The callback.
+
+        Returns:
+            callable: The measured callback.
+        """
+        name = handler_name(func)
+
+        @functools.wraps(func)
+        def measured(*args):
+            self.depth += 1
+            profile = cProfile.Profile() if self.dump_dir is not None and self.depth == 1 else None
+            start = time.perf_counter()
+            try:
+                if profile is None:
+                    return func(*args)
+                return profile.runcall(func, *args)
+            finally:
+                self.depth -= 1
+                self.record(name, time.perf_counter() - start, profile)
+
+        return measured
+
+    def record(self, name, elapsed, profile=None):
+        """
+        Add a call to the statistics of its handler, log it if it was slow, and keep its profile if
+        it is one of the slowest calls so far.
+
+        Args:
+            name (str): The name of the handler.
+            elapsed (float): The duration of the call in seconds.
+            profile (cProfile.Profile): The profile of the call, None if it was not profiled.
+        """
+        slow = elapsed > self.frame_budget
+        self.stats.setdefault(name, HandlerStats()).add(elapsed, slow)
+        if slow:
+            print(f"slow frame {elapsed * 1000:8.1f} ms  {name}", file=self.log or sys.stderr, flush=True)
+        if profile is not None and (len(self.dumps) < self.top or elapsed > self.dumps[0][0]):
+            path = os.path.join(self.dump_dir, f"{elapsed * 1000:09.1f}ms_{name.replace('<', '').replace('>', '')}_{time.time_ns()}.prof")
+            profile.dump_stats(path)
+            heapq.heappush(self.dumps, (elapsed, path))
+            if len(self.dumps) > self.top:
+                _, dropped = heapq.heappop(self.dumps)
+                os.remove(dropped)
+
+    def report(self, file=None):
+        """
+        Write a table of the handlers, sorted by their total time.
+
+        Args:
+            file (file): The file to write to, None for the log.
+        """
+        file = file or self.log or sys.stderr
+        print(f"{'handler':<60} {'calls':>7} {'total ms':>10} {'mean ms':>8} {'max ms':>8} {'slow':>5}", file=file)
+        for name, stats in sorted(self.stats.items(), key=lambda item: item[1].total, reverse=True):
+            print(f"{name[:60]:<60} {stats.calls:>7} {stats.total * 1000:>10.1f} {stats.total * 1000 / stats.calls:>8.2f} "
+                  f"{stats.longest * 1000:>8.1f} {stats.slow:>5}", file=file)
+        file.flush()
+
+    def install(self):
+        """
+        Start measuring every callback registered with Tk from now on.
+        """
+        if self.original is not None:
+            return
+        self.original = original = tkinter.Misc._register
+        profiler = self
+
+        def _register(widget, func, subst=None, needcleanup=1):
+            return original(widget, profiler.wrap(func), subst, needcleanup)
+
+        tkinter.Misc._register = _register
+
+    def uninstall(self):
+        """
+        Stop measuring callbacks that are registered from now on.
+        """
+        if self.original is not None:
+            tkinter.Misc._register = self.original
+            self.original = None
+
+
+def install_from_env(environ=None):
+    """
+    Install a profiler configured by the TK_PROFILE environment variables, if TK_PROFILE is set.
+
+    The report is written when the interpreter exits.
+
+    Args:
+        environ (dict): The environment, None for os.environ.
+
+    Returns:
+        TkProfiler: The installed profiler, or None if profiling is off.
+    """
+    environ = os.environ if environ is None else environ
+    if environ.get("TK_PROFILE", "") in ("", "0"):
+        return None
+    log = open(environ["TK_PROFILE_LOG"], "a", encoding="utf-8") if environ.get("TK_PROFILE_LOG") else None
+    profiler = TkProfiler(float(environ.get("TK_PROFILE_BUDGET", "16")) / 1000, log,
+                          environ.get("TK_PROFILE_DUMPS") or None, int(environ.get("TK_PROFILE_TOP", "5")))
+    profiler.install()
+    atexit.register(profiler.report)
+    return profiler
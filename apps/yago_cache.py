@@ -0,0 +1,194 @@
+"""
+YAGO Cache
+==========
+
+This module keeps the results of YAGO SPARQL queries in an SQLite database on disk, so that the
+knowledge questions of the games do not download the same entity lists and answers again on
+every hint, and still work across restarts.
+
+Every entry is a JSON value under a string key. An entry expires ttl seconds after it was stored
+and is then fetched again. Once the values take more than max_bytes, the least recently used
+entries are dropped.
+
+The cache is configured in the yago_cache section of conf.yaml:
+
+    yago_cache:
+      path: cache/yago.sqlite3
+      ttl_hours: 168
+      max_mb: 50
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+import yaml
+
+_SHARED = None
+_SHARED_LOCK = threading.Lock()
+
+
+class YagoCache:
+    """
+    YagoCache Class
+    ---------------
+    A persistent key-value cache with expiry and a size cap. Every call opens its own SQLite
+    connection, so the cache can be used from any thread and from several processes at once.
+    """
+
+    def __init__(self, path="cache/yago.sqlite3", ttl=7 * 24 * 3600, max_bytes=50 * 1024 * 1024):
+        """
+        Initializes the cache and creates its database if it does not exist yet.
+
+        Args:
+            path (str): The path to the SQLite database.
+            ttl (float): The seconds an entry stays valid.
+            max_bytes (int): The maximum total size of the stored values in bytes.
+        """
+        self.path = path
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                       "size INTEGER NOT NULL, expires REAL NOT NULL, accessed REAL NOT NULL)")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    @contextmanager
+    def _connect(self):
+        """
+        Open a connection to the database for one transaction, and close it afterwards.
+
+        Yields:
+            sqlite3.Connection: The connection. The transaction is committed when the block ends.
+        """
+        db = sqlite3.connect(self.path, timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    def get(self, key):
+        """
+        Get the value of a key.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            The stored value, or None if the key is missing or has expired.
+        """
+        now = time.time()
+        with self._connect() as db:
+            row = db.execute("SELECT value, expires FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            if row[1] <= now:
+                db.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return None
+            db.execute("UPDATE entries SET accessed = ? WHERE key = ?", (now, key))
+        return json.loads(row[0])
+
+    def put(self, key, value):
+        """
+        Store the value of a key and drop the least recently used entries if the cache is full.
+
+        Args:
+            key (str): The key.
+            value: Any JSON-serializable value other than None.
+        """
+        text = json.dumps(value)
+        now = time.time()
+        with self._connect() as db:
+            db.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?)",
+                       (key, text, len(text.encode("utf-8")), now + self.ttl, now))
+            self._evict(db, now)
+
+    def _evict(self, db, now):
+        """
+        Drop the expired entries, and then the least recently used ones until the values fit into
+        max_bytes.
+
+        Args:
+            db (sqlite3.Connection): The open connection.
+            now (float): The current time.
+        """
+        db.execute("DELETE FROM entries WHERE expires <= ?", (now,))
+        total = db.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall():
+            db.execute("DELETE FROM entries WHERE key = ?", (key,))
+            total -= size
+            if total <= self.max_bytes:
+                return
+
+    def fetch(self, key, fetch):
+        """
+        Get the value of a key, fetching and storing it if it is missing or has expired.
+
+        Args:
+            key (str): The key.
+            fetch (callable): Called without arguments to get a missing value.
+
+        Returns:
+            The value.
+        """
+        value = self.get(key)
+        if value is None:
+            value = fetch()
+            self.put(key, value)
+        return value
+
+    def size(self):
+        """
+        Returns:
+            tuple: The number of entries and the total size of their values in bytes.
+        """
+        with self._connect() as db:
+            count, total = db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return count, total
+
+
+def load_cache(path="conf.yaml"):
+    """
+    Create a cache configured by the yago_cache section of a YAML configuration file.
+
+    A missing section or file gives the defaults of YagoCache.
+
+    Args:
+        path (str): The path to the configuration file.
+
+    Returns:
+        YagoCache: The cache.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            config = yaml.safe_load(file) or {}
+    except FileNotFoundError:
+        config = {}
+    settings = config.get("yago_cache") or {}
+    return YagoCache(settings.get("path", "cache/yago.sqlite3"),
+                     float(settings.get("ttl_hours", 168)) * 3600,
+                     int(float(settings.get("max_mb", 50)) * 1024 * 1024))
+
+
+def shared_cache():
+    """
+    Get the cache of this process, configured from conf.yaml on first use.
+
+    Returns:
+        YagoCache: The shared cache.
+    """
+    global _SHARED
+    with _SHARED_LOCK:
+        if _SHARED is None:
+            _SHARED = load_cache()
+        return _SHARED
@@ -0,0 +1,83 @@
+"""
+Minesweeper Frame Benchmark
+===========================
+
+Reports how long the canvas Minesweeper board takes to be created and to reveal every cell, for
+square boards of increasing size. Every board is drawn by apps/minesweeper_grid.py on a real
+tkinter Canvas, and each measurement includes the root.update() that puts the frame on screen.
+
+Columns:
+    create ms   Creating the canvas items of a board of hidden tiles.
+    reveal ms   Revealing every cell in one batch of dirty updates, up to the drawn frame.
+    batch ms    The part of reveal ms spent in the grid's redraw of the dirty cells.
+
+Unlike the other benchmarks this one needs a display.
+
+Usage:
+    python -m benchmarks.minesweeper_frames --sizes 8 16 32 64 100
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import random
+import time
+import tkinter as tk
+from apps.minesweeper_grid import MinesweeperGrid, MINE
+
+
+def measure_board(root, grid, size, pixels, rng):
+    """
+    Create a board and reveal all of its cells.
+
+    Args:
+        root (tk.Tk): The tkinter window.
+        grid (MinesweeperGrid): The grid the board is drawn with.
+        size (int): The number of rows and columns of the board.
+        pixels (int): The width and height of the board in pixels.
+        rng (random.Random): The random generator for the revealed tiles.
+
+    Returns:
+        dict: The create, reveal and batch times in seconds.
+    """
+    start = time.perf_counter()
+    grid.resize(size, size, max(4, pixels // size), 10, 10)
+    root.update()
+    create = time.perf_counter() - start
+
+    tiles = [MINE] + [str(number) for number in range(9)]
+    start = time.perf_counter()
+    for row in range(size):
+        for col in range(size):
+            grid.set_tile(row, col, rng.choice(tiles))
+    root.update()
+    reveal = time.perf_counter() - start
+    return {"create": create, "reveal": reveal, "batch": grid.frame_ms / 1000}
+
+
+def main():
+    """
+    Measure every requested board size and print one table row per size.
+    """
+    parser = argparse.ArgumentParser(description="Measure board creation and full reveal frame times of the Minesweeper canvas.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32, 64, 100], help="Board sizes to measure.")
+    parser.add_argument("--pixels", type=int, default=600, help="Width and height of the board in pixels.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the revealed tiles.")
+    args = parser.parse_args()
+
+    root = tk.Tk()
+    canvas = tk.Canvas(root, width=args.pixels + 20, height=args.pixels + 20)
+    canvas.pack()
+    grid = MinesweeperGrid(canvas)
+    rng = random.Random(args.seed)
+
+    print(f"{'size':>5} {'cells':>7} {'create ms':>10} {'reveal ms':>10} {'batch ms':>10}")
+    for size in args.sizes:
+        result = measure_board(root, grid, size, args.pixels, rng)
+        print(f"{size:>5} {size * size:>7} {result['create'] * 1000:>10.1f} "
+              f"{result['reveal'] * 1000:>10.1f} {result['batch'] * 1000:>10.1f}")
+    root.destroy()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Minesweeper Grounding Benchmark
+===============================
+
+Reports the ground program size, the grounding time and the solving time of the full-board
+Minesweeper encoding for square boards of increasing size.
+
+Two versions of ASPSolvers/minesweeperSolver.lp are compared on the same boards:
+    offsets     The encoding as shipped, which generates the eight neighbour offsets of every cell.
+    quadratic   The same encoding with the former adj/4 rule, which joins every pair of cells and
+                filters them by distance. It grounds cells^2 candidate pairs, so it is only run up
+                to --quadratic-max.
+
+Every board is given with all of its numbers and mines as facts, with a mine density of 15%.
+
+Usage:
+    python -m benchmarks.minesweeper_grounding --sizes 8 16 32 64 100 200 --quadratic-max 32
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import random
+import re
+import time
+import clingo
+from apps.minesweeper_board import MinesweeperBoard, random_mines
+
+MINESWEEPER_PROGRAM = "ASPSolvers/minesweeperSolver.lp"
+QUADRATIC_ADJ = ("adj(Cadj, Radj, C, R) :- cell(C, R), cell(Cadj, Radj), "
+                 "|R-Radj|**2 + |C-Cadj|**2 <= 2, |R-Radj|**2 + |C-Cadj|**2 > 0.")
+
+
+def load_encodings():
+    """
+    Load the encodings that are compared.
+
+    Returns:
+        dict: The program text of the offsets and quadratic encodings by name.
+    """
+    with open(MINESWEEPER_PROGRAM, encoding="UTF-8") as f:
+        program = f.read()
+    offsets_rule = re.compile(r"^adj\(.*near\(.*$", re.MULTILINE)
+    if not offsets_rule.search(program):
+        raise ValueError(f"Offset adjacency rule not found in {MINESWEEPER_PROGRAM}")
+    return {"offsets": program, "quadratic": offsets_rule.sub(QUADRATIC_ADJ, program)}
+
+
+def board_facts(size, rng):
+    """
+    Get the facts of a random square board with all of its numbers and mines.
+
+    Args:
+        size (int): The number of rows and columns of the board.
+        rng (random.Random): The random generator for the mines.
+
+    Returns:
+        str: The facts of the board.
+    """
+    board = MinesweeperBoard(size, size, random_mines(size, size, size * size * 15 // 100, rng))
+    facts = [f"#const r={size}.", f"#const c={size}."]
+    facts.extend(f"mine({col},{row})." for row, col in board.mines)
+    facts.extend(board.number_facts((row, col) for row in range(size) for col in range(size)
+                                    if (row, col) not in board.mines))
+    return "\n".join(facts)
+
+
+def measure_program(program, facts):
+    """
+    Ground and solve an encoding with the facts of a board.
+
+    Args:
+        program (str): The encoding.
+        facts (str): The facts of the board.
+
+    Returns:
+        dict: The ground atoms and rules, the grounding time and the solving time.
+    """
+    ctl = clingo.Control(["--warn=none"])
+    ctl.add("base", [], program)
+    ctl.add("base", [], facts)
+    start = time.perf_counter()
+    ctl.ground([("base", [])])
+    ground_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = ctl.solve()
+    solve_time = time.perf_counter() - start
+    lp = ctl.statistics["problem"]["lp"]
+    return {
+        "atoms": int(lp["atoms"]),
+        "rules": int(lp["rules"]),
+        "ground": ground_time,
+        "solve": solve_time,
+        "sat": result.satisfiable,
+    }
+
+
+def main():
+    """
+    Measure every encoding for every requested board size and print one table row per run.
+    """
+    parser = argparse.ArgumentParser(description="Measure grounding size and time of the Minesweeper encodings.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[8, 16, 32, 64, 100, 200], help="Board sizes to measure.")
+    parser.add_argument("--quadratic-max", type=int, default=32, help="Largest board size for the quadratic encoding.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the mines.")
+    args = parser.parse_args()
+
+    encodings = load_encodings()
+    rng = random.Random(args.seed)
+    print(f"{'size':>5} {'encoding':<10} {'atoms':>9} {'rules':>9} {'ground ms':>10} {'solve ms':>10}")
+    for size in args.sizes:
+        facts = board_facts(size, rng)
+        for name, program in encodings.items():
+            if name == "quadratic" and size > args.quadratic_max:
+                continue
+            result = measure_program(program, facts)
+            print(f"{size:>5} {name:<10} {result['atoms']:>9} {result['rules']:>9} "
+                  f"{result['ground'] * 1000:>10.1f} {result['solve'] * 1000:>10.1f}"
+                  f"{'' if result['sat'] else '  UNSAT'}")
+
+
+if __name__ == "__main__":
+    main()
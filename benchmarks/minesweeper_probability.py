@@ -0,0 +1,100 @@
+"""
+Minesweeper Probability Benchmark
+=================================
+
+Measures the exact mine probability engine on dense boards. Every game is played by always
+opening the cell with the lowest mine probability, and at every move the probabilities are
+computed twice: once with the frontier split into independent components and once with the whole
+frontier counted at once. The joint enumeration runs under a time limit and is reported as a
+timeout when it does not finish.
+
+Boards are given as ROWSxCOLSxMINES, the defaults are the Hard board of the game and the classic
+16x30 board with 99 mines.
+
+Usage:
+    python -m benchmarks.minesweeper_probability --boards 12x12x50 16x30x99 --games 5
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import random
+import statistics
+import time
+from apps.minesweeper_board import MinesweeperBoard, random_mines
+from apps.minesweeper_inference import frontier
+from apps.minesweeper_probability import components, mine_probabilities
+from apps.solver_budget import BudgetExceeded, SolveBudget
+
+
+def play(rows, cols, num_mines, rng, joint_budget):
+    """
+    Play one game by always opening the safest cell, and time the probability engine at every move.
+
+    Args:
+        rows (int): The number of rows of the board.
+        cols (int): The number of columns of the board.
+        num_mines (int): The number of mines.
+        rng (random.Random): The random generator for the mines.
+        joint_budget (SolveBudget): The budget of the joint enumeration.
+
+    Returns:
+        list: A dict per move with the decomposed and joint timings, the number of components and
+        the size of the largest component.
+    """
+    board = MinesweeperBoard(rows, cols, random_mines(rows, cols, num_mines, rng))
+    revealed = set()
+    moves = []
+    while len(revealed) < rows * cols - num_mines:
+        numbers = {cell: board.count(*cell) for cell in revealed}
+        clues, cells = frontier(rows, cols, numbers)
+        parts = components(rows, cols, clues, cells)
+
+        start = time.perf_counter()
+        probabilities = mine_probabilities(rows, cols, numbers, num_mines)
+        decomposed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        try:
+            mine_probabilities(rows, cols, numbers, num_mines, decompose=False, budget=joint_budget)
+            joint = time.perf_counter() - start
+        except BudgetExceeded:
+            joint = None
+
+        moves.append({"decomposed": decomposed, "joint": joint, "components": len(parts),
+                      "largest": max((len(part) for part in parts), default=0)})
+        cell, _ = probabilities.safest()
+        if cell in board.mines:
+            break
+        board.reveal(*cell, revealed)
+    return moves
+
+
+def main():
+    """
+    Play games on every requested board and print one table row per board.
+    """
+    parser = argparse.ArgumentParser(description="Measure the Minesweeper mine probability engine on dense boards.")
+    parser.add_argument("--boards", nargs="+", default=["12x12x50", "16x30x99"], help="Boards as ROWSxCOLSxMINES.")
+    parser.add_argument("--games", type=int, default=5, help="Games per board.")
+    parser.add_argument("--joint-time", type=float, default=2.0, help="Time limit of the joint enumeration in seconds.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the mines.")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    joint_budget = SolveBudget(time_limit=args.joint_time)
+    print(f"{'board':<10} {'moves':>6} {'comps':>6} {'largest':>8} {'mean ms':>9} {'max ms':>9} "
+          f"{'joint mean ms':>14} {'joint max ms':>13} {'timeouts':>9}")
+    for spec in args.boards:
+        rows, cols, num_mines = (int(value) for value in spec.split("x"))
+        moves = [move for _ in range(args.games) for move in play(rows, cols, num_mines, rng, joint_budget)]
+        decomposed = [move["decomposed"] * 1000 for move in moves]
+        joint = [move["joint"] * 1000 for move in moves if move["joint"] is not None]
+        print(f"{spec:<10} {len(moves):>6} {statistics.mean(move['components'] for move in moves):>6.1f} "
+              f"{max(move['largest'] for move in moves):>8} {statistics.mean(decomposed):>9.2f} {max(decomposed):>9.2f} "
+              f"{statistics.mean(joint) if joint else float('nan'):>14.2f} {max(joint, default=float('nan')):>13.2f} "
+              f"{len(moves) - len(joint):>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Minesweeper Self-Play Benchmark
+===============================
+
+Plays seeded Minesweeper games without a UI and reports how well and how fast a move policy
+plays. Games are spread over a pool of worker processes, and game i of every difficulty uses seed
+--seed + i, so two runs of the same command play the same boards.
+
+Columns:
+    win %       The share of games won.
+    ms/move     The wall-clock time per move, including the policy and the reveal.
+    ground ms   The grounding time per game.
+    solve ms    The solving time per game, including the mine probabilities of guesses.
+    games/s     The number of games finished per second of wall-clock time, over all workers.
+
+Difficulties are the names of the game (Easy, Medium, Hard) or boards given as ROWSxCOLSxMINES.
+
+Usage:
+    python -m benchmarks.minesweeper_selfplay --difficulties Easy Medium Hard --games 100 --policy inference
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import multiprocessing
+import time
+from apps.minesweeper_board import DIFFICULTIES
+from apps.minesweeper_simulator import POLICIES, play_game
+from apps.solver_budget import SolveBudget
+
+
+def parse_difficulty(name):
+    """
+    Get the board of a difficulty.
+
+    Args:
+        name (str): A difficulty of the game, or a board as ROWSxCOLSxMINES.
+
+    Returns:
+        tuple: The number of rows, columns and mines.
+    """
+    if name in DIFFICULTIES:
+        return DIFFICULTIES[name]
+    rows, cols, num_mines = (int(value) for value in name.split("x"))
+    return rows, cols, num_mines
+
+
+def main():
+    """
+    Play the requested games for every difficulty and print one table row per difficulty.
+    """
+    parser = argparse.ArgumentParser(description="Play Minesweeper games headlessly with a move policy.")
+    parser.add_argument("--difficulties", nargs="+", default=list(DIFFICULTIES), help="Difficulties or ROWSxCOLSxMINES boards.")
+    parser.add_argument("--games", type=int, default=100, help="Games per difficulty.")
+    parser.add_argument("--policy", choices=sorted(POLICIES), default="inference", help="The move policy.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, default one per CPU.")
+    parser.add_argument("--time-limit", type=float, default=5.0, help="Time limit of every solver call in seconds.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed of the first game.")
+    args = parser.parse_args()
+
+    budget = SolveBudget(time_limit=args.time_limit)
+    print(f"{'difficulty':<12} {'games':>6} {'win %':>6} {'ms/move':>8} {'ground ms':>10} {'solve ms':>9} {'games/s':>8}")
+    with multiprocessing.get_context("spawn").Pool(args.workers) as pool:
+        for name in args.difficulties:
+            rows, cols, num_mines = parse_difficulty(name)
+            jobs = [(rows, cols, num_mines, args.policy, args.seed + i, budget) for i in range(args.games)]
+            start = time.perf_counter()
+            results = pool.starmap(play_game, jobs)
+            elapsed = time.perf_counter() - start
+
+            moves = sum(result["moves"] for result in results)
+            print(f"{name:<12} {len(results):>6} {100 * sum(result['won'] for result in results) / len(results):>6.1f} "
+                  f"{1000 * sum(result['time'] for result in results) / moves:>8.2f} "
+                  f"{1000 * sum(result['ground'] for result in results) / len(results):>10.2f} "
+                  f"{1000 * sum(result['solve'] for result in results) / len(results):>9.2f} "
+                  f"{len(results) / elapsed:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
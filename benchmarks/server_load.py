@@ -0,0 +1,195 @@
+"""
+Solver Server Load Test
+=======================
+
+Sends requests to a running solver server (server.py) from many concurrent clients and reports
+the latency percentiles and the throughput. Every client keeps one connection open and sends its
+requests one after the other.
+
+The requests are a mix of Sudoku solves and hints for the puzzles of the benchmark corpus and
+Minesweeper safe-cell queries for seeded games after their first click. --distinct limits the
+number of different boards, so that a small value shows how much the server saves by coalescing
+identical requests.
+
+Columns:
+    route      The request path, and "all" for every request.
+    ok         The number of 200 answers.
+    busy       The number of 503 answers, i.e. requests rejected by the backpressure.
+    p50 ms     The median latency.
+    p99 ms     The 99th percentile of the latency.
+    req/s      The number of answered requests per second of wall-clock time.
+
+With --start a server is started in this process on a free port, so no separate server is needed.
+
+Usage:
+    python server.py --port 8765 --workers 4
+    python -m benchmarks.server_load --port 8765 --requests 2000 --concurrency 32
+    python -m benchmarks.server_load --start --workers 4 --requests 2000 --concurrency 64 --distinct 10
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from apps.minesweeper_board import DIFFICULTIES
+from apps.minesweeper_simulator import SimulatedGame
+from apps.sudoku_engine import format_board
+from benchmarks.sudoku_suite import load_corpus
+from server import SolverServer
+
+ROUTE_NAMES = ("/sudoku/solve", "/sudoku/hint", "/minesweeper/safe")
+
+
+def build_requests(count, distinct, seed=1):
+    """
+    Build the requests of a load test.
+
+    Args:
+        count (int): The number of requests.
+        distinct (int): The number of different requests per route, None for as many as there are
+            boards.
+        seed (int): The seed for the order of the requests and the Minesweeper games.
+
+    Returns:
+        list: The (path, payload) of every request.
+    """
+    rng = random.Random(seed)
+    boards = [format_board(puzzle["board"]) for puzzle in load_corpus()]
+    games = []
+    for i, (rows, cols, num_mines) in enumerate(list(DIFFICULTIES.values()) * 4):
+        game = SimulatedGame(rows, cols, num_mines, seed + i)
+        game.click(*game.start)
+        games.append({"rows": rows, "cols": cols, "mines": num_mines,
+                      "numbers": [[row, col, number] for (row, col), number in sorted(game.numbers().items())]})
+    payloads = {
+        "/sudoku/solve": [{"board": board} for board in boards],
+        "/sudoku/hint": [{"board": board} for board in boards],
+        "/minesweeper/safe": games,
+    }
+    if distinct is not None:
+        payloads = {path: options[:distinct] for path, options in payloads.items()}
+    return [(path, rng.choice(payloads[path])) for path in (rng.choice(ROUTE_NAMES) for _ in range(count))]
+
+
+async def send(reader, writer, path, payload):
+    """
+    Send one request over an open connection and read its answer.
+
+    Args:
+        reader (asyncio.StreamReader): The reader of the connection.
+        writer (asyncio.StreamWriter): The writer of the connection.
+        path (str): The request path.
+        payload (dict): The JSON payload.
+
+    Returns:
+        tuple: The HTTP status code and the JSON answer.
+    """
+    body = json.dumps(payload).encode("utf-8")
+    writer.write(f"POST {path} HTTP/1.1\r\nHost: localhost\r\nContent-Type: application/json\r\n"
+                 f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body)
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length))
+
+
+async def client(host, port, requests, results):
+    """
+    Send requests one after the other over one connection.
+
+    Args:
+        host (str): The address of the server.
+        port (int): The port of the server.
+        requests (list): The (path, payload) of the requests of this client.
+        results (list): The (path, status, seconds) of every request is appended.
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for path, payload in requests:
+            start = time.perf_counter()
+            status, _ = await send(reader, writer, path, payload)
+            results.append((path, status, time.perf_counter() - start))
+    finally:
+        writer.close()
+
+
+def percentile(values, share):
+    """
+    Get a percentile of some values.
+
+    Args:
+        values (list): The values, in any order.
+        share (float): The percentile as a share, e.g. 0.99.
+
+    Returns:
+        float: The smallest value that is at least as large as the given share of the values.
+    """
+    values = sorted(values)
+    return values[min(len(values) - 1, int(share * len(values)))] if values else float("nan")
+
+
+async def run(args):
+    """
+    Run the load test and print the table.
+
+    Args:
+        args (argparse.Namespace): The options of the command line.
+    """
+    server = listener = None
+    host, port = args.host, args.port
+    if args.start:
+        server = SolverServer(args.workers, args.queue)
+        listener = await asyncio.start_server(server.handle, "127.0.0.1", 0)
+        host, port = listener.sockets[0].getsockname()[:2]
+
+    requests = build_requests(args.requests, args.distinct, args.seed)
+    if args.warmup:
+        await asyncio.gather(*(client(host, port, requests[i::args.concurrency][:1], []) for i in range(args.concurrency)))
+    results = []
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests[i::args.concurrency], results) for i in range(args.concurrency)))
+    elapsed = time.perf_counter() - start
+
+    print(f"{'route':<18} {'ok':>6} {'busy':>6} {'p50 ms':>8} {'p99 ms':>8} {'req/s':>8}")
+    for route in ROUTE_NAMES + ("all",):
+        rows = [result for result in results if route in ("all", result[0])]
+        ok = [seconds for _, status, seconds in rows if status == 200]
+        busy = sum(1 for _, status, _ in rows if status == 503)
+        print(f"{route:<18} {len(ok):>6} {busy:>6} {percentile(ok, 0.5) * 1000:>8.2f} "
+              f"{percentile(ok, 0.99) * 1000:>8.2f} {len(rows) / elapsed:>8.1f}")
+    if server is not None:
+        print(f"server: {server.counters}")
+        listener.close()
+        server.shutdown()
+
+
+def main():
+    """
+    Parse the command line and run the load test.
+    """
+    parser = argparse.ArgumentParser(description="Load test the solver server.")
+    parser.add_argument("--host", default="127.0.0.1", help="The address of the server.")
+    parser.add_argument("--port", type=int, default=8765, help="The port of the server.")
+    parser.add_argument("--start", action="store_true", help="Start a server in this process instead.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes of a started server.")
+    parser.add_argument("--queue", type=int, default=None, help="Queued jobs of a started server.")
+    parser.add_argument("--requests", type=int, default=1000, help="The total number of requests.")
+    parser.add_argument("--concurrency", type=int, default=16, help="The number of concurrent clients.")
+    parser.add_argument("--distinct", type=int, default=None, help="Different boards per route, default all.")
+    parser.add_argument("--no-warmup", dest="warmup", action="store_false", help="Skip the warm-up request per client.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the request mix.")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
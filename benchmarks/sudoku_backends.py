@@ -0,0 +1,57 @@
+"""
+Sudoku Backend Benchmark
+========================
+
+Compares the solver backends of the Sudoku engine on the same puzzles. For every box size a set
+of unique-solution puzzles is generated, and every backend solves all of them. The clingo backend
+pays for a new control per puzzle, the session backend is ground once before timing starts.
+
+Usage:
+    python -m benchmarks.sudoku_backends --sizes 3 4 --count 20
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import statistics
+import time
+from apps.sudoku_engine import SudokuEngine
+from apps.sudoku_generator import SudokuGenerator
+
+CLUE_SHARE = {3: 0, 4: 0.45, 5: 0.55}
+
+
+def main():
+    """
+    Solve the same generated puzzles with every backend and print per-puzzle timings.
+    """
+    parser = argparse.ArgumentParser(description="Compare the Sudoku solver backends.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 4], help="Box sizes to measure.")
+    parser.add_argument("--count", type=int, default=20, help="Puzzles per box size.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the generated puzzles.")
+    args = parser.parse_args()
+
+    engine = SudokuEngine()
+    print(f"{'n':>2} {'backend':<12} {'mean ms':>9} {'median ms':>10} {'max ms':>9}")
+    for n in args.sizes:
+        generator = SudokuGenerator(engine.session(n), seed=args.seed)
+        clues = round(CLUE_SHARE.get(n, 0.5) * n ** 4)
+        puzzles = [puzzle for puzzle, _ in generator.generate_batch(args.count, clues)]
+        solutions = None
+        for backend in ("clingo", "session", "propagation", "auto"):
+            timings = []
+            results = []
+            for puzzle in puzzles:
+                start = time.perf_counter()
+                results.append(engine.solve(puzzle, backend))
+                timings.append((time.perf_counter() - start) * 1000)
+            if solutions is None:
+                solutions = results
+            elif results != solutions:
+                raise AssertionError(f"Backend {backend} disagrees on the solutions for n={n}")
+            print(f"{n:>2} {backend:<12} {statistics.mean(timings):>9.2f} "
+                  f"{statistics.median(timings):>10.2f} {max(timings):>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
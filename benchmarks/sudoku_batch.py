@@ -0,0 +1,44 @@
+"""
+Sudoku Batch Benchmark
+======================
+
+Solves a puzzle pack with the headless Sudoku engine and reports the throughput. The pack is a
+text file with one puzzle per line in the one-line string form ('.' or '0' for empty cells).
+
+Usage:
+    python -m benchmarks.sudoku_batch puzzles.txt --backend session
+
+The clingo and session backends both solve the whole pack on one warm session per box size
+(see SudokuEngine.solve_batch), so the pack is ground once and not once per puzzle.
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import time
+from apps.sudoku_engine import SudokuEngine, parse_board
+
+
+def main():
+    """
+    Solve every puzzle of the given pack and print the number of puzzles solved per second.
+    """
+    parser = argparse.ArgumentParser(description="Solve a Sudoku puzzle pack and report the throughput.")
+    parser.add_argument("pack", help="Text file with one puzzle per line.")
+    parser.add_argument("--backend", default="auto", choices=SudokuEngine.BACKENDS, help="Solver backend.")
+    args = parser.parse_args()
+
+    with open(args.pack, encoding="utf-8") as f:
+        boards = [parse_board(line) for line in f if line.strip() and not line.startswith("#")]
+
+    engine = SudokuEngine()
+    start = time.perf_counter()
+    solutions = engine.solve_batch(boards, args.backend)
+    elapsed = time.perf_counter() - start
+
+    solved = sum(1 for solution in solutions if solution is not None)
+    print(f"Solved {solved}/{len(boards)} puzzles in {elapsed:.3f} s ({len(boards) / elapsed:.1f} puzzles/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Sudoku Generation Benchmark
+===========================
+
+Generates unique-solution puzzles in bulk and reports the generation rate. The puzzles can be
+written to a puzzle pack with one puzzle per line, or appended to a puzzle bank file.
+
+Usage:
+    python -m benchmarks.sudoku_generate --count 100 --clues 0 --output puzzles.txt
+    python -m benchmarks.sudoku_generate --count 10000 --clues 0 --bank banks/sudoku_hard.bin
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import time
+from apps.sudoku_engine import format_board
+from apps.sudoku_generator import SudokuGenerator
+from apps.puzzle_bank import PuzzleBank
+
+
+def main():
+    """
+    Generate the requested number of puzzles and print the number of puzzles generated per second.
+    """
+    parser = argparse.ArgumentParser(description="Generate unique-solution Sudoku puzzles in bulk.")
+    parser.add_argument("--count", type=int, default=100, help="Number of puzzles to generate.")
+    parser.add_argument("--clues", type=int, default=0, help="Clues to keep, 0 for minimal puzzles.")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for reproducible puzzles.")
+    parser.add_argument("--output", default=None, help="Write the puzzles to this file.")
+    parser.add_argument("--bank", default=None, help="Append the puzzles to this puzzle bank.")
+    args = parser.parse_args()
+
+    generator = SudokuGenerator(seed=args.seed)
+    start = time.perf_counter()
+    puzzles = generator.generate_batch(args.count, args.clues)
+    elapsed = time.perf_counter() - start
+
+    clues = [sum(1 for row in puzzle for value in row if value) for puzzle, _ in puzzles]
+    print(f"Generated {len(puzzles)} puzzles in {elapsed:.3f} s ({len(puzzles) / elapsed:.1f} puzzles/s)")
+    print(f"Clues: min {min(clues)}, mean {sum(clues) / len(clues):.1f}, max {max(clues)}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            for puzzle, _ in puzzles:
+                f.write(format_board(puzzle) + "\n")
+
+    if args.bank:
+        bank = PuzzleBank(args.bank)
+        bank.append((puzzle, solution, args.clues) for puzzle, solution in puzzles)
+        print(f"{args.bank} now holds {bank.remaining()} puzzles")
+        bank.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Sudoku Scaling Benchmark
+========================
+
+Reports the ground program size, the grounding time and the solving time of the Sudoku
+encodings for box sizes n = 3, 4 and 5 (9x9, 16x16 and 25x25 boards).
+
+Three encodings are compared on the same puzzles:
+    sum      ASPSolvers/sudokuSolver.lp as shipped, with the #sum all-different constraints.
+    count    The same encoding with every #sum constraint replaced by "each value exactly once"
+             #count constraints, to isolate the cost of the #sum aggregates.
+    session  ASPSolvers/sudokuSession.lp, ground once without clues, clues passed as assumptions.
+
+Usage:
+    python -m benchmarks.sudoku_scaling --sizes 3 4 5 --fill 0.6
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import random
+import time
+import clingo
+from apps.sudoku_engine import SUDOKU_PROGRAM, SESSION_PROGRAM, SudokuSession, board_to_facts
+from apps.sudoku_generator import SudokuGenerator
+
+SUM_CONSTRAINTS = (
+    ":-#sum{1,X,V:sudoku(X,Y,S,V)} != n*n, X=(1..n*n).",
+    ":-#sum{1,Y,V:sudoku(X,Y,S,V)} != n*n, Y=(1..n*n).",
+    ":-#sum{1,S,V:sudoku(X,Y,S,V)} != n*n, S=(0..n*n-1).",
+)
+COUNT_CONSTRAINTS = (
+    ":- X=1..n*n, v(V), #count{Y : sudoku(X,Y,S,V)} != 1.",
+    ":- Y=1..n*n, v(V), #count{X : sudoku(X,Y,S,V)} != 1.",
+    ":- S=0..n*n-1, v(V), #count{X,Y : sudoku(X,Y,S,V)} != 1.",
+)
+
+
+def load_encodings():
+    """
+    Load the encodings that are compared.
+
+    Returns:
+        dict: The program text of the sum and count encodings by name.
+    """
+    with open(SUDOKU_PROGRAM, encoding="UTF-8") as f:
+        program = f.read()
+    count_program = program
+    for old, new in zip(SUM_CONSTRAINTS, COUNT_CONSTRAINTS):
+        if old not in count_program:
+            raise ValueError(f"Constraint not found in {SUDOKU_PROGRAM}: {old}")
+        count_program = count_program.replace(old, new)
+    return {"sum": program, "count": count_program}
+
+
+def measure_program(program, board, n):
+    """
+    Ground and solve a one-shot encoding with the clues of a board as facts.
+
+    Args:
+        program (str): The encoding.
+        board (list): The board as a list of rows, with 0 for empty cells.
+        n (int): The box size of the board.
+
+    Returns:
+        dict: The ground atoms and rules, the grounding time and the solving time.
+    """
+    ctl = clingo.Control(["--warn=none", "-c", f"n={n}"])
+    ctl.add("base", [], program)
+    ctl.add("base", [], board_to_facts(board))
+    start = time.perf_counter()
+    ctl.ground([("base", [])])
+    ground_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = ctl.solve()
+    solve_time = time.perf_counter() - start
+    lp = ctl.statistics["problem"]["lp"]
+    return {
+        "atoms": int(lp["atoms"]),
+        "rules": int(lp["rules"]),
+        "ground": ground_time,
+        "solve": solve_time,
+        "sat": result.satisfiable,
+    }
+
+
+def measure_session(board, n):
+    """
+    Ground the multi-shot encoding and solve a board under assumptions.
+
+    Args:
+        board (list): The board as a list of rows, with 0 for empty cells.
+        n (int): The box size of the board.
+
+    Returns:
+        dict: The ground atoms and rules, the grounding time and the solving time.
+    """
+    start = time.perf_counter()
+    session = SudokuSession(n, SESSION_PROGRAM)
+    ground_time = time.perf_counter() - start
+    start = time.perf_counter()
+    solution = session.solve(board)
+    solve_time = time.perf_counter() - start
+    lp = session.ctl.statistics["problem"]["lp"]
+    return {
+        "atoms": int(lp["atoms"]),
+        "rules": int(lp["rules"]),
+        "ground": ground_time,
+        "solve": solve_time,
+        "sat": solution is not None,
+    }
+
+
+def main():
+    """
+    Measure every encoding for every requested box size and print one table row per run.
+    """
+    parser = argparse.ArgumentParser(description="Measure grounding size and time of the Sudoku encodings.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[3, 4, 5], help="Box sizes to measure.")
+    parser.add_argument("--fill", type=float, default=0.6, help="Share of cells that keep their clue.")
+    parser.add_argument("--seed", type=int, default=1, help="Seed for the generated puzzles.")
+    args = parser.parse_args()
+
+    encodings = load_encodings()
+    rng = random.Random(args.seed)
+    print(f"{'n':>2} {'encoding':<8} {'atoms':>9} {'rules':>9} {'ground ms':>10} {'solve ms':>10}")
+    for n in args.sizes:
+        solution = SudokuGenerator(SudokuSession(n), seed=args.seed).complete_grid()
+        board = [[value if rng.random() < args.fill else 0 for value in row] for row in solution]
+
+        results = {name: measure_program(program, board, n) for name, program in encodings.items()}
+        results["session"] = measure_session(board, n)
+        for name, result in results.items():
+            print(f"{n:>2} {name:<8} {result['atoms']:>9} {result['rules']:>9} "
+                  f"{result['ground'] * 1000:>10.1f} {result['solve'] * 1000:>10.1f}"
+                  f"{'' if result['sat'] else '  UNSAT'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,235 @@
+"""
+Sudoku Benchmark Suite
+======================
+
+Runs the curated puzzle corpus in benchmarks/sudoku_corpus.txt through the Sudoku ASP solver and
+reports, for every puzzle and in total, how long grounding and solving took and how much search
+the solver needed. The results can be written as JSON and compared with the results of another
+commit, and tests/test_sudoku_benchmark.py fails when they regress past a threshold.
+
+Columns:
+    clues       The number of clues of the puzzle.
+    ground ms   The grounding time.
+    solve ms    The solving time.
+    choices     The number of decisions of the solver.
+    conflicts   The number of conflicts of the solver.
+
+Two backends of the SudokuEngine can be measured:
+    clingo   ASPSolvers/sudokuSolver.lp, ground and solved with a new Clingo control per puzzle.
+    session  ASPSolvers/sudokuSession.lp, ground once, so only the solve step is measured per
+             puzzle and the grounding time is reported once in the totals.
+
+Times are the minimum over --repeat runs. Choices and conflicts do not depend on the machine, but
+they may change with the Clingo version.
+
+Usage:
+    python -m benchmarks.sudoku_suite --backend clingo --repeat 3 --output results.json
+    python -m benchmarks.sudoku_suite --baseline results.json --threshold 0.25
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import json
+import sys
+import time
+import clingo
+from apps.sudoku_engine import SUDOKU_PROGRAM, SudokuSession, board_to_facts, parse_board
+
+CORPUS = "benchmarks/sudoku_corpus.txt"
+BACKENDS = ("clingo", "session")
+METRICS = ("ground", "solve", "choices", "conflicts")
+MIN_SLACK = {"ground": 0.005, "solve": 0.005, "choices": 10, "conflicts": 10}
+
+
+def load_corpus(path=CORPUS):
+    """
+    Load the puzzles of a corpus file.
+
+    Args:
+        path (str): A text file with one "category name puzzle" line per puzzle. Empty lines and
+            lines starting with '#' are skipped.
+
+    Returns:
+        list: A dict with the category, the name and the board of every puzzle, in file order.
+    """
+    puzzles = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            category, name, puzzle = line.split()
+            puzzles.append({"category": category, "name": name, "board": parse_board(puzzle)})
+    return puzzles
+
+
+def solver_stats(ctl):
+    """
+    Get the search statistics of the last solve call of a control.
+
+    Args:
+        ctl (clingo.Control): The control.
+
+    Returns:
+        dict: The number of choices and conflicts.
+    """
+    solvers = ctl.statistics["solving"]["solvers"]
+    return {"choices": int(solvers["choices"]), "conflicts": int(solvers["conflicts"])}
+
+
+def measure_clingo(program, board):
+    """
+    Ground and solve the one-shot encoding with the clues of a board as facts.
+
+    Args:
+        program (str): The encoding.
+        board (list): The board as a list of rows, with 0 for empty cells.
+
+    Returns:
+        dict: The grounding time, the solving time, the choices, the conflicts and whether the
+        board was solved.
+    """
+    ctl = clingo.Control(["--warn=none", "-c", "n=3"])
+    ctl.add("base", [], program)
+    ctl.add("base", [], board_to_facts(board))
+    start = time.perf_counter()
+    ctl.ground([("base", [])])
+    ground_time = time.perf_counter() - start
+    start = time.perf_counter()
+    result = ctl.solve()
+    solve_time = time.perf_counter() - start
+    return {"ground": ground_time, "solve": solve_time, **solver_stats(ctl), "sat": result.satisfiable}
+
+
+def measure_session(session, board):
+    """
+    Solve a board with a session that is already ground.
+
+    Args:
+        session (SudokuSession): The session.
+        board (list): The board as a list of rows, with 0 for empty cells.
+
+    Returns:
+        dict: The grounding time (always 0), the solving time, the choices, the conflicts and
+        whether the board was solved.
+    """
+    start = time.perf_counter()
+    solution = session.solve(board)
+    solve_time = time.perf_counter() - start
+    return {"ground": 0.0, "solve": solve_time, **solver_stats(session.ctl), "sat": solution is not None}
+
+
+def run_suite(puzzles, backend="clingo", repeat=1):
+    """
+    Measure every puzzle of a corpus.
+
+    Args:
+        puzzles (list): The puzzles, as returned by load_corpus.
+        backend (str): One of BACKENDS.
+        repeat (int): The number of runs per puzzle. The fastest run is kept.
+
+    Returns:
+        dict: The backend, the Clingo version, the results of every puzzle and their totals, ready
+        to be written as JSON.
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}, expected one of {', '.join(BACKENDS)}")
+    setup = 0.0
+    if backend == "clingo":
+        with open(SUDOKU_PROGRAM, encoding="UTF-8") as f:
+            program = f.read()
+        measure = lambda board: measure_clingo(program, board)
+    else:
+        start = time.perf_counter()
+        session = SudokuSession(3)
+        setup = time.perf_counter() - start
+        measure = lambda board: measure_session(session, board)
+
+    results = []
+    for puzzle in puzzles:
+        runs = [measure(puzzle["board"]) for _ in range(max(1, repeat))]
+        best = min(runs, key=lambda run: run["ground"] + run["solve"])
+        results.append({
+            "category": puzzle["category"],
+            "name": puzzle["name"],
+            "clues": sum(1 for row in puzzle["board"] for value in row if value),
+            **best,
+        })
+
+    totals = {metric: sum(result[metric] for result in results) for metric in METRICS}
+    totals["ground"] += setup
+    totals["solved"] = sum(1 for result in results if result["sat"])
+    return {"backend": backend, "clingo": clingo.__version__, "puzzles": results, "totals": totals}
+
+
+def compare(baseline, current, threshold=0.25):
+    """
+    Find the measurements that got worse than a baseline by more than a threshold.
+
+    Every metric of every puzzle and of the totals is compared. A value regresses when it exceeds
+    the baseline value times 1 + threshold, and also exceeds it by more than MIN_SLACK, so that
+    timer noise on tiny values and the few choices of easy puzzles are not reported.
+
+    Args:
+        baseline (dict): Earlier results of run_suite, e.g. loaded from JSON.
+        current (dict): The results of run_suite to check.
+        threshold (float): The allowed relative increase, e.g. 0.25 for 25%.
+
+    Returns:
+        list: A message for every regression, empty if there is none.
+    """
+    regressions = []
+    previous = {(result["category"], result["name"]): result for result in baseline["puzzles"]}
+    rows = [(f"{result['category']}/{result['name']}", previous.get((result["category"], result["name"])), result)
+            for result in current["puzzles"]]
+    rows.append(("totals", baseline["totals"], current["totals"]))
+    for label, before, after in rows:
+        if before is None:
+            continue
+        if before.get("sat", True) and not after.get("sat", True):
+            regressions.append(f"{label}: no longer solved")
+        for metric in METRICS:
+            old, new = before[metric], after[metric]
+            if new > old * (1 + threshold) and new - old > MIN_SLACK[metric]:
+                regressions.append(f"{label}: {metric} {old:g} -> {new:g}")
+    return regressions
+
+
+def main():
+    """
+    Run the corpus, print one table row per puzzle and the totals, and optionally write the
+    results as JSON or compare them with a baseline.
+    """
+    parser = argparse.ArgumentParser(description="Run the Sudoku benchmark corpus through the ASP solver.")
+    parser.add_argument("--corpus", default=CORPUS, help="The corpus file.")
+    parser.add_argument("--backend", choices=BACKENDS, default="clingo", help="Solver backend.")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per puzzle, the fastest is kept.")
+    parser.add_argument("--output", help="Write the results as JSON to this file.")
+    parser.add_argument("--baseline", help="Compare the results with this JSON file of earlier results.")
+    parser.add_argument("--threshold", type=float, default=0.25, help="Allowed relative regression.")
+    args = parser.parse_args()
+
+    results = run_suite(load_corpus(args.corpus), args.backend, args.repeat)
+    print(f"{'category':<13} {'name':<22} {'clues':>5} {'ground ms':>10} {'solve ms':>9} {'choices':>8} {'conflicts':>9}")
+    for result in results["puzzles"]:
+        print(f"{result['category']:<13} {result['name']:<22} {result['clues']:>5} {result['ground'] * 1000:>10.2f} "
+              f"{result['solve'] * 1000:>9.2f} {result['choices']:>8} {result['conflicts']:>9}"
+              f"{'' if result['sat'] else '  UNSAT'}")
+    totals = results["totals"]
+    print(f"{'total':<13} {str(totals['solved']) + ' solved':<22} {'':>5} {totals['ground'] * 1000:>10.2f} "
+          f"{totals['solve'] * 1000:>9.2f} {totals['choices']:>8} {totals['conflicts']:>9}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(json.load(f), results, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
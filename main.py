@@ -12,6 +12,7 @@ import platform
 from PIL import Image, ImageTk
 from apps.minesweeper_app import MinesweeperApp
 from apps.sudoku_app import SudokuApp
+from apps.tk_profiler import install_from_env
 
 if platform.system() == "Darwin":
     from tkmacosx import Button
@@ -93,6 +94,7 @@ class MainMenu:
         self.root.update()
 
 if __name__ == "__main__":
+    install_from_env()
     tk_root = tk.Tk()
     MainMenu(tk_root)
     tk_root.mainloop()
@@ -0,0 +1,307 @@
+"""
+Solver Server
+=============
+
+This module serves the solvers of the games to several front-ends from one process, without a
+tkinter window per user. It is a small HTTP/1.1 server on asyncio that takes board states as JSON
+and answers with JSON:
+
+    POST /sudoku/solve       {"board": "53..7....6..195..."}              -> {"solution": "534678..."}
+    POST /sudoku/hint        {"board": "53..7....6..195..."}              -> {"forced": [[row, col, value], ...]}
+    POST /minesweeper/safe   {"rows": 8, "cols": 8, "mines": 10,
+                              "numbers": [[row, col, count], ...]}        -> {"safe": [...], "mines": [...]}
+    GET  /health                                                          -> the counters of the server
+
+The jobs of apps/solver_jobs.py run in a bounded pool of worker processes, with the budgets of
+conf.yaml. Identical requests that arrive while the first one is still being solved are coalesced:
+they wait for the same job instead of starting their own. Once as many jobs are in flight as the
+workers plus the queue allow, new requests are rejected with 503 and a Retry-After header, so a
+burst of clients cannot pile up unbounded work.
+
+Usage:
+    python server.py --port 8765 --workers 4 --queue 8
+    python server.py --unix /tmp/puzzlefusion.sock
+
+Authors: Alexander Forsanker, Ivo Östberg Nilsson, Joel Scarinius Stävmo, Linus Savinainen
+Created: Saturday, October 17th, 2026
+"""
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from apps.solver_budget import load_budgets
+from apps.solver_jobs import minesweeper_safe, sudoku_hint, sudoku_solve
+
+ROUTES = {
+    "/sudoku/solve": ("solve", sudoku_solve),
+    "/sudoku/hint": ("hint", sudoku_hint),
+    "/minesweeper/safe": ("hint", minesweeper_safe),
+}
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+    503: "Service Unavailable",
+}
+MAX_BODY = 1 << 20
+
+
+class Saturated(Exception):
+    """
+    Saturated Class
+    ---------------
+    Raised when a request would exceed the number of jobs the server keeps in flight.
+    """
+
+
+class SolverServer:
+    """
+    SolverServer Class
+    ------------------
+    Dispatches requests to a bounded worker pool, coalescing identical requests.
+    """
+
+    def __init__(self, workers=None, queue=None, budgets=None, executor=None):
+        """
+        Initializes the server. The worker processes are started with the first job.
+
+        Args:
+            workers (int): The number of worker processes, None for one per CPU.
+            queue (int): The number of jobs that may wait for a free worker, None for twice the
+                number of workers.
+            budgets (dict): The SolveBudget of every operation, None to load them from conf.yaml.
+            executor (concurrent.futures.Executor): The executor of the jobs, None for a pool of
+                worker processes.
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.limit = self.workers + (2 * self.workers if queue is None else queue)
+        self.budgets = budgets or load_budgets()
+        self.executor = executor or ProcessPoolExecutor(max_workers=self.workers, mp_context=multiprocessing.get_context("spawn"))
+        self.routes = dict(ROUTES)
+        self.in_flight = {}
+        self.counters = {"requests": 0, "jobs": 0, "coalesced": 0, "rejected": 0, "errors": 0}
+
+    async def dispatch(self, path, payload):
+        """
+        Answer a request, joining the job of an identical request that is still in flight.
+
+        Args:
+            path (str): The route of the request.
+            payload (dict): The JSON payload of the request.
+
+        Returns:
+            dict: The answer of the job.
+
+        Raises:
+            Saturated: If the limit of jobs in flight is reached.
+        """
+        key = (path, json.dumps(payload, sort_keys=True))
+        future = self.in_flight.get(key)
+        if future is not None:
+            self.counters["coalesced"] += 1
+        else:
+            if len(self.in_flight) >= self.limit:
+                self.counters["rejected"] += 1
+                raise Saturated()
+            name, job = self.routes[path]
+            future = asyncio.get_running_loop().run_in_executor(self.executor, job, payload, self.budgets[name])
+            self.counters["jobs"] += 1
+            self.in_flight[key] = future
+            future.add_done_callback(lambda _: self.in_flight.pop(key, None))
+        return await asyncio.shield(future)
+
+    async def respond(self, method, path, body):
+        """
+        Answer one HTTP request.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path.
+            body (bytes): The request body.
+
+        Returns:
+            tuple: The HTTP status code and the JSON answer.
+        """
+        self.counters["requests"] += 1
+        if path == "/health":
+            return 200, {**self.counters, "in_flight": len(self.in_flight), "limit": self.limit, "workers": self.workers}
+        error = self.route_error(method, path)
+        if error is not None:
+            return error
+        try:
+            payload = parse_payload(body)
+        except ValueError as err:
+            return 400, {"error": f"Invalid JSON: {err}"}
+        return await self.answer(path, payload)
+
+    def route_error(self, method, path):
+        """
+        Check that a request goes to a solver route with the right method.
+
+        Args:
+            method (str): The HTTP method.
+            path (str): The request path.
+
+        Returns:
+            tuple: The HTTP status code and the JSON error, or None if the route can answer the request.
+        """
+        if path not in self.routes:
+            return 404, {"error": f"Unknown path {path}"}
+        if method != "POST":
+            return 405, {"error": f"{path} only accepts POST"}
+        return None
+
+    async def answer(self, path, payload):
+        """
+        Answer a request to a solver route, turning the errors of its job into HTTP errors.
+
+        Args:
+            path (str): The route of the request.
+            payload (dict): The JSON payload of the request.
+
+        Returns:
+            tuple: The HTTP status code and the JSON answer.
+        """
+        try:
+            return 200, await self.dispatch(path, payload)
+        except Saturated:
+            return 503, {"error": "All solver workers are busy, try again later"}
+        except (ValueError, KeyError, TypeError) as err:
+            return 400, {"error": f"Invalid request: {err}"}
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            self.counters["errors"] += 1
+            return 500, {"error": f"Solver error: {err}"}
+
+    async def handle(self, reader, writer):
+        """
+        Serve the requests of one connection until the client closes it or asks to close it.
+
+        Args:
+            reader (asyncio.StreamReader): The reader of the connection.
+            writer (asyncio.StreamWriter): The writer of the connection.
+        """
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, path, version = request_line.decode("latin-1").split()
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length > MAX_BODY:
+                    status, answer = 400, {"error": "Request body too large"}
+                    keep_alive = False
+                else:
+                    status, answer = await self.respond(method, path.split("?")[0], await reader.readexactly(length))
+                    keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                writer.write(http_response(status, answer, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+    def shutdown(self):
+        """
+        Stop the worker processes.
+        """
+        self.executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_payload(body):
+    """
+    Parse the JSON payload of a request.
+
+    Args:
+        body (bytes): The request body, empty for an empty payload.
+
+    Returns:
+        dict: The payload.
+
+    Raises:
+        ValueError: If the body is not a JSON object.
+    """
+    payload = json.loads(body or b"{}")
+    if not isinstance(payload, dict):
+        raise ValueError("The body has to be a JSON object")
+    return payload
+
+
+def http_response(status, answer, keep_alive=True):
+    """
+    Encode an HTTP response with a JSON body.
+
+    Args:
+        status (int): The HTTP status code.
+        answer (dict): The JSON body.
+        keep_alive (bool): Whether the connection stays open for the next request.
+
+    Returns:
+        bytes: The response.
+    """
+    body = json.dumps(answer).encode("utf-8")
+    headers = [
+        f"HTTP/1.1 {status} {REASONS[status]}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    if status == 503:
+        headers.append("Retry-After: 1")
+    return ("\r\n".join(headers) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def serve(server, host="127.0.0.1", port=8765, unix=None):
+    """
+    Serve a SolverServer until the task is cancelled.
+
+    Args:
+        server (SolverServer): The server.
+        host (str): The address to listen on.
+        port (int): The TCP port to listen on.
+        unix (str): The path of a Unix socket to listen on instead of TCP, None for TCP.
+    """
+    if unix is not None:
+        listener = await asyncio.start_unix_server(server.handle, path=unix)
+    else:
+        listener = await asyncio.start_server(server.handle, host, port)
+    print(f"Serving on {unix or ', '.join(str(sock.getsockname()) for sock in listener.sockets)}", flush=True)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main():
+    """
+    Start the server with the options of the command line.
+    """
+    parser = argparse.ArgumentParser(description="Serve the Sudoku and Minesweeper solvers as a JSON HTTP service.")
+    parser.add_argument("--host", default="127.0.0.1", help="The address to listen on.")
+    parser.add_argument("--port", type=int, default=8765, help="The TCP port to listen on.")
+    parser.add_argument("--unix", help="Listen on this Unix socket path instead of TCP.")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes, default one per CPU.")
+    parser.add_argument("--queue", type=int, default=None, help="Jobs that may wait for a worker, default twice the workers.")
+    args = parser.parse_args()
+
+    server = SolverServer(args.workers, args.queue)
+    try:
+        asyncio.run(serve(server, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
 from apps.minesweeper_app import MinesweeperApp
+from apps.minesweeper_board import MinesweeperBoard
+from apps.minesweeper_generator import generate_board
+from collections import deque
 from tkinter import Tk
 import unittest
 from unittest.mock import patch
@@ -13,19 +16,44 @@ class TestMinesweeperApp(unittest.TestCase):
 
     def test_grid_creation(self):
         self.app.create_grid()
-        self.assertEqual(len(self.app.cells), self.app.grid_size)
-        self.assertEqual(len(self.app.cells[0]), self.app.grid_size)
+        self.assertEqual(len(self.app.grid.tiles), self.app.rows)
+        self.assertEqual(len(self.app.grid.tiles[0]), self.app.cols)
+
+    def test_custom_size(self):
+        self.app.rows, self.app.cols, self.app.num_mines = 100, 100, 1500
+        self.app.create_grid()
+        self.app.set_board(generate_board(100, 100, 1500, seed=1, attempts=1))
+        self.assertEqual(len(self.app.grid.items), 100)
+        self.assertEqual(len(self.app.mines), 1500)
+        self.assertEqual(self.app.grid.tiles[self.app.start[0]][self.app.start[1]], "hint")
+
+    def test_reveal_empty_board(self):
+        self.app.mines.clear()
+        self.app.board = MinesweeperBoard(self.app.rows, self.app.cols, self.app.mines)
+        self.app.reveal_cell(0, 0)
+        self.assertEqual(len(self.app.revealed), self.app.rows * self.app.cols)
+        self.assertEqual(self.app.grid.tiles[0][0], "0")
 
     def test_new_game_resets_state(self):
+        key = (self.app.rows, self.app.cols, self.app.num_mines)
+        self.app.pool.ready[key] = deque([generate_board(*key, seed=1)])
         self.app.new_game()
         self.assertFalse(self.app.game_over)
         self.assertEqual(len(self.app.mines), self.app.num_mines)
         self.assertEqual(len(self.app.revealed), 0)
         self.assertEqual(len(self.app.flags), 0)
 
+    def test_board_that_needs_guess_is_flagged(self):
+        self.app.set_board(({(0, 0)}, (4, 4), False))
+        self.assertFalse(self.app.no_guess)
+        self.assertIn("guess", self.root.title())
+        self.app.set_board(({(0, 0)}, (4, 4), True))
+        self.assertEqual(self.root.title(), "Minesweeper Game")
+
     @patch('tkinter.messagebox.showerror')
     def test_cell_clicked_game_over(self, mock_showerror):
         self.app.mines.add((0, 0))
+        self.app.revealed.add((4, 4))
         
         with patch.object(self.app, 'reset', return_value=None):
             self.app.cell_clicked(0, 0)
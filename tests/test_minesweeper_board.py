@@ -0,0 +1,52 @@
+from apps.minesweeper_board import MinesweeperBoard, neighbor_counts, random_mines
+import random
+import sys
+import unittest
+import numpy as np
+
+def brute_force_count(mines, rows, cols, row, col):
+    return sum((r, c) in mines for r in range(max(0, row - 1), min(rows, row + 2))
+               for c in range(max(0, col - 1), min(cols, col + 2)))
+
+class TestMinesweeperBoard(unittest.TestCase):
+    def test_counts_match_brute_force(self):
+        rng = random.Random(3)
+        for rows, cols, num_mines in [(1, 1, 0), (1, 7, 3), (8, 8, 10), (13, 29, 90)]:
+            mines = random_mines(rows, cols, num_mines, rng)
+            board = MinesweeperBoard(rows, cols, mines)
+            self.assertEqual(len(mines), num_mines)
+            for row in range(rows):
+                for col in range(cols):
+                    self.assertEqual(board.count(row, col), brute_force_count(mines, rows, cols, row, col))
+
+    def test_neighbor_counts(self):
+        mask = np.array([[1, 0, 0], [0, 0, 0], [0, 0, 1]])
+        self.assertEqual(neighbor_counts(mask).tolist(), [[1, 1, 0], [1, 2, 1], [0, 1, 1]])
+
+    def test_reveal_returns_new_cells(self):
+        board = MinesweeperBoard(4, 4, {(3, 3)})
+        revealed = set()
+        self.assertEqual(board.reveal(3, 3, revealed), {(3, 3)})
+        new = board.reveal(0, 0, revealed)
+        self.assertEqual(len(new), 15)
+        self.assertNotIn((3, 3), new)
+        self.assertEqual(len(revealed), 16)
+        self.assertEqual(board.reveal(0, 0, revealed), set())
+
+    def test_reveal_stops_at_numbers(self):
+        board = MinesweeperBoard(3, 5, {(0, 2), (1, 2), (2, 2)})
+        new = board.reveal(1, 0, set())
+        self.assertEqual(new, {(r, c) for r in range(3) for c in range(2)})
+
+    def test_large_empty_region(self):
+        board = MinesweeperBoard(300, 300, set())
+        new = board.reveal(150, 150, set())
+        self.assertGreater(300 * 300, sys.getrecursionlimit())
+        self.assertEqual(len(new), 300 * 300)
+
+    def test_number_facts(self):
+        board = MinesweeperBoard(2, 3, {(0, 0)})
+        self.assertEqual(board.number_facts([(1, 2), (0, 1)]), ["number(2,1,0).", "number(1,0,1)."])
+
+if __name__ == "__main__":
+    unittest.main()
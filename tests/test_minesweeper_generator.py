@@ -0,0 +1,71 @@
+from apps.minesweeper_board import MinesweeperBoard
+from apps.minesweeper_generator import BoardPool, generate_board, is_no_guess, safe_zone, simple_deductions
+from collections import deque
+from concurrent.futures import Future
+import time
+import unittest
+
+class TestMinesweeperGenerator(unittest.TestCase):
+    def test_safe_zone(self):
+        self.assertEqual(len(safe_zone(8, 8, 3, 3)), 9)
+        self.assertEqual(safe_zone(8, 8, 0, 0), {(0, 0), (0, 1), (1, 0), (1, 1)})
+
+    def test_generated_boards_need_no_guess(self):
+        for seed in range(5):
+            mines, start, no_guess = generate_board(8, 8, 10, seed=seed)
+            self.assertTrue(no_guess)
+            self.assertEqual(len(mines), 10)
+            self.assertFalse(mines & safe_zone(8, 8, *start))
+            self.assertTrue(is_no_guess(8, 8, mines, start))
+
+    def test_start_cell(self):
+        mines, start, _ = generate_board(9, 9, 10, start=(4, 7), seed=1)
+        self.assertEqual(start, (4, 7))
+        self.assertEqual(MinesweeperBoard(9, 9, mines).count(4, 7), 0)
+
+    def test_guess_is_detected(self):
+        # The mine is in one of the two cells of the last column, which no number can tell apart
+        self.assertFalse(is_no_guess(2, 5, {(0, 4)}, (0, 0)))
+        self.assertTrue(is_no_guess(1, 4, {(0, 3)}, (0, 0)))
+
+    def test_simple_deductions(self):
+        board = MinesweeperBoard(1, 4, {(0, 0)})
+        known_mines = set()
+        safe = simple_deductions(board, {(0, 1), (0, 3)}, known_mines)
+        self.assertEqual(known_mines, {(0, 0)})
+        self.assertEqual(safe, {(0, 2)})
+
+    def test_too_many_mines(self):
+        with self.assertRaises(ValueError):
+            generate_board(4, 4, 8, start=(1, 1))
+
+    def test_pool(self):
+        pool = BoardPool(size=1, workers=1)
+        try:
+            self.assertIsNone(pool.take(8, 8, 10))
+            deadline = time.time() + 60
+            board = None
+            while board is None and time.time() < deadline:
+                time.sleep(0.2)
+                board = pool.take(8, 8, 10)
+            self.assertIsNotNone(board)
+            mines, start, no_guess = board
+            self.assertEqual(len(mines), 10)
+            self.assertTrue(no_guess)
+        finally:
+            pool.shutdown()
+
+    def test_pool_prefers_no_guess_boards(self):
+        pool = BoardPool(size=2, workers=1)
+        key = (8, 8, 10)
+        pool.ready[key] = deque()
+        pool.pending[key] = 2
+        for no_guess in (False, True):
+            future = Future()
+            future.set_result(({(0, 0)}, (4, 4), no_guess))
+            pool._done(key, future)
+        self.assertEqual([board[2] for board in pool.ready[key]], [True, False])
+        self.assertEqual(pool.pending[key], 0)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+from apps.minesweeper_grid import MinesweeperGrid, heat_color, tile_images, FLAG, HIDDEN, HINT, MINE
+import unittest
+from unittest.mock import MagicMock
+
+class FakeCanvas:
+    """Records the image items and configuration calls of a canvas and runs after_idle callbacks on flush()."""
+
+    def __init__(self):
+        self.items = {}
+        self.next_item = 0
+        self.configured = 0
+        self.idle = []
+        self.bindings = {}
+
+    def create_image(self, x, y, image=None, anchor=None, tags=None):
+        self.next_item += 1
+        self.items[self.next_item] = {"x": x, "y": y, "image": image, "tags": tags}
+        return self.next_item
+
+    def create_rectangle(self, *coords, fill=None, outline=None, stipple=None, tags=None):
+        self.next_item += 1
+        self.items[self.next_item] = {"fill": fill, "tags": tags}
+        return self.next_item
+
+    def delete(self, tag):
+        self.items = {item: options for item, options in self.items.items() if options["tags"] != tag}
+
+    def itemconfigure(self, item, **options):
+        self.configured += 1
+        self.items[item].update(options)
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+        return len(self.idle)
+
+    def after_cancel(self, job):
+        self.idle[job - 1] = lambda: None
+
+    def bind(self, sequence, callback):
+        self.bindings[sequence] = callback
+
+    def flush(self):
+        callbacks, self.idle = self.idle, []
+        for callback in callbacks:
+            callback()
+
+class TestMinesweeperGrid(unittest.TestCase):
+    def setUp(self):
+        self.canvas = FakeCanvas()
+        self.clicks = []
+        self.flags = []
+        self.grid = MinesweeperGrid(self.canvas, on_click=lambda row, col: self.clicks.append((row, col)),
+                                    on_flag=lambda row, col: self.flags.append((row, col)), photo=lambda image: image)
+        self.grid.resize(8, 10, 20, 50, 100)
+
+    def image(self, row, col):
+        return self.canvas.items[self.grid.items[row][col]]["image"]
+
+    def test_tile_images(self):
+        images = tile_images(24)
+        self.assertEqual(set(images), {HIDDEN, FLAG, MINE, HINT} | {str(number) for number in range(9)})
+        self.assertTrue(all(image.size == (24, 24) for image in images.values()))
+
+    def test_resize_keeps_one_item_per_cell(self):
+        self.assertEqual(len(self.canvas.items), 80)
+        self.grid.resize(16, 16, 20, 0, 0)
+        self.grid.resize(4, 6, 30, 0, 0)
+        self.assertEqual(len(self.canvas.items), 24)
+        self.assertEqual(self.image(3, 5), self.grid.sprites[HIDDEN])
+
+    def test_updates_are_batched(self):
+        for col in range(10):
+            self.grid.set_tile(0, col, "0")
+        self.grid.set_tile(1, 1, FLAG)
+        self.assertEqual(self.canvas.configured, 0)
+        self.canvas.flush()
+        self.assertEqual(self.grid.frames, 1)
+        self.assertEqual(self.canvas.configured, 11)
+        self.assertEqual(self.image(0, 9), self.grid.sprites["0"])
+        self.assertEqual(self.image(1, 1), self.grid.sprites[FLAG])
+
+    def test_unchanged_tiles_are_not_redrawn(self):
+        self.grid.set_tile(2, 2, HIDDEN)
+        self.assertEqual(self.canvas.idle, [])
+        self.grid.set_tile(2, 2, MINE)
+        self.grid.reset()
+        self.canvas.flush()
+        self.assertEqual(self.image(2, 2), self.grid.sprites[HIDDEN])
+
+    def test_mouse_events(self):
+        self.canvas.bindings["<Button-1>"](MagicMock(x=50 + 3 * 20 + 5, y=100 + 2 * 20 + 5))
+        self.canvas.bindings["<Button-3>"](MagicMock(x=50 + 9 * 20, y=100 + 7 * 20))
+        self.canvas.bindings["<Button-1>"](MagicMock(x=40, y=100))
+        self.assertEqual(self.clicks, [(2, 3)])
+        self.assertEqual(self.flags, [(7, 9)])
+
+    def test_heatmap(self):
+        self.grid.show_heatmap({(0, 0): 0.0, (1, 1): 1.0})
+        self.grid.show_heatmap({(0, 0): 0.0, (1, 1): 1.0, (2, 2): 0.5})
+        fills = [options["fill"] for options in self.canvas.items.values() if options["tags"] == "heatmap"]
+        self.assertEqual(fills, ["#00ff00", "#ff0000", "#ffff00"])
+        self.assertEqual(heat_color(0.25), "#7fff00")
+        self.grid.resize(8, 10, 20, 50, 100)
+        self.assertEqual(len(self.canvas.items), 80)
+
+    def test_large_board(self):
+        self.grid.resize(100, 100, 5, 0, 0)
+        self.assertEqual(len(self.canvas.items), 10000)
+        for row in range(100):
+            for col in range(100):
+                self.grid.set_tile(row, col, "1")
+        self.canvas.flush()
+        self.assertEqual(self.grid.frames, 1)
+        self.assertEqual(self.grid.cell_at(499, 499), (99, 99))
+        self.assertIsNone(self.grid.cell_at(500, 0))
+
+if __name__ == "__main__":
+    unittest.main()
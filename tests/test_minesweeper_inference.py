@@ -0,0 +1,52 @@
+from apps.minesweeper_board import MinesweeperBoard, random_mines
+from apps.minesweeper_inference import frontier, frontier_facts, infer
+import random
+import unittest
+
+class TestMinesweeperInference(unittest.TestCase):
+    def test_frontier(self):
+        numbers = {(0, 0): 0, (0, 1): 1, (1, 0): 1, (1, 1): 1}
+        clues, cells = frontier(3, 3, numbers)
+        self.assertEqual(clues, {(0, 1): 1, (1, 0): 1, (1, 1): 1})
+        self.assertEqual(cells, {(0, 2), (1, 2), (2, 0), (2, 1), (2, 2)})
+        facts = frontier_facts(clues, cells, 1, 0)
+        self.assertIn("frontier(2,1).", facts)
+        self.assertIn("clue(1,0,1).", facts)
+        self.assertIn("mines_left(1).", facts)
+
+    def test_deduces_mines_and_safe_cells(self):
+        board = MinesweeperBoard(1, 4, {(0, 0)})
+        numbers = {(0, 1): board.count(0, 1), (0, 3): board.count(0, 3)}
+        inference = infer(1, 4, numbers)
+        self.assertEqual(inference.mines, {(0, 0)})
+        self.assertEqual(inference.safe, {(0, 2)})
+        self.assertEqual(inference.frontier_size, 2)
+
+    def test_nothing_revealed(self):
+        inference = infer(8, 8, {}, 10)
+        self.assertEqual((inference.safe, inference.mines), (set(), set()))
+
+    def test_contradiction(self):
+        self.assertIsNone(infer(1, 3, {(0, 1): 3}))
+
+    def test_deductions_are_sound(self):
+        rng = random.Random(5)
+        for _ in range(5):
+            mines = random_mines(12, 12, 25, rng)
+            board = MinesweeperBoard(12, 12, mines)
+            revealed = set()
+            start = next((row, col) for row in range(12) for col in range(12)
+                         if (row, col) not in mines and board.count(row, col) == 0)
+            board.reveal(*start, revealed)
+            while True:
+                numbers = {cell: board.count(*cell) for cell in revealed}
+                inference = infer(12, 12, numbers, len(mines))
+                self.assertTrue(inference.mines <= mines)
+                self.assertFalse(inference.safe & mines)
+                if not inference.safe - revealed:
+                    break
+                for cell in inference.safe - revealed:
+                    board.reveal(*cell, revealed)
+
+if __name__ == "__main__":
+    unittest.main()
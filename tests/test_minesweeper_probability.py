@@ -0,0 +1,70 @@
+from apps.minesweeper_board import MinesweeperBoard, random_mines
+from apps.minesweeper_inference import frontier
+from apps.minesweeper_probability import components, convolve, mine_probabilities
+from apps.solver_budget import BudgetExceeded, SolveBudget
+import itertools
+import random
+import unittest
+
+def brute_force_probabilities(rows, cols, numbers, num_mines):
+    hidden = [(row, col) for row in range(rows) for col in range(cols) if (row, col) not in numbers]
+    total, counts = 0, dict.fromkeys(hidden, 0)
+    for mines in itertools.combinations(hidden, num_mines):
+        mines = set(mines)
+        if all(sum((r, c) in mines for r in range(row - 1, row + 2) for c in range(col - 1, col + 2)) == count
+               for (row, col), count in numbers.items()):
+            total += 1
+            for cell in mines:
+                counts[cell] += 1
+    return {cell: count / total for cell, count in counts.items()}
+
+class TestMinesweeperProbability(unittest.TestCase):
+    def test_matches_brute_force(self):
+        rng = random.Random(2)
+        for _ in range(20):
+            mines = random_mines(4, 5, 4, rng)
+            board = MinesweeperBoard(4, 5, mines)
+            revealed = set()
+            for cell in rng.sample([(r, c) for r in range(4) for c in range(5) if (r, c) not in mines], 2):
+                board.reveal(*cell, revealed)
+            numbers = {cell: board.count(*cell) for cell in revealed}
+            expected = brute_force_probabilities(4, 5, numbers, 4)
+            probabilities = mine_probabilities(4, 5, numbers, 4).cells()
+            self.assertEqual(set(probabilities), set(expected))
+            for cell, p in expected.items():
+                self.assertAlmostEqual(probabilities[cell], p)
+
+    def test_components(self):
+        numbers = {(0, 0): 1, (0, 4): 1}
+        clues, cells = frontier(3, 5, numbers)
+        parts = components(3, 5, clues, cells)
+        self.assertEqual(sorted(sorted(part) for part in parts), [[(0, 1), (1, 0), (1, 1)], [(0, 3), (1, 3), (1, 4)]])
+        self.assertEqual(convolve({0: 1, 1: 3}, {1: 2}), {1: 2, 2: 6})
+
+    def test_decomposition_does_not_change_the_result(self):
+        numbers = {(0, 0): 1, (0, 4): 1, (4, 0): 2}
+        decomposed = mine_probabilities(5, 5, numbers, 5)
+        joint = mine_probabilities(5, 5, numbers, 5, decompose=False)
+        self.assertEqual(decomposed.num_components, 3)
+        self.assertEqual(joint.num_components, 1)
+        for cell, p in decomposed.cells().items():
+            self.assertAlmostEqual(joint.cells()[cell], p)
+
+    def test_safest_guess(self):
+        probabilities = mine_probabilities(1, 5, {(0, 0): 1}, 1)
+        self.assertEqual(probabilities.frontier, {(0, 1): 1.0})
+        self.assertEqual(probabilities.interior, 0.0)
+        self.assertEqual(probabilities.safest(), ((0, 2), 0.0))
+        self.assertEqual(probabilities.safest(exclude=[(0, 2), (0, 3), (0, 4)]), ((0, 1), 1.0))
+
+    def test_contradiction(self):
+        self.assertIsNone(mine_probabilities(1, 3, {(0, 1): 3}, 2))
+        self.assertIsNone(mine_probabilities(1, 5, {(0, 0): 1}, 0))
+
+    def test_budget(self):
+        numbers = {(row, 0): 1 for row in range(0, 40, 3)}
+        with self.assertRaises(BudgetExceeded):
+            mine_probabilities(40, 3, numbers, 30, decompose=False, budget=SolveBudget(conflicts=5))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,29 @@
+from apps.minesweeper_simulator import POLICIES, SimulatedGame, play_game
+import unittest
+
+class TestMinesweeperSimulator(unittest.TestCase):
+    def test_game(self):
+        game = SimulatedGame(8, 8, 10, seed=1)
+        self.assertEqual(len(game.board.mines), 10)
+        game.click(*game.start)
+        self.assertFalse(game.lost)
+        self.assertEqual(game.board.count(*game.start), 0)
+        mine = next(iter(game.board.mines))
+        game.click(*mine)
+        self.assertTrue(game.lost)
+        self.assertTrue(game.over)
+        self.assertFalse(game.won)
+
+    def test_games_are_reproducible(self):
+        for policy in POLICIES:
+            first = play_game(8, 8, 10, policy, seed=3)
+            second = play_game(8, 8, 10, policy, seed=3)
+            self.assertEqual((first["won"], first["moves"]), (second["won"], second["moves"]))
+
+    def test_inference_policy(self):
+        results = [play_game(8, 8, 10, "inference", seed=seed) for seed in range(5)]
+        self.assertGreaterEqual(sum(result["won"] for result in results), 3)
+        self.assertTrue(all(result["ground"] > 0 and result["solve"] > 0 for result in results))
+
+if __name__ == "__main__":
+    unittest.main()
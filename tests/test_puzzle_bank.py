@@ -0,0 +1,91 @@
+from apps.puzzle_bank import PuzzleBank, PuzzleBankProducer, bank_directory, pack_board, unpack_board, RECORD_SIZE, HEADER, REPO_ROOT
+from apps.solver_budget import SolveBudget
+from apps.sudoku_engine import parse_board, session_pool
+import os
+import tempfile
+import time
+import unittest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+class TestPuzzleBank(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "bank.bin")
+        self.bank = PuzzleBank(self.path)
+
+    def tearDown(self):
+        self.bank.close()
+        self.directory.cleanup()
+
+    def test_pack_round_trip(self):
+        board = parse_board(PUZZLE)
+        self.assertEqual(unpack_board(pack_board(board)), board)
+        self.assertEqual(len(pack_board(board)), 41)
+
+    def test_append_and_read(self):
+        records = [(parse_board(PUZZLE), parse_board(SOLUTION), difficulty) for difficulty in range(3)]
+        self.bank.append(records)
+        self.assertEqual(len(self.bank), 3)
+        self.assertEqual(self.bank.read(2), records[2])
+        self.assertEqual(os.path.getsize(self.path), HEADER.size + 3 * RECORD_SIZE)
+        with self.assertRaises(IndexError):
+            self.bank.read(3)
+
+    def test_take_advances_cursor(self):
+        self.bank.append([(parse_board(PUZZLE), parse_board(SOLUTION), 30)] * 2)
+        self.assertEqual(self.bank.take()[2], 30)
+        self.assertEqual(self.bank.remaining(), 1)
+        self.bank.take()
+        self.assertIsNone(self.bank.take())
+
+    def test_reopen_keeps_cursor(self):
+        self.bank.append([(parse_board(PUZZLE), parse_board(SOLUTION), 0)] * 2)
+        self.bank.take()
+        self.bank.close()
+        self.bank = PuzzleBank(self.path)
+        self.assertEqual(self.bank.remaining(), 1)
+
+    def test_refill_drops_taken_records(self):
+        records = [(parse_board(PUZZLE), parse_board(SOLUTION), difficulty) for difficulty in range(10)]
+        self.bank.append(records[:4])
+        taken = []
+        for refill in range(20):
+            while self.bank.remaining() > 2:
+                taken.append(self.bank.take()[2])
+            self.bank.append(records[4 + refill % 6:5 + refill % 6] * 3)
+            self.assertLessEqual(os.path.getsize(self.path), HEADER.size + 5 * RECORD_SIZE)
+        self.assertEqual(taken[:2], [0, 1])
+        self.assertEqual(taken[2:5], [2, 3, 4])
+        self.assertEqual(self.bank.remaining(), len(self.bank))
+
+    def test_producer_refills_with_pooled_sessions(self):
+        pool = session_pool(3)
+        pool.prewarm(1)
+        idle = len(pool.idle)
+        producer = PuzzleBankProducer(self.bank, 40, low=1, high=2, batch=1, budget=SolveBudget(time_limit=5))
+        producer.start()
+        deadline = time.monotonic() + 30
+        while self.bank.remaining() < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        producer.stop()
+        producer.join(30)
+        self.assertFalse(producer.is_alive())
+        self.assertGreaterEqual(self.bank.remaining(), 2)
+        puzzle, solution, clues = self.bank.take()
+        self.assertEqual(clues, 40)
+        self.assertEqual(sum(1 for row in puzzle for value in row if value), 40)
+        self.assertTrue(all(not value or value == solution[row][col]
+                            for row, values in enumerate(puzzle) for col, value in enumerate(values)))
+        self.assertEqual(len(pool.idle), idle)
+
+    def test_bank_directory(self):
+        conf = os.path.join(self.directory.name, "conf.yaml")
+        with open(conf, "w", encoding="utf-8") as file:
+            file.write("puzzle_bank:\n  directory: puzzles\n")
+        self.assertEqual(bank_directory(conf), os.path.join(REPO_ROOT, "puzzles"))
+        self.assertEqual(bank_directory(os.path.join(self.directory.name, "missing.yaml")), os.path.join(REPO_ROOT, "banks"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+from server import SolverServer, http_response
+from apps.solver_budget import SolveBudget
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import json
+import threading
+import unittest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+RELEASE = threading.Event()
+
+def slow_job(payload, budget=None):
+    RELEASE.wait(5)
+    return {"echo": payload}
+
+class TestSolverServer(unittest.TestCase):
+    def setUp(self):
+        RELEASE.clear()
+        budgets = {name: SolveBudget(time_limit=10) for name in ("hint", "solve", "validate", "generation")}
+        self.server = SolverServer(workers=1, queue=1, budgets=budgets, executor=ThreadPoolExecutor(4))
+        self.server.routes["/slow"] = ("solve", slow_job)
+
+    def tearDown(self):
+        RELEASE.set()
+        self.server.shutdown()
+
+    def request(self, *requests):
+        async def run():
+            listener = await asyncio.start_server(self.server.handle, "127.0.0.1", 0)
+            host, port = listener.sockets[0].getsockname()[:2]
+
+            async def send(method, path, payload):
+                reader, writer = await asyncio.open_connection(host, port)
+                body = json.dumps(payload).encode()
+                writer.write(f"{method} {path} HTTP/1.1\r\nConnection: close\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+                response = await reader.read()
+                writer.close()
+                head, _, body = response.partition(b"\r\n\r\n")
+                return int(head.split()[1]), json.loads(body)
+
+            tasks = []
+            for method, path, payload in requests:
+                tasks.append(asyncio.create_task(send(method, path, payload)))
+                await asyncio.sleep(0.05)
+            RELEASE.set()
+            results = await asyncio.gather(*tasks)
+            listener.close()
+            return results
+        return asyncio.run(run())
+
+    def test_sudoku_solve_and_hint(self):
+        (status, solved), (_, hint) = self.request(("POST", "/sudoku/solve", {"board": PUZZLE}),
+                                                   ("POST", "/sudoku/hint", {"board": PUZZLE}))
+        self.assertEqual((status, solved), (200, {"solution": SOLUTION}))
+        self.assertEqual(len(hint["forced"]), PUZZLE.count("."))
+        self.assertIn([0, 2, 4], hint["forced"])
+
+    def test_minesweeper_safe(self):
+        payload = {"rows": 3, "cols": 3, "mines": 1, "numbers": [[0, 0, 1], [0, 1, 1], [1, 0, 1]]}
+        [(status, answer)] = self.request(("POST", "/minesweeper/safe", payload))
+        self.assertEqual(status, 200)
+        self.assertEqual(answer["mines"], [[1, 1]])
+        self.assertIn([0, 2], answer["safe"])
+
+    def test_errors(self):
+        results = self.request(("POST", "/sudoku/solve", {"board": "123"}), ("GET", "/sudoku/solve", {}),
+                               ("POST", "/missing", {}), ("POST", "/sudoku/solve", [1]))
+        self.assertEqual([status for status, _ in results], [400, 405, 404, 400])
+
+    def test_identical_requests_are_coalesced(self):
+        results = self.request(*[("POST", "/slow", {"board": 1})] * 3)
+        self.assertEqual(results, [(200, {"echo": {"board": 1}})] * 3)
+        self.assertEqual(self.server.counters["jobs"], 1)
+        self.assertEqual(self.server.counters["coalesced"], 2)
+
+    def test_backpressure(self):
+        results = self.request(*[("POST", "/slow", {"board": i}) for i in range(3)])
+        self.assertEqual([status for status, _ in results], [200, 200, 503])
+        self.assertEqual(self.server.counters["rejected"], 1)
+
+    def test_http_response(self):
+        response = http_response(503, {"error": "busy"}, keep_alive=False)
+        self.assertIn(b"Retry-After: 1", response)
+        self.assertIn(b"Connection: close", response)
+        self.assertTrue(response.endswith(b'{"error": "busy"}'))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+from apps.solver_budget import SolveBudget, BudgetExceeded, load_budgets, run_with_budget, OPERATIONS
+from apps.sudoku_engine import SudokuEngine, SudokuSession, parse_board
+from apps.sudoku_generator import SudokuGenerator
+from apps.sudoku_propagation import PropagationSolver
+import os
+import tempfile
+import threading
+import time
+import unittest
+
+HARD = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+
+class TestSolverBudget(unittest.TestCase):
+    def test_load_budgets(self):
+        budgets = load_budgets()
+        self.assertEqual(set(budgets), set(OPERATIONS))
+        self.assertIsNotNone(budgets["hint"].time_limit)
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "conf.yaml")
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("budgets:\n  solve:\n    conflicts: 10\n")
+            budgets = load_budgets(path)
+            self.assertEqual(budgets["solve"].conflicts, 10)
+            self.assertIsNone(budgets["solve"].time_limit)
+            self.assertIsNone(budgets["hint"].conflicts)
+            self.assertIsNone(load_budgets(os.path.join(directory, "missing.yaml"))["hint"].time_limit)
+
+    def test_timeout_is_unknown(self):
+        session = SudokuSession(5)
+        empty = [[0] * 25 for _ in range(25)]
+        start = time.perf_counter()
+        outcome = run_with_budget(SolveBudget(time_limit=0.2), session.forced_cells, empty)
+        self.assertTrue(outcome.unknown)
+        self.assertEqual(outcome.reason, "timeout")
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertIsNotNone(session.solve(empty))
+
+    def test_conflict_limit_is_unknown(self):
+        session = SudokuSession(5)
+        empty = [[0] * 25 for _ in range(25)]
+        outcome = run_with_budget(SolveBudget(conflicts=10), session.forced_cells, empty)
+        self.assertEqual(outcome.reason, "conflicts")
+        self.assertIsNotNone(session.solve(empty))
+
+    def test_interrupted_hint_is_unknown(self):
+        session = SudokuSession(5)
+        empty = [[0] * 25 for _ in range(25)]
+        outcomes = []
+        worker = threading.Thread(target=lambda: outcomes.append(run_with_budget(SolveBudget(time_limit=30), session.forced_cells, empty)))
+        worker.start()
+        deadline = time.perf_counter() + 10
+        while not session.running.handles and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        session.interrupt()
+        worker.join(10)
+        self.assertEqual(outcomes[0].reason, "interrupted")
+        self.assertIn("cancelled", outcomes[0].describe())
+
+    def test_finished_outcome(self):
+        engine = SudokuEngine()
+        board = parse_board(HARD)
+        for backend in ("clingo", "session", "propagation"):
+            outcome = run_with_budget(SolveBudget(time_limit=30), engine.solve, board, backend)
+            self.assertFalse(outcome.unknown)
+            self.assertEqual(outcome.value, PropagationSolver().solve(board))
+
+    def test_propagation_conflict_limit(self):
+        solver = PropagationSolver()
+        with self.assertRaises(BudgetExceeded):
+            solver.solve(parse_board(HARD), SolveBudget(conflicts=0))
+
+    def test_generator_keeps_clues_it_cannot_check(self):
+        generator = SudokuGenerator(SudokuSession(3), seed=2, budget=SolveBudget(conflicts=0))
+        puzzle, solution = generator.generate()
+        self.assertEqual(PropagationSolver().count_solutions(puzzle), 1)
+        self.assertEqual(PropagationSolver().solve(puzzle), solution)
+
+if __name__ == "__main__":
+    unittest.main()
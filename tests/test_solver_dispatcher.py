@@ -0,0 +1,104 @@
+from apps.solver_dispatcher import SolverDispatcher
+from apps.sudoku_engine import SudokuEngine, SudokuSession, session_pool
+from apps.sudoku_generator import generate_puzzle
+import threading
+import time
+import unittest
+
+class FakeRoot:
+    """Runs the callbacks scheduled with after() when pump() is called, like a tkinter main loop."""
+
+    def __init__(self):
+        self.callbacks = {}
+        self.next_id = 0
+
+    def after(self, delay, callback, *args):
+        self.next_id += 1
+        self.callbacks[self.next_id] = (callback, args)
+        return self.next_id
+
+    def after_cancel(self, job):
+        self.callbacks.pop(job, None)
+
+    def pump(self, timeout=30):
+        deadline = time.time() + timeout
+        while self.callbacks and time.time() < deadline:
+            job = min(self.callbacks)
+            callback, args = self.callbacks.pop(job)
+            callback(*args)
+            time.sleep(0.01)
+
+class TestSolverDispatcher(unittest.TestCase):
+    def setUp(self):
+        self.root = FakeRoot()
+        self.busy = []
+        self.dispatcher = SolverDispatcher(self.root, on_busy=self.busy.append)
+
+    def tearDown(self):
+        self.dispatcher.shutdown()
+
+    def test_result_is_delivered_on_main_thread(self):
+        results = []
+        main_thread = threading.current_thread()
+        self.dispatcher.submit(sum, [1, 2, 3], on_done=lambda result: results.append((result, threading.current_thread())))
+        self.root.pump()
+        self.assertEqual(results, [(6, main_thread)])
+        self.assertEqual(self.busy, [True, False])
+
+    def test_errors_go_to_error_callback(self):
+        errors = []
+        self.dispatcher.submit(int, "x", on_done=self.fail, on_error=errors.append)
+        self.root.pump()
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors[0], ValueError)
+
+    def test_new_job_cancels_running_solve(self):
+        session = SudokuSession(5)
+        empty = [[0] * 25 for _ in range(25)]
+        results = []
+        self.dispatcher.submit(session.forced_cells, empty, on_done=lambda result: results.append("stale"),
+                               interrupt=session.interrupt)
+        time.sleep(0.2)
+        start = time.perf_counter()
+        self.dispatcher.submit(session.is_solvable, empty, on_done=results.append, interrupt=session.interrupt)
+        self.root.pump()
+        self.assertEqual(results, [True])
+        self.assertLess(time.perf_counter() - start, 5)
+        self.assertEqual(self.busy, [True, False])
+
+    def test_shutdown_waits_for_job_before_sessions_are_released(self):
+        engine = SudokuEngine()
+        session = engine.session(5)
+        empty = [[0] * 25 for _ in range(25)]
+        started = threading.Event()
+
+        def delayed_hint():
+            started.set()
+            time.sleep(0.2)
+            return session.forced_cells(empty)
+
+        job = self.dispatcher.submit(delayed_hint, on_done=self.fail, interrupt=engine.interrupt)
+        started.wait(5)
+        start = time.perf_counter()
+        self.dispatcher.shutdown()
+        engine.close()
+        self.assertTrue(job.future.done())
+        self.assertFalse(session.running.handles)
+        self.assertLess(time.perf_counter() - start, 5)
+        with session_pool(5).borrow() as pooled:
+            self.assertIs(pooled, session)
+            start = time.perf_counter()
+            self.assertTrue(pooled.is_solvable(empty))
+            self.assertLess(time.perf_counter() - start, 5)
+
+    def test_heavy_job_runs_in_process(self):
+        results = []
+        self.dispatcher.submit(generate_puzzle, 3, 60, 1, on_done=results.append, heavy=True)
+        self.root.pump(timeout=60)
+        puzzle, solution = results[0]
+        self.assertEqual(len(puzzle), 9)
+        self.assertTrue(all(value in (0, solution[row][col]) for row, values in enumerate(puzzle)
+                            for col, value in enumerate(values)))
+
+if __name__ == "__main__":
+    unittest.main()
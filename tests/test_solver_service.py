@@ -0,0 +1,67 @@
+from apps.solver_service import ControlPool, SolverService
+from apps.sudoku_engine import SudokuEngine, session_pool, parse_board, format_board
+from apps.sudoku_generator import generate_puzzle
+import os
+import tempfile
+import unittest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+class TestControlPool(unittest.TestCase):
+    def test_acquire_creates_and_reuses(self):
+        created = []
+        pool = ControlPool(lambda: created.append(object()) or created[-1], size=1)
+        first = pool.acquire()
+        second = pool.acquire()
+        self.assertIsNot(first, second)
+        pool.release(first)
+        pool.release(second)
+        self.assertEqual(pool.idle, [first])
+        self.assertIs(pool.acquire(), first)
+        self.assertEqual(len(created), 2)
+
+    def test_borrow_and_prewarm(self):
+        pool = ControlPool(object, size=2)
+        pool.prewarm()
+        self.assertEqual(len(pool.idle), 2)
+        with pool.borrow() as item:
+            self.assertEqual(len(pool.idle), 1)
+        self.assertIn(item, pool.idle)
+
+class TestSolverService(unittest.TestCase):
+    def test_program_is_read_once(self):
+        service = SolverService()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "program.lp")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("a.")
+            self.assertEqual(service.program(path), "a.")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write("b.")
+            self.assertEqual(service.program(path), "a.")
+
+    def test_pool_per_program_and_size(self):
+        service = SolverService()
+        pool = service.pool("program.lp", 3, object)
+        self.assertIs(service.pool("program.lp", 3, object), pool)
+        self.assertIsNot(service.pool("program.lp", 4, object), pool)
+
+    def test_engines_share_ground_sessions(self):
+        engine = SudokuEngine()
+        session = engine.session(3)
+        self.assertEqual(format_board(engine.solve(parse_board(PUZZLE), "session")), SOLUTION)
+        engine.close()
+        self.assertEqual(engine.sessions, {})
+        self.assertIs(SudokuEngine().session(3), session)
+        self.assertIsNot(engine.session(3), session)
+
+    def test_generator_gives_session_back(self):
+        pool = session_pool(3)
+        pool.prewarm(1)
+        idle = list(pool.idle)
+        generate_puzzle(3, 40, seed=1)
+        self.assertEqual(pool.idle, idle)
+
+if __name__ == "__main__":
+    unittest.main()
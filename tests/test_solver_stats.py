@@ -0,0 +1,94 @@
+from apps.solver_budget import SolveBudget, BudgetExceeded
+from apps.solver_stats import RecentCalls, JsonLinesSink, add_sink, remove_sink, labelled, operation, current_operation
+from apps.stats_overlay import format_record
+from apps.sudoku_engine import SudokuEngine, SudokuSession, parse_board
+from apps.sudoku_propagation import PropagationSolver
+from apps.minesweeper_inference import infer
+import json
+import os
+import tempfile
+import unittest
+
+HARD = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+
+class TestSolverStats(unittest.TestCase):
+    def setUp(self):
+        self.recent = RecentCalls(100)
+        add_sink(self.recent)
+
+    def tearDown(self):
+        remove_sink(self.recent)
+
+    def test_clingo_call(self):
+        labelled("solve", SudokuEngine().solve, parse_board(HARD), "clingo")
+        record = self.recent.records()[-1]
+        self.assertEqual((record["operation"], record["solver"], record["size"], record["result"]), ("solve", "clingo", "9x9", "sat"))
+        self.assertGreater(record["load"], 0)
+        self.assertGreater(record["ground"], 0)
+        self.assertGreater(record["solve"], 0)
+        self.assertGreater(record["choices"], 0)
+        self.assertGreater(record["atoms"], 0)
+        self.assertGreater(record["rules"], 0)
+
+    def test_session_calls(self):
+        session = SudokuSession(3)
+        with operation("hint"):
+            session.forced_cells(parse_board(HARD))
+        ground, hint = self.recent.records()[-2:]
+        self.assertGreater(ground["ground"], 0)
+        self.assertEqual(ground["solve"], 0)
+        self.assertEqual((hint["operation"], hint["solver"], hint["result"]), ("hint", "session", "sat"))
+        self.assertEqual(hint["ground"], 0)
+        self.assertGreater(ground["atoms"], 0)
+        self.assertIsNone(ground["choices"])
+
+    def test_first_session_solve_has_statistics(self):
+        SudokuSession(3).solve(parse_board(HARD))
+        solve = self.recent.records()[-1]
+        self.assertGreater(solve["choices"], 0)
+        self.assertGreater(solve["atoms"], 0)
+        self.assertGreater(solve["rules"], 0)
+
+    def test_propagation_counts_search(self):
+        PropagationSolver().solve(parse_board(HARD))
+        record = self.recent.records()[-1]
+        self.assertEqual((record["solver"], record["result"]), ("propagation", "sat"))
+        self.assertGreater(record["choices"], 0)
+        self.assertGreater(record["conflicts"], 0)
+
+    def test_budget_exceeded_is_recorded(self):
+        with self.assertRaises(BudgetExceeded):
+            PropagationSolver().solve(parse_board(HARD), SolveBudget(conflicts=0))
+        record = self.recent.records()[-1]
+        self.assertEqual((record["result"], record["conflicts"]), ("conflicts", 1))
+
+    def test_minesweeper_inference(self):
+        infer(3, 3, {(0, 0): 1, (0, 1): 1, (1, 0): 1}, 1)
+        record = self.recent.records()[-1]
+        self.assertEqual((record["solver"], record["size"], record["result"]), ("frontier", "3x3", "sat"))
+
+    def test_operation_is_restored(self):
+        with operation("solve"):
+            labelled("hint", lambda: self.assertEqual(current_operation(), "hint"))
+            self.assertEqual(current_operation(), "solve")
+        self.assertIsNone(current_operation())
+
+    def test_json_lines_sink(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "stats.jsonl")
+            sink = JsonLinesSink(path)
+            add_sink(sink)
+            try:
+                with operation("validate"):
+                    SudokuEngine().is_solvable(parse_board(HARD), "propagation")
+                    SudokuEngine().is_solvable(parse_board(HARD), "clingo")
+            finally:
+                remove_sink(sink)
+            with open(path, encoding="utf-8") as f:
+                records = [json.loads(line) for line in f]
+        self.assertEqual([record["solver"] for record in records], ["propagation", "clingo"])
+        self.assertTrue(all(record["operation"] == "validate" for record in records))
+        self.assertIn("validate", format_record(records[-1]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,37 +1,85 @@
 from apps.sudoku_app import SudokuApp
+from apps.puzzle_bank import PuzzleBank
+from apps.sudoku_engine import SudokuSession
+from apps.sudoku_generator import SudokuGenerator
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import Tk
+import os
+import tempfile
+import time
 import unittest
 from unittest.mock import MagicMock
 
 class TestSudokuApp(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.puzzles = SudokuGenerator(seed=1).generate_batch(6, 36)
+
     def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.bank = PuzzleBank(os.path.join(self.directory.name, "sudoku_easy.bin"))
+        self.bank.append((puzzle, solution, 36) for puzzle, solution in self.puzzles)
         self.root = Tk()
-        self.app = SudokuApp(self.root)
+        self.app = SudokuApp(self.root, banks={"Easy": (self.bank, None)})
 
     def tearDown(self):
+        self.app.dispatcher.shutdown()
         self.root.destroy()
+        self.bank.close()
+        self.directory.cleanup()
 
     def test_grid_creation(self):
         self.app.create_grid()
-        self.assertEqual(len(self.app.entries), 9)
-        self.assertEqual(len(self.app.entries[0]), 9)
+        self.assertEqual(len(self.app.grid.values), 9)
+        self.assertEqual(len(self.app.grid.values[0]), 9)
+
+    def test_widget_count_stays_flat(self):
+        widgets = len(self.root.winfo_children())
+        for _ in range(3):
+            self.app.create_grid()
+            self.app.new_game()
+        self.assertEqual(len(self.root.winfo_children()), widgets)
 
     def test_generate_sudoku(self):
         self.app.generate_sudoku()
-        filled_cells = sum(
-            1 for row in self.app.entries for entry in row if entry.get()
-        )
-        self.assertGreater(filled_cells, 0)
+        board = self.app.get_current_board()
+        self.assertEqual(board, self.puzzles[1][0])
+        self.assertEqual(self.bank.remaining(), len(self.puzzles) - 2)
+        self.assertEqual(SudokuSession().count_solutions(board), 1)
+
+    def test_generate_sudoku_without_bank(self):
+        self.app.dispatcher.processes = ThreadPoolExecutor(max_workers=1)
+        self.app.difficulty_var.set("Medium")
+        self.app.generate_sudoku()
+        deadline = time.monotonic() + 30
+        while self.app.dispatcher.pending and time.monotonic() < deadline:
+            self.root.update()
+            time.sleep(0.01)
+        board = self.app.get_current_board()
+        self.assertNotEqual(board, self.puzzles[0][0])
+        self.assertGreaterEqual(sum(1 for row in board for value in row if value), self.app.clue_count("Medium", 81))
+        self.assertEqual(SudokuSession().count_solutions(board), 1)
+        self.assertEqual(self.bank.remaining(), len(self.puzzles) - 1)
 
     def test_validate_input(self):
-        event = MagicMock(char="0", keysym="")
-        self.assertEqual(self.app.validate_input(event, 0, 0), "break")
+        self.app.grid.load([[0] * 9 for _ in range(9)])
+        self.app.grid.select(0, 0)
+        event = MagicMock(char="0", keysym="0")
+        self.app.grid.key_pressed(event)
+        self.assertEqual(self.app.grid.get(0, 0), 0)
 
         event.char = "a"
-        self.assertEqual(self.app.validate_input(event, 0, 0), "break")
+        self.app.grid.key_pressed(event)
+        self.assertEqual(self.app.grid.get(0, 0), 0)
+
+        event.char, event.keysym = "5", "5"
+        self.app.grid.key_pressed(event)
+        self.assertEqual(self.app.grid.get(0, 0), 5)
+        self.assertIn((0, 0), self.app.user_inputs)
 
-        event.keysym = "BackSpace"
-        self.assertIsNone(self.app.validate_input(event, 0, 0))
+        event.char, event.keysym = "", "BackSpace"
+        self.app.grid.key_pressed(event)
+        self.assertNotIn((0, 0), self.app.user_inputs)
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,58 @@
+from apps.sudoku_engine import SudokuSession
+from benchmarks.sudoku_suite import load_corpus, run_suite, compare
+import json
+import os
+import unittest
+
+BASELINE = os.environ.get("SUDOKU_BENCHMARK_BASELINE")
+THRESHOLD = float(os.environ.get("SUDOKU_BENCHMARK_THRESHOLD", "0.25"))
+
+class TestSudokuCorpus(unittest.TestCase):
+    def setUp(self):
+        self.puzzles = load_corpus()
+
+    def test_categories(self):
+        categories = {puzzle["category"] for puzzle in self.puzzles}
+        self.assertEqual(categories, {"easy", "hard", "minimal", "pathological"})
+
+    def test_unique_solutions(self):
+        session = SudokuSession(3)
+        for puzzle in self.puzzles:
+            self.assertEqual(session.count_solutions(puzzle["board"]), 1, puzzle["name"])
+
+    def test_minimal_puzzles_have_17_clues(self):
+        for puzzle in self.puzzles:
+            if puzzle["category"] == "minimal":
+                self.assertEqual(sum(1 for row in puzzle["board"] for value in row if value), 17, puzzle["name"])
+
+    def test_run_suite(self):
+        results = run_suite(self.puzzles[:2])
+        self.assertEqual(results["totals"]["solved"], 2)
+        self.assertEqual(results["totals"]["choices"], sum(result["choices"] for result in results["puzzles"]))
+
+class TestCompare(unittest.TestCase):
+    def results(self, choices, solve):
+        puzzle = {"category": "hard", "name": "a", "ground": 0.01, "solve": solve, "choices": choices, "conflicts": 0, "sat": True}
+        totals = {"ground": 0.01, "solve": solve, "choices": choices, "conflicts": 0, "solved": 1}
+        return {"puzzles": [puzzle], "totals": totals}
+
+    def test_no_regression_within_threshold(self):
+        self.assertEqual(compare(self.results(1000, 0.1), self.results(1200, 0.12), 0.25), [])
+
+    def test_regression_past_threshold(self):
+        regressions = compare(self.results(1000, 0.1), self.results(1300, 0.1), 0.25)
+        self.assertEqual(regressions, ["hard/a: choices 1000 -> 1300", "totals: choices 1000 -> 1300"])
+
+    def test_small_values_are_ignored(self):
+        self.assertEqual(compare(self.results(2, 0.001), self.results(8, 0.004), 0.25), [])
+
+@unittest.skipUnless(BASELINE, "set SUDOKU_BENCHMARK_BASELINE to a results file of benchmarks.sudoku_suite")
+class TestSudokuBenchmarkRegression(unittest.TestCase):
+    def test_no_regression(self):
+        with open(BASELINE, encoding="utf-8") as f:
+            baseline = json.load(f)
+        results = run_suite(load_corpus(), baseline["backend"], repeat=3)
+        self.assertEqual(compare(baseline, results, THRESHOLD), [])
+
+if __name__ == "__main__":
+    unittest.main()
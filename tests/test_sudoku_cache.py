@@ -0,0 +1,92 @@
+from apps.sudoku_cache import SolutionCache, canonical_form, apply_transform, restore_transform
+from apps.sudoku_engine import SudokuEngine, SudokuSession, parse_board, format_board
+from apps.solver_budget import BudgetExceeded
+import threading
+import time
+import unittest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+def transform_board(board):
+    rows = [5, 3, 4, 2, 0, 1, 8, 6, 7]
+    cols = [1, 2, 0, 7, 6, 8, 4, 5, 3]
+    digits = [0, 4, 7, 1, 9, 2, 8, 3, 5, 6]
+    grid = [[digits[board[row][col]] for col in cols] for row in rows]
+    return [list(row) for row in zip(*grid)]
+
+class TestCanonicalForm(unittest.TestCase):
+    def test_equivalent_boards_share_key(self):
+        board = parse_board(PUZZLE)
+        self.assertEqual(canonical_form(board)[0], canonical_form(transform_board(board))[0])
+
+    def test_different_boards_differ(self):
+        board = parse_board(PUZZLE)
+        other = [list(row) for row in board]
+        other[0][2] = 4
+        self.assertNotEqual(canonical_form(board)[0], canonical_form(other)[0])
+
+    def test_transform_round_trip(self):
+        board = transform_board(parse_board(PUZZLE))
+        key, transform = canonical_form(board)
+        self.assertEqual(apply_transform(board, transform), [list(row) for row in key])
+        self.assertEqual(restore_transform([list(row) for row in key], transform), board)
+
+    def test_sparse_board_falls_back(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[4][4] = 7
+        key, transform = canonical_form(board)
+        self.assertEqual(restore_transform([list(row) for row in key], transform), board)
+
+class TestSolutionCache(unittest.TestCase):
+    def setUp(self):
+        self.engine = SudokuEngine()
+        self.cache = SolutionCache(self.engine.solve, maxsize=2)
+
+    def test_hit_maps_back(self):
+        board = parse_board(PUZZLE)
+        self.assertEqual(format_board(self.cache.solve(board)), SOLUTION)
+        equivalent = transform_board(board)
+        self.assertEqual(self.cache.solve(equivalent), self.engine.solve(equivalent))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_unsolvable_is_cached(self):
+        board = parse_board(PUZZLE)
+        board[0][2] = 5
+        self.assertFalse(self.cache.is_solvable(board))
+        self.assertFalse(self.cache.is_solvable(board))
+        self.assertEqual(self.cache.info()["hits"], 1)
+
+    def test_interrupted_solve_is_not_cached(self):
+        session = SudokuSession(5)
+        cache = SolutionCache(lambda board, budget=None: board if session.count_solutions(board, 0, budget) else None)
+        empty = [[0] * 25 for _ in range(25)]
+        errors = []
+
+        def solve():
+            try:
+                cache.solve(empty)
+            except BudgetExceeded as err:
+                errors.append(err.reason)
+
+        worker = threading.Thread(target=solve)
+        worker.start()
+        deadline = time.perf_counter() + 10
+        while not session.running.handles and time.perf_counter() < deadline:
+            time.sleep(0.01)
+        session.interrupt()
+        worker.join(10)
+        self.assertEqual(errors, ["interrupted"])
+        self.assertEqual(cache.info()["size"], 0)
+
+    def test_size_limit(self):
+        board = parse_board(PUZZLE)
+        for col in (2, 3, 5):
+            other = [list(row) for row in board]
+            other[0][col] = int(SOLUTION[col])
+            self.cache.solve(other)
+        self.assertEqual(self.cache.info()["size"], 2)
+        self.assertEqual(self.cache.misses, 3)
+
+if __name__ == "__main__":
+    unittest.main()
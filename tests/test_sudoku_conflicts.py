@@ -0,0 +1,63 @@
+from apps.sudoku_conflicts import ConflictIndex
+from apps.sudoku_engine import parse_board
+import random
+import unittest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+
+def brute_force_conflicts(values, n):
+    size = n * n
+    conflicting = set()
+    for (row, col), value in values.items():
+        for (other_row, other_col), other in values.items():
+            if (row, col) == (other_row, other_col) or value != other:
+                continue
+            if row == other_row or col == other_col or (row // n, col // n) == (other_row // n, other_col // n):
+                conflicting.add((row, col))
+    return conflicting
+
+class TestConflictIndex(unittest.TestCase):
+    def test_puzzle_is_consistent(self):
+        index = ConflictIndex()
+        index.load(parse_board(PUZZLE))
+        self.assertTrue(index.is_consistent())
+        self.assertEqual(index.conflicting, set())
+
+    def test_conflicts_are_detected_and_cleared(self):
+        index = ConflictIndex()
+        index.load(parse_board(PUZZLE))
+        self.assertTrue(index.conflicts_with(0, 2, 5))
+        self.assertFalse(index.conflicts_with(0, 2, 4))
+
+        changed = index.set(0, 2, 5)
+        self.assertEqual(changed, {(0, 0), (0, 2)})
+        self.assertFalse(index.is_consistent())
+
+        changed = index.set(0, 2, 4)
+        self.assertEqual(changed, {(0, 0), (0, 2)})
+        self.assertTrue(index.is_consistent())
+        self.assertEqual(index.set(0, 2, 0), set())
+        self.assertNotIn((0, 2), index.values)
+
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        for n in (2, 3, 4):
+            size = n * n
+            index = ConflictIndex(n)
+            values = {}
+            for _ in range(300):
+                cell = (rng.randrange(size), rng.randrange(size))
+                value = rng.choice([0] + list(range(1, size + 1)))
+                before = set(index.conflicting)
+                changed = index.set(*cell, value)
+                if value:
+                    values[cell] = value
+                else:
+                    values.pop(cell, None)
+                expected = brute_force_conflicts(values, n)
+                self.assertEqual(index.conflicting, expected)
+                self.assertEqual(changed, before ^ expected)
+                self.assertEqual(index.is_consistent(), not expected)
+
+if __name__ == "__main__":
+    unittest.main()
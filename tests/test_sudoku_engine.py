@@ -0,0 +1,96 @@
+from apps.sudoku_engine import SudokuEngine, SudokuSession, parse_board, format_board, box_index
+from apps.solver_stats import RecentCalls, add_sink, remove_sink
+import unittest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+
+class TestSudokuEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = SudokuEngine()
+
+    def test_parse_and_format_round_trip(self):
+        self.assertEqual(format_board(parse_board(PUZZLE)), PUZZLE)
+
+    def test_solve(self):
+        solution = self.engine.solve(parse_board(PUZZLE))
+        self.assertEqual(format_board(solution), SOLUTION)
+
+    def test_solve_unsolvable(self):
+        board = parse_board(PUZZLE)
+        board[0][2] = 5
+        self.assertIsNone(self.engine.solve(board))
+
+    def test_solve_batch(self):
+        boards = [parse_board(PUZZLE)] * 3
+        solutions = self.engine.solve_batch(boards)
+        self.assertEqual([format_board(solution) for solution in solutions], [SOLUTION] * 3)
+
+    def test_solve_batch_grounds_once(self):
+        recent = RecentCalls(100)
+        add_sink(recent)
+        try:
+            solutions = SudokuEngine().solve_batch([parse_board(PUZZLE)] * 4, "clingo")
+        finally:
+            remove_sink(recent)
+        self.assertEqual([format_board(solution) for solution in solutions], [SOLUTION] * 4)
+        self.assertNotIn("clingo", [record["solver"] for record in recent.records()])
+        self.assertLessEqual(sum(1 for record in recent.records() if record["ground"] > 0), 1)
+
+    def test_box_index(self):
+        self.assertEqual(box_index(4, 7), 5)
+        self.assertEqual(box_index(15, 0, 4), 12)
+
+    def test_solve_16x16(self):
+        board = [[0] * 16 for _ in range(16)]
+        board[0][0] = 16
+        grid = SudokuSession(4).solve(board)
+        board = [[value if (row + col) % 3 else 0 for col, value in enumerate(values)] for row, values in enumerate(grid)]
+        solution = self.engine.solve(board)
+        self.assertEqual(solution[0][0], 16)
+        self.assertEqual(parse_board(format_board(solution), 4), solution)
+        for i in range(16):
+            self.assertEqual(set(solution[i]), set(range(1, 17)))
+
+class TestSudokuSession(unittest.TestCase):
+    def setUp(self):
+        self.session = SudokuSession()
+
+    def test_solve_reuses_ground_program(self):
+        for _ in range(3):
+            self.assertEqual(format_board(self.session.solve(parse_board(PUZZLE))), SOLUTION)
+
+    def test_is_solvable(self):
+        board = parse_board(PUZZLE)
+        self.assertTrue(self.session.is_solvable(board))
+        board[0][2] = 5
+        self.assertFalse(self.session.is_solvable(board))
+        self.assertIsNone(self.session.solve(board))
+
+    def test_session_16x16(self):
+        session = SudokuSession(4)
+        board = [[0] * 16 for _ in range(16)]
+        board[3][5] = 12
+        self.assertEqual(session.solve(board)[3][5], 12)
+        with self.assertRaises(ValueError):
+            session.solve(parse_board(PUZZLE))
+
+    def test_forced_cells(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[0] = [1, 2, 3, 4, 5, 6, 7, 8, 0]
+        self.assertEqual(self.session.forced_cells(board), {(0, 8): 9})
+        forced = self.session.forced_cells(parse_board(PUZZLE))
+        self.assertEqual(len(forced), 51)
+        self.assertEqual(forced[(0, 2)], 4)
+        board[0][0] = 2
+        self.assertIsNone(self.session.forced_cells(board))
+        self.assertEqual(self.session.count_solutions(parse_board(PUZZLE)), 1)
+
+    def test_invalid_value(self):
+        board = parse_board(PUZZLE)
+        board[0][2] = 10
+        with self.assertRaises(ValueError):
+            self.session.solve(board)
+
+if __name__ == "__main__":
+    unittest.main()
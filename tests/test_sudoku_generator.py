@@ -0,0 +1,33 @@
+from apps.sudoku_generator import SudokuGenerator
+import unittest
+
+class TestSudokuGenerator(unittest.TestCase):
+    def setUp(self):
+        self.generator = SudokuGenerator(seed=7)
+
+    def test_complete_grid_is_valid(self):
+        grid = self.generator.complete_grid()
+        for i in range(9):
+            self.assertEqual(set(grid[i]), set(range(1, 10)))
+            self.assertEqual({grid[r][i] for r in range(9)}, set(range(1, 10)))
+
+    def test_generate_unique(self):
+        puzzle, solution = self.generator.generate()
+        self.assertEqual(self.generator.session.count_solutions(puzzle), 1)
+        self.assertEqual(self.generator.session.solve(puzzle), solution)
+
+    def test_generate_minimal(self):
+        puzzle, _ = self.generator.generate()
+        for row in range(9):
+            for col in range(9):
+                if puzzle[row][col]:
+                    reduced = [list(values) for values in puzzle]
+                    reduced[row][col] = 0
+                    self.assertEqual(self.generator.session.count_solutions(reduced), 2)
+
+    def test_generate_keeps_clues(self):
+        puzzle, _ = self.generator.generate(clues=36)
+        self.assertEqual(sum(1 for values in puzzle for value in values if value), 36)
+
+if __name__ == "__main__":
+    unittest.main()
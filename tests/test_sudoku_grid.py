@@ -0,0 +1,128 @@
+from apps.sudoku_grid import SudokuGrid, GIVEN, LOCKED, SELECTED_COLOR
+import unittest
+from unittest.mock import MagicMock
+
+class FakeCanvas:
+    """Records the items and configuration calls of a canvas and runs after_idle callbacks on flush()."""
+
+    def __init__(self):
+        self.items = {}
+        self.configured = 0
+        self.idle = []
+
+    def _create(self, kind, tags, **options):
+        item = len(self.items) + 1
+        self.items[item] = dict(options, kind=kind, tags=tags)
+        return item
+
+    def create_rectangle(self, *coords, tags=None, **options):
+        return self._create("rectangle", tags, **options)
+
+    def create_text(self, *coords, tags=None, **options):
+        return self._create("text", tags, **options)
+
+    def create_line(self, *coords, tags=None, **options):
+        return self._create("line", tags, **options)
+
+    def delete(self, tag):
+        self.items = {item: options for item, options in self.items.items() if options["tags"] != tag}
+
+    def itemconfigure(self, item, **options):
+        self.configured += 1
+        self.items[item].update(options)
+
+    def after_idle(self, callback):
+        self.idle.append(callback)
+        return len(self.idle)
+
+    def bind(self, sequence, callback):
+        pass
+
+    def focus_set(self):
+        pass
+
+    def flush(self):
+        callbacks, self.idle = self.idle, []
+        for callback in callbacks:
+            callback()
+
+def key(char="", keysym=""):
+    return MagicMock(char=char, keysym=keysym or char)
+
+class TestSudokuGrid(unittest.TestCase):
+    def setUp(self):
+        self.canvas = FakeCanvas()
+        self.changes = []
+        self.grid = SudokuGrid(self.canvas, 0, 0, 360, 3, on_change=lambda row, col: self.changes.append((row, col)))
+
+    def text(self, row, col):
+        return self.canvas.items[self.grid.texts[row][col]]["text"]
+
+    def test_item_count_stays_flat(self):
+        count = len(self.canvas.items)
+        self.assertEqual(count, 2 * 81 + 8)
+        for n in (4, 3, 4, 3):
+            self.grid.resize(n)
+        self.assertEqual(len(self.canvas.items), count)
+
+    def test_full_update_is_one_frame(self):
+        board = [[(row * 3 + row // 3 + col) % 9 + 1 for col in range(9)] for row in range(9)]
+        for row in range(9):
+            for col in range(9):
+                self.grid.set(row, col, board[row][col], LOCKED)
+        self.assertEqual(len(self.canvas.idle), 1)
+        self.canvas.flush()
+        self.assertEqual(self.grid.frames, 1)
+        self.assertEqual(self.grid.board(), board)
+        self.assertEqual(self.text(8, 8), str(board[8][8]))
+
+    def test_only_dirty_cells_are_redrawn(self):
+        self.canvas.flush()
+        configured = self.canvas.configured
+        self.grid.set(2, 3, 7)
+        self.grid.set_background(4, 4, "red")
+        self.canvas.flush()
+        self.assertEqual(self.canvas.configured - configured, 4)
+        self.assertEqual(self.canvas.items[self.grid.rects[4][4]]["fill"], "red")
+
+    def test_key_input(self):
+        self.grid.select(0, 0)
+        self.grid.key_pressed(key("0"))
+        self.grid.key_pressed(key("a"))
+        self.assertEqual(self.grid.get(0, 0), 0)
+        self.assertEqual(self.changes, [])
+
+        self.grid.key_pressed(key("5"))
+        self.assertEqual(self.grid.get(0, 0), 5)
+        self.grid.key_pressed(key("7"))
+        self.assertEqual(self.grid.get(0, 0), 7)
+        self.grid.key_pressed(key(keysym="BackSpace"))
+        self.assertEqual(self.grid.get(0, 0), 0)
+        self.assertEqual(self.changes, [(0, 0)] * 3)
+
+        self.grid.key_pressed(key(keysym="Left"))
+        self.assertEqual(self.grid.selected, (0, 8))
+        self.canvas.flush()
+        self.assertEqual(self.canvas.items[self.grid.rects[0][8]]["fill"], SELECTED_COLOR)
+
+    def test_multi_digit_input(self):
+        self.grid.resize(4)
+        self.grid.select(1, 1)
+        self.grid.key_pressed(key("1"))
+        self.grid.key_pressed(key("6"))
+        self.assertEqual(self.grid.get(1, 1), 16)
+        self.grid.key_pressed(key("3"))
+        self.assertEqual(self.grid.get(1, 1), 3)
+
+    def test_given_cells_are_read_only(self):
+        board = [[0] * 9 for _ in range(9)]
+        board[0][0] = 4
+        self.grid.load(board)
+        self.grid.select(0, 0)
+        self.grid.key_pressed(key(keysym="Delete"))
+        self.assertEqual(self.grid.get(0, 0), 4)
+        self.assertEqual(self.grid.kinds[0][0], GIVEN)
+        self.assertTrue(self.grid.is_editable(0, 1))
+
+if __name__ == "__main__":
+    unittest.main()
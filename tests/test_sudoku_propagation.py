@@ -0,0 +1,52 @@
+from apps.sudoku_propagation import PropagationSolver
+from apps.sudoku_engine import SudokuEngine, parse_board, format_board
+import unittest
+
+PUZZLE = "53..7....6..195....98....6.8...6...34..8.3..17...2...6.6....28....419..5....8..79"
+SOLUTION = "534678912672195348198342567859761423426853791713924856961537284287419635345286179"
+HARD = "8..........36......7..9.2...5...7.......457.....1...3...1....68..85...1..9....4.."
+
+class TestPropagationSolver(unittest.TestCase):
+    def setUp(self):
+        self.solver = PropagationSolver()
+
+    def test_solve(self):
+        self.assertEqual(format_board(self.solver.solve(parse_board(PUZZLE))), SOLUTION)
+
+    def test_solve_hard_matches_clingo(self):
+        board = parse_board(HARD)
+        self.assertEqual(self.solver.solve(board), SudokuEngine().solve(board, "session"))
+
+    def test_unsolvable(self):
+        board = parse_board(PUZZLE)
+        board[0][2] = 5
+        self.assertFalse(self.solver.is_solvable(board))
+        self.assertIsNone(self.solver.solve(board))
+
+    def test_count_solutions(self):
+        board = parse_board(PUZZLE)
+        self.assertEqual(self.solver.count_solutions(board), 1)
+        self.assertEqual(self.solver.count_solutions([[0] * 9 for _ in range(9)]), 2)
+
+    def test_empty_16x16(self):
+        solution = self.solver.solve([[0] * 16 for _ in range(16)])
+        for i in range(16):
+            self.assertEqual(set(solution[i]), set(range(1, 17)))
+            self.assertEqual({solution[r][i] for r in range(16)}, set(range(1, 17)))
+
+class TestEngineBackends(unittest.TestCase):
+    def test_auto_backend(self):
+        engine = SudokuEngine()
+        self.assertEqual(engine.select_backend(parse_board(PUZZLE)), "propagation")
+        self.assertEqual(engine.select_backend([[0] * 16 for _ in range(16)]), "session")
+        with self.assertRaises(ValueError):
+            engine.select_backend(parse_board(PUZZLE), "dlx")
+
+    def test_backends_agree(self):
+        engine = SudokuEngine()
+        board = parse_board(PUZZLE)
+        solutions = {backend: format_board(engine.solve(board, backend)) for backend in engine.BACKENDS}
+        self.assertEqual(set(solutions.values()), {SOLUTION})
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,63 @@
+from apps.tk_profiler import TkProfiler, handler_name, install_from_env
+from functools import partial
+import io
+import os
+import tempfile
+import time
+import tkinter
+import unittest
+
+class Handlers:
+    def clicked(self, event=None):
+        return event
+
+class TestTkProfiler(unittest.TestCase):
+    def test_handler_name(self):
+        self.assertEqual(handler_name(Handlers().clicked), "Handlers.clicked")
+        self.assertEqual(handler_name(partial(Handlers().clicked, 1)), "Handlers.clicked")
+
+    def test_wrap_records_calls(self):
+        log = io.StringIO()
+        profiler = TkProfiler(frame_budget=0.01, log=log)
+        fast = profiler.wrap(Handlers().clicked)
+        slow = profiler.wrap(lambda: time.sleep(0.02))
+        self.assertEqual(fast("event"), "event")
+        slow()
+        self.assertEqual(profiler.stats["Handlers.clicked"].calls, 1)
+        self.assertEqual(profiler.stats["Handlers.clicked"].slow, 0)
+        self.assertEqual(len(log.getvalue().splitlines()), 1)
+        self.assertIn("slow frame", log.getvalue())
+        report = io.StringIO()
+        profiler.report(report)
+        self.assertIn("Handlers.clicked", report.getvalue())
+
+    def test_exceptions_are_recorded_and_raised(self):
+        profiler = TkProfiler(log=io.StringIO())
+        with self.assertRaises(ZeroDivisionError):
+            profiler.wrap(lambda: 1 / 0)()
+        self.assertEqual(sum(stats.calls for stats in profiler.stats.values()), 1)
+
+    def test_keeps_slowest_dumps(self):
+        with tempfile.TemporaryDirectory() as directory:
+            profiler = TkProfiler(frame_budget=1, log=io.StringIO(), dump_dir=directory, top=2)
+            for delay in (0.001, 0.02, 0.005, 0.01):
+                profiler.wrap(partial(time.sleep, delay))()
+            self.assertEqual(len(os.listdir(directory)), 2)
+            self.assertEqual(sorted(round(elapsed, 2) for elapsed, _ in profiler.dumps), [0.01, 0.02])
+
+    def test_install_and_uninstall(self):
+        original = tkinter.Misc._register
+        profiler = TkProfiler()
+        profiler.install()
+        try:
+            self.assertIsNot(tkinter.Misc._register, original)
+        finally:
+            profiler.uninstall()
+        self.assertIs(tkinter.Misc._register, original)
+
+    def test_off_by_default(self):
+        self.assertIsNone(install_from_env({}))
+        self.assertIsNone(install_from_env({"TK_PROFILE": "0"}))
+
+if __name__ == "__main__":
+    unittest.main()
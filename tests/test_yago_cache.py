@@ -0,0 +1,107 @@
+from apps.yago_cache import YagoCache, load_cache
+from apps import sparql_app
+from unittest import mock
+import os
+import tempfile
+import time
+import unittest
+
+QUESTIONS = [{"text": "What is the capital of ?", "type": "yago:Sovereign_state", "property": "yago:capital"}]
+ENTITIES = ["http://yago-knowledge.org/resource/Sweden", "http://yago-knowledge.org/resource/Atlantis"]
+
+def fake_query(query):
+    if "?thing a yago:Sovereign_state" in query:
+        bindings = [{"thing": {"value": entity}} for entity in ENTITIES]
+    elif "yago:Sweden" in query:
+        bindings = [{"thing": {"value": "http://yago-knowledge.org/resource/Stockholm"}}]
+    else:
+        bindings = []
+    return {"results": {"bindings": bindings}}
+
+class TestYagoCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "cache", "yago.sqlite3")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_get_and_put(self):
+        cache = YagoCache(self.path)
+        self.assertIsNone(cache.get("missing"))
+        cache.put("key", ["a", "b"])
+        self.assertEqual(YagoCache(self.path).get("key"), ["a", "b"])
+        self.assertEqual(cache.size()[0], 1)
+
+    def test_expiry(self):
+        cache = YagoCache(self.path, ttl=0.05)
+        cache.put("key", 1)
+        time.sleep(0.1)
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.size(), (0, 0))
+
+    def test_size_cap_drops_least_recently_used(self):
+        cache = YagoCache(self.path, max_bytes=25)
+        cache.put("first", "x" * 8)
+        cache.put("second", "y" * 8)
+        time.sleep(0.01)
+        cache.get("first")
+        cache.put("third", "z" * 8)
+        self.assertEqual(cache.get("first"), "x" * 8)
+        self.assertIsNone(cache.get("second"))
+        self.assertLessEqual(cache.size()[1], 25)
+
+    def test_fetch(self):
+        cache = YagoCache(self.path)
+        fetch = mock.Mock(return_value=[])
+        self.assertEqual(cache.fetch("key", fetch), [])
+        self.assertEqual(cache.fetch("key", fetch), [])
+        fetch.assert_called_once()
+
+    def test_load_cache(self):
+        conf = os.path.join(self.directory.name, "conf.yaml")
+        with open(conf, "w", encoding="utf-8") as file:
+            file.write(f"yago_cache:\n  path: {self.path}\n  ttl_hours: 2\n  max_mb: 1\n")
+        cache = load_cache(conf)
+        self.assertEqual((cache.path, cache.ttl, cache.max_bytes), (self.path, 7200, 1024 * 1024))
+        cwd = os.getcwd()
+        os.chdir(self.directory.name)
+        try:
+            cache = load_cache("missing.yaml")
+        finally:
+            os.chdir(cwd)
+        self.assertEqual((cache.path, cache.ttl), ("cache/yago.sqlite3", 168 * 3600))
+
+class TestCachedAnswers(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = YagoCache(os.path.join(self.directory.name, "yago.sqlite3"))
+        patches = [mock.patch.object(sparql_app, "load_questions", return_value=QUESTIONS),
+                   mock.patch.object(sparql_app, "run_query", side_effect=fake_query)]
+        self.run_query = patches[1].start()
+        patches[0].start()
+        for patch in patches:
+            self.addCleanup(patch.stop)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_repeat_answers_are_cached(self):
+        answer = (["Stockholm"], "What is the capital of Sweden?")
+        for _ in range(10):
+            self.assertEqual(sparql_app.get_answer(self.cache), answer)
+        self.assertLessEqual(self.run_query.call_count, 1 + len(ENTITIES))
+        self.run_query.reset_mock()
+        for _ in range(10):
+            self.assertEqual(sparql_app.get_answer(self.cache), answer)
+        self.run_query.assert_not_called()
+
+    def test_warm_up_needs_no_network_afterwards(self):
+        pools = sparql_app.warm_up(self.cache, answers=5, seed=1)
+        self.assertEqual(pools, {QUESTIONS[0]["text"]: [ENTITIES[0]]})
+        self.run_query.reset_mock()
+        self.assertEqual(sparql_app.get_answer(self.cache), (["Stockholm"], "What is the capital of Sweden?"))
+        self.run_query.assert_not_called()
+
+if __name__ == "__main__":
+    unittest.main()